@@ -1,5 +1,6 @@
+import asyncio
 from abc import ABC, abstractmethod
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Sequence
 from typing import Any
 
 import pydantic
@@ -93,6 +94,47 @@ class AbstractExecutor(ABC):
 
         """
 
+    # Async counterparts. Executors backed by an async client should override them; the defaults
+    # only move the blocking call off the event loop.
+
+    async def agenerate_plan(self, prompt: Any, **kwargs) -> Workflow:
+        """Async version of `generate_plan`."""
+        return await asyncio.to_thread(self.generate_plan, prompt, **kwargs)
+
+    async def achat(self, prompt: Any, **kwargs) -> str:
+        """Async version of `chat`."""
+        return await asyncio.to_thread(self.chat, prompt, **kwargs)
+
+    async def aclassify_intent(self, prompt: Any, **kwargs) -> str:
+        """Async version of `classify_intent`."""
+        return await asyncio.to_thread(self.classify_intent, prompt, **kwargs)
+
+    async def areconfigure(self, prompt: Any, **kwargs) -> dict:
+        """Async version of `reconfigure`."""
+        return await asyncio.to_thread(self.reconfigure, prompt, **kwargs)
+
+    async def abatch_generate_plan(
+        self, prompt: Any, inputs: Sequence[dict[str, Any]], max_concurrency: int = 8
+    ) -> list[Workflow | Exception]:
+        """Generate plans for several inputs, at most `max_concurrency` at a time.
+
+        Args:
+            prompt: The prompt to use for planning
+            inputs: The keyword arguments of one `agenerate_plan` call per plan
+            max_concurrency: Maximum number of planning calls in flight
+
+        Returns:
+            The plans in input order; a failed call is returned as its exception
+
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def plan(kwargs: dict[str, Any]) -> Workflow:
+            async with semaphore:
+                return await self.agenerate_plan(prompt, **kwargs)
+
+        return await asyncio.gather(*[plan(dict(kwargs)) for kwargs in inputs], return_exceptions=True)
+
 
 class AbstractPromptBuilder(ABC):
     """Abstract interface for prompt building components."""
@@ -170,16 +212,17 @@ class AbstractWorkflowRunner(ABC):
 
         """
 
-    @classmethod
     @abstractmethod
-    def start_daemon(cls) -> None:
+    def start_daemon(self) -> None:
         """Start the workflow runner engine."""
 
-    @classmethod
     @abstractmethod
-    def stop_daemon(cls) -> None:
+    def stop_daemon(self) -> None:
         """Stop the workflow runner engine."""
 
+    def prefetch_tools(self, tools: Sequence[ToolModel]) -> None:  # noqa: B027
+        """Prepare the tools a plan may use before it runs. Runners without warm-up do nothing."""
+
     @abstractmethod
     def run_background_workflows(self, *args, **kwargs) -> None:
         """Run static workflows in the workflow runner engine."""
@@ -207,6 +250,7 @@ class AbstractAgent(ABC):
         goal: str,
         plan: Workflow | None = None,
         context: AbstractAgentInputModel | None = None,
+        coalesce: bool = True,
     ) -> AbstractAgentOutputModel:
         """Handle an incoming request.
 
@@ -214,12 +258,26 @@ class AbstractAgent(ABC):
             goal: The goal to achieve
             plan: An optional existing plan to use or modify
             context: An optional input schema for the agent
+            coalesce: Whether the request may share the result of an identical request in flight
 
         Returns:
             The result of achieving the goal
 
         """
 
+    @abstractmethod
+    def handle_batch(self, goals: Sequence[str], context: AbstractAgentInputModel | None = None) -> AsyncIterator[Any]:
+        """Handle several goals in one request.
+
+        Args:
+            goals: The goals to achieve
+            context: An optional input schema shared by all goals
+
+        Returns:
+            An async iterator over the per-goal results, in completion order
+
+        """
+
     @abstractmethod
     def get_most_relevant_agents(self, goal: str) -> list[AgentModel]:
         """Find the most relevant agents for a goal.
@@ -245,7 +303,7 @@ class AbstractAgent(ABC):
         """
 
     @abstractmethod
-    def generate_plan(
+    async def generate_plan(
         self, goal: str, agents: Sequence[AgentModel], tools: Sequence[ToolModel], plan: dict | None = None
     ) -> Workflow:
         """Generate a plan for achieving a goal.
@@ -262,7 +320,7 @@ class AbstractAgent(ABC):
         """
 
     @abstractmethod
-    def chat(
+    async def chat(
         self,
         user_prompt: str,
         **kwargs,
@@ -304,6 +362,9 @@ class AbstractAgent(ABC):
 
         """
 
+    async def aclose(self) -> None:  # noqa: B027
+        """Release the resources held by the agent; called when the replica shuts down."""
+
 
 class AbstractAgentP2PManager(ABC):
     """A manager for P2P communication between agents."""
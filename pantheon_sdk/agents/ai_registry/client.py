@@ -4,12 +4,19 @@ import httpx
 from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
 from pantheon_sdk.agents.ai_registry.config import AiRegistryConfig
+from pantheon_sdk.agents.http import PooledHttpClient
 
 
-class AiRegistryClient:
+class AiRegistryClient(PooledHttpClient):
     def __init__(self, config: AiRegistryConfig):
-        self.url = config.url
-        self.timeout = config.timeout
+        super().__init__(
+            url=config.url,
+            timeout=config.timeout,
+            http2=config.http2,
+            max_connections=config.max_connections,
+            max_keepalive_connections=config.max_keepalive_connections,
+            keepalive_expiry=config.keepalive_expiry,
+        )
         self.endpoints = config.endpoints
 
     @retry(
@@ -21,7 +28,7 @@ class AiRegistryClient:
         url = f"{self.url}{endpoint}"
 
         try:
-            response = httpx.post(url, json=json, timeout=self.timeout)
+            response = self.client.post(url, json=json)
             response.raise_for_status()
             return response.json()
         except httpx.HTTPStatusError as e:
@@ -12,6 +12,12 @@ class AiRegistryEndpoints(BaseSettings):
 class AiRegistryConfig(BaseSettings):
     url: str = pydantic.Field("localhost")
     timeout: int = pydantic.Field(10)
+
+    # Connection pool
+    http2: bool = pydantic.Field(False)  # requires the `h2` package (httpx[http2])
+    max_connections: int = pydantic.Field(100)
+    max_keepalive_connections: int = pydantic.Field(20)
+    keepalive_expiry: float = pydantic.Field(30.0)
     endpoints: AiRegistryEndpoints = AiRegistryEndpoints()
 
     model_config = SettingsConfigDict(
@@ -1,13 +1,24 @@
+import asyncio
+import json
+import weakref
 from contextlib import asynccontextmanager
-from typing import Any
+from typing import Annotated, Any
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Header, HTTPException, Query, Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 from ray.serve.deployment import Deployment
 
 from pantheon_sdk.agents import abc
 from pantheon_sdk.agents.card import card_builder
+from pantheon_sdk.agents.deadline import DEADLINE_HEADER, DeadlineExceededError, deadline_scope, parse_deadline
+from pantheon_sdk.agents.models import BatchRequest, ChatRequest
 from pantheon_sdk.agents.orchestration import workflow_builder
 from pantheon_sdk.agents.p2p import p2p_builder
+from pantheon_sdk.agents.utils import hash_payload
+
+# Agents created in this process (one per Serve replica), closed by the app's lifespan shutdown.
+_agents: weakref.WeakSet[abc.AbstractAgent] = weakref.WeakSet()
 
 
 def bootstrap_main(agent_cls: type[abc.AbstractAgent]) -> type[Deployment]:
@@ -17,6 +28,7 @@ def bootstrap_main(agent_cls: type[abc.AbstractAgent]) -> type[Deployment]:
     runner: abc.AbstractWorkflowRunner = workflow_builder()
     card: abc.AbstractAgentCard = card_builder()
     p2p: abc.AbstractAgentP2PManager = p2p_builder()
+    card_etag = f'"{hash_payload(card.model_dump(mode="json", by_alias=True))}"'
 
     @asynccontextmanager
     async def lifespan(app: FastAPI):
@@ -26,16 +38,33 @@ def bootstrap_main(agent_cls: type[abc.AbstractAgent]) -> type[Deployment]:
 
         await p2p.start()
         yield
-        runner.stop_daemon()
+        # Draining background workflows blocks, keep it off the event loop.
+        await asyncio.to_thread(runner.stop_daemon)
 
         await p2p.shutdown()
-        # handle clean up
+        for agent in list(_agents):
+            await agent.aclose()
 
     app = FastAPI(lifespan=lifespan)
 
     @serve.deployment
     @serve.ingress(app)
     class Agent(agent_cls):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            _agents.add(self)
+
+            async def load_chat_session(session_uuid: str) -> str:
+                # Chat sessions are "models" to Serve: once a replica has loaded one, requests with the
+                # session id in the `serve_multiplexed_model_id` header are routed to that replica.
+                await asyncio.to_thread(self.get_chat_context, session_uuid)
+                return session_uuid
+
+            # Built per agent, so the number of sessions follows the config the agent is bound with.
+            self.chat_session = serve.multiplexed(max_num_models_per_replica=self.config.chat_session_cache_size)(
+                load_chat_session
+            )
+
         @property
         def workflow_runner(self):
             return runner
@@ -45,15 +74,75 @@ def bootstrap_main(agent_cls: type[abc.AbstractAgent]) -> type[Deployment]:
             return card
 
         @app.get("/card")
-        async def get_card(self):
+        async def get_card(self, request: Request, response: Response):
+            if request.headers.get("if-none-match") == card_etag:
+                return Response(status_code=304, headers={"ETag": card_etag})
+            response.headers["ETag"] = card_etag
             return self.agent_card
 
         @app.get("/workflows")
-        async def list_workflows(self, status: str | None = None):
-            return await self.workflow_runner.list_workflows(status)
+        async def list_workflows(
+            self,
+            status: str | None = None,
+            agent: str | None = None,
+            plan_hash: str | None = None,
+            limit: Annotated[int, Query(ge=1, le=500)] = 50,
+            cursor: str | None = None,
+        ):
+            try:
+                return await self.workflow_runner.list_workflows(
+                    status=status, agent=agent, plan_hash=plan_hash, limit=limit, cursor=cursor
+                )
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e)) from e
+
+        # Registered before `/{goal}`, which would otherwise match them.
+        @app.post("/chat")
+        async def handle_chat(self, request: ChatRequest):
+            session_uuid = serve.get_multiplexed_model_id() or request.session_uuid
+            if session_uuid and self.config.chat_session_affinity:
+                await self.chat_session(session_uuid)
+            return await self.chat(request.message, request.action, session_uuid)
+
+        @app.post("/batch")
+        async def handle_batch(
+            self,
+            request: BatchRequest,
+            deadline: Annotated[str | None, Header(alias=DEADLINE_HEADER)] = None,
+        ):
+            """Stream one JSON line per distinct goal as its result becomes available."""
+            if len(request.goals) > self.config.batch_max_goals:
+                raise HTTPException(status_code=413, detail=f"At most {self.config.batch_max_goals} goals per batch")
+            try:
+                request_deadline = parse_deadline(deadline)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e)) from e
+
+            async def lines():
+                # The response body is produced in its own task, so the deadline is set here.
+                with deadline_scope(request_deadline):
+                    async for item in super(Agent, self).handle_batch(request.goals, request.context):
+                        yield json.dumps(jsonable_encoder(item)) + "\n"
+
+            return StreamingResponse(lines(), media_type="application/x-ndjson")
 
         @app.post("/{goal}")
-        async def handle(self, goal: str, plan: dict | None = None, context: Any = None):
-            return await super().handle(goal, plan, context)
+        async def handle(
+            self,
+            goal: str,
+            plan: dict | None = None,
+            context: Any = None,
+            coalesce: bool = True,
+            deadline: Annotated[str | None, Header(alias=DEADLINE_HEADER)] = None,
+        ):
+            try:
+                request_deadline = parse_deadline(deadline)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e)) from e
+            try:
+                with deadline_scope(request_deadline):
+                    return await super().handle(goal, plan, context, coalesce=coalesce)
+            except DeadlineExceededError as e:
+                raise HTTPException(status_code=504, detail=str(e)) from e
 
     return Agent
@@ -0,0 +1,131 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any, Generic, TypeVar
+
+from loguru import logger
+
+V = TypeVar("V")
+
+_MISSING = object()
+
+
+class TTLCache(Generic[V]):
+    """Thread-safe, size-bounded LRU cache with optional per-entry expiry.
+
+    Expired entries are not returned by `get`, but are kept until evicted so callers can still
+    `get_stale` them, e.g. to revalidate with the origin instead of refetching from scratch.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float | None = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[V, float | None]] = OrderedDict()
+        self._lock = threading.RLock()
+
+    def __getstate__(self) -> object:
+        odict = self.__dict__.copy()
+        del odict["_lock"]
+        return odict
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def get(self, key: Hashable, default: Any = None) -> V | Any:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            value, expires_at = item
+            if expires_at is not None and expires_at <= time.monotonic():
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def get_stale(self, key: Hashable, default: Any = None) -> V | Any:
+        """Return the entry for `key` even if it has already expired."""
+        with self._lock:
+            item = self._data.get(key)
+            return default if item is None else item[0]
+
+    def set(self, key: Hashable, value: V, ttl: float | None = None) -> None:
+        """Store `value`, expiring after `ttl` seconds (the cache default if not given)."""
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def items(self) -> list[tuple[Hashable, V]]:
+        """Snapshot of the entries that have not expired yet."""
+        now = time.monotonic()
+        with self._lock:
+            return [
+                (key, value)
+                for key, (value, expires_at) in self._data.items()
+                if expires_at is None or expires_at > now
+            ]
+
+    def pop(self, key: Hashable, default: Any = None) -> V | Any:
+        with self._lock:
+            item = self._data.pop(key, None)
+            return default if item is None else item[0]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+class RedisCache:
+    """Shared cache tier on top of Redis.
+
+    Values are strings (callers serialize). Connection or command errors are logged and treated
+    as a miss, so an unavailable Redis only costs the shared tier, never the request.
+    """
+
+    def __init__(self, url: str, prefix: str = "", ttl: float | None = None):
+        self.url = url
+        self.prefix = prefix
+        self.ttl = ttl
+        self._client: Any = None
+
+    def __getstate__(self) -> object:
+        odict = self.__dict__.copy()
+        del odict["_client"]
+        return odict
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._client = None
+
+    @property
+    def client(self) -> Any:
+        if self._client is None:
+            import redis
+
+            self._client = redis.Redis.from_url(self.url, decode_responses=True)
+        return self._client
+
+    def get(self, key: str) -> str | None:
+        try:
+            return self.client.get(f"{self.prefix}{key}")
+        except Exception as e:
+            logger.warning(f"Redis cache read failed for key {key}: {e}")
+            return None
+
+    def set(self, key: str, value: str, ttl: float | None = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        try:
+            self.client.set(f"{self.prefix}{key}", value, ex=int(ttl) if ttl else None)
+        except Exception as e:
+            logger.warning(f"Redis cache write failed for key {key}: {e}")
@@ -0,0 +1,77 @@
+import hashlib
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin
+
+from loguru import logger
+from pydantic import BaseModel
+
+from pantheon_sdk.agents.cache import TTLCache
+from pantheon_sdk.agents.card.config import CardCacheConfig
+from pantheon_sdk.agents.card.models import AgentCard
+from pantheon_sdk.agents.http import PooledHttpClient
+
+
+class CachedCard(BaseModel):
+    card: AgentCard | None = None  # None marks an unreachable agent (negative entry)
+    etag: str | None = None
+    content_hash: str | None = None
+
+
+class AgentCardCache(PooledHttpClient):
+    """Per-replica cache of remote agent cards keyed by agent endpoint.
+
+    Fresh entries are served without any network call. Expired entries are revalidated with
+    `If-None-Match`; a `304` or an unchanged body reuses the already validated card instead of
+    parsing it again. Unreachable agents are remembered for `negative_ttl` seconds.
+    """
+
+    def __init__(self, config: CardCacheConfig):
+        super().__init__(url="", timeout=config.timeout)
+        self.config = config
+        self._cards: TTLCache[CachedCard] = TTLCache(maxsize=config.max_size, ttl=config.ttl)
+
+    def get_cards(self, endpoints: Sequence[str]) -> dict[str, AgentCard | None]:
+        """Return the card for every endpoint, fetching cache misses in parallel."""
+        cards: dict[str, AgentCard | None] = {}
+        misses = []
+        for endpoint in dict.fromkeys(endpoints):
+            entry = self._cards.get(endpoint)
+            if entry is None:
+                misses.append(endpoint)
+            else:
+                cards[endpoint] = entry.card
+
+        if misses:
+            with ThreadPoolExecutor(max_workers=min(len(misses), self.config.max_parallel_fetches)) as pool:
+                cards.update(zip(misses, pool.map(self._fetch, misses), strict=True))
+
+        return cards
+
+    def invalidate(self, endpoint: str) -> None:
+        self._cards.pop(endpoint)
+
+    def _fetch(self, endpoint: str) -> AgentCard | None:
+        card_url = urljoin(endpoint, "/card")
+        stale = self._cards.get_stale(endpoint)
+        headers = {"If-None-Match": stale.etag} if stale and stale.card and stale.etag else {}
+
+        try:
+            resp = self.client.get(card_url, headers=headers)
+            if resp.status_code == 304 and headers:
+                self._cards.set(endpoint, stale)
+                return stale.card
+            resp.raise_for_status()
+
+            content_hash = hashlib.sha256(resp.content).hexdigest()
+            if stale and stale.card and stale.content_hash == content_hash:
+                card = stale.card
+            else:
+                card = AgentCard(**resp.json())
+        except Exception as e:
+            logger.warning(f"Failed to fetch card from agent at {card_url}: {e}")
+            self._cards.set(endpoint, CachedCard(), ttl=self.config.negative_ttl)
+            return None
+
+        self._cards.set(endpoint, CachedCard(card=card, etag=resp.headers.get("ETag"), content_hash=content_hash))
+        return card
@@ -20,3 +20,23 @@ class CardConfig(BaseSettings):
 @lru_cache
 def get_card_config() -> CardConfig:
     return CardConfig()
+
+
+class CardCacheConfig(BaseSettings):
+    ttl: float = 300.0
+    negative_ttl: float = 30.0
+    max_size: int = 1024
+    timeout: float = 5.0
+    max_parallel_fetches: int = 8
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_prefix="AGENT_CARD_CACHE_",
+        env_file_encoding="utf-8",
+        extra=pydantic.Extra.ignore,
+    )
+
+
+@lru_cache
+def get_card_cache_config() -> CardCacheConfig:
+    return CardCacheConfig()
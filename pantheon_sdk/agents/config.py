@@ -1,5 +1,6 @@
 import json
 from functools import lru_cache
+from typing import Literal
 
 import pydantic
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -16,6 +17,42 @@ class BasicAgentConfig(BaseSettings):
     agent_p2p_listen_addr: str = pydantic.Field("/ip4/0.0.0.0/tcp/0")
     agent_name: str = pydantic.Field("base-agent")
 
+    # Context gathering timeouts (seconds)
+    context_insights_timeout: float = pydantic.Field(5.0)
+    context_past_interactions_timeout: float = pydantic.Field(5.0)
+    context_agents_timeout: float = pydantic.Field(5.0)
+    context_tools_timeout: float = pydantic.Field(10.0)
+
+    # Past interactions given to the planner: "exact" reads the full records stored for the identical goal
+    # string, "semantic" retrieves summaries of the stored interactions closest to the goal. The modes store
+    # different records, so interactions stored in one mode are not seen in the other.
+    past_interactions_mode: Literal["semantic", "exact"] = pydantic.Field("exact")
+    past_interactions_top_k: int = pydantic.Field(5)
+    past_interactions_max_distance: float | None = pydantic.Field(0.3)  # cosine distance, None keeps all top-k
+    past_interactions_only_successful: bool = pydantic.Field(True)
+    past_interactions_outcome_chars: int = pydantic.Field(500)  # characters of the result kept per interaction
+
+    # Upper bound for a whole request (seconds); callers can set an earlier deadline with the
+    # X-Pantheon-Deadline header
+    request_timeout: float | None = pydantic.Field(None)
+
+    # Chat messages loaded as context for each turn
+    chat_history_window: int = pydantic.Field(50)
+    # Replica-local cache of recent chat messages, written through on every turn
+    chat_session_cache_size: int = pydantic.Field(1024)  # sessions per replica
+    chat_session_cache_ttl: float | None = pydantic.Field(300.0)  # seconds since the session's last turn
+    # Route `POST /chat` requests carrying the `serve_multiplexed_model_id` header (set to the session
+    # id) to the replica that already holds the session
+    chat_session_affinity: bool = pydantic.Field(True)
+
+    # Concurrent identical requests (same goal, plan and context) share one computation
+    request_coalescing_enabled: bool = pydantic.Field(True)
+
+    # Batch goal submission (`POST /batch`)
+    batch_max_goals: int = pydantic.Field(10_000)  # goals accepted per request
+    batch_chunk_size: int = pydantic.Field(32)  # goals whose context and plans are gathered together
+    batch_max_concurrency: int = pydantic.Field(16)  # planning calls and workflows in flight
+
     model_config = SettingsConfigDict(env_file=".env", env_prefix="", extra="ignore")
 
     def __str__(self) -> str:
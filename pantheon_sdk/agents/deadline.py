@@ -0,0 +1,86 @@
+"""Request deadlines.
+
+A deadline is an absolute unix timestamp. It is taken from the `X-Pantheon-Deadline` request
+header (or the agent's `request_timeout`), kept in a context variable for the request, bounds the
+workflow and step timeouts, and is forwarded to handed-off agents in the same header. Tools running
+in-process read it with `get_deadline()`; tools on pooled workers see it in the `PANTHEON_DEADLINE`
+environment variable.
+"""
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+DEADLINE_HEADER = "X-Pantheon-Deadline"
+DEADLINE_ENV_VAR = "PANTHEON_DEADLINE"
+
+_deadline: ContextVar[float | None] = ContextVar("pantheon_deadline", default=None)
+
+
+class DeadlineExceededError(TimeoutError):
+    """The request deadline passed before the work finished."""
+
+
+def parse_deadline(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError as e:
+        raise ValueError(f"Invalid {DEADLINE_HEADER} header: {value!r}") from e
+
+
+def get_deadline() -> float | None:
+    return _deadline.get()
+
+
+def earliest(*deadlines: float | None) -> float | None:
+    known = [deadline for deadline in deadlines if deadline is not None]
+    return min(known) if known else None
+
+
+@contextmanager
+def deadline_scope(deadline: float | None) -> Iterator[float | None]:
+    """Set the deadline for the current context; an enclosing earlier deadline is kept."""
+    effective = earliest(deadline, _deadline.get())
+    token = _deadline.set(effective)
+    try:
+        yield effective
+    finally:
+        _deadline.reset(token)
+
+
+@contextmanager
+def without_deadline() -> Iterator[None]:
+    """Clear the deadline for the current context, e.g. for work shared by requests with different deadlines."""
+    token = _deadline.set(None)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def deadline_passed(deadline: float | None) -> bool:
+    return deadline is not None and time.time() >= deadline
+
+
+def time_left(deadline: float | None = None, timeout: float | None = None) -> float | None:
+    """Seconds until the deadline (the current one by default), capped at `timeout`.
+
+    Returns None when there is neither a deadline nor a timeout. Raises `DeadlineExceededError`
+    when the deadline has already passed.
+    """
+    deadline = get_deadline() if deadline is None else deadline
+    if deadline is None:
+        return timeout
+
+    remaining = deadline - time.time()
+    if remaining <= 0:
+        raise DeadlineExceededError("Request deadline exceeded")
+    return remaining if timeout is None else min(remaining, timeout)
+
+
+def deadline_headers(deadline: float | None = None) -> dict[str, str]:
+    deadline = get_deadline() if deadline is None else deadline
+    return {DEADLINE_HEADER: repr(deadline)} if deadline is not None else {}
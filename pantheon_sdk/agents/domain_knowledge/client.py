@@ -4,6 +4,7 @@ import httpx
 from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
 from pantheon_sdk.agents.domain_knowledge.config import LightRagConfig, retries
+from pantheon_sdk.agents.http import PooledHttpClient
 
 # ------  Retries --------- #
 stop = stop_after_attempt(retries.stop_attempts)
@@ -14,10 +15,16 @@ wait = wait_exponential(
 )
 
 
-class LightRagClient:
+class LightRagClient(PooledHttpClient):
     def __init__(self, config: LightRagConfig):
-        self.url = config.url
-        self.timeout = config.timeout
+        super().__init__(
+            url=config.url,
+            timeout=config.timeout,
+            http2=config.http2,
+            max_connections=config.max_connections,
+            max_keepalive_connections=config.max_keepalive_connections,
+            keepalive_expiry=config.keepalive_expiry,
+        )
         self.endpoints = config.endpoints
 
     @retry(
@@ -29,7 +36,7 @@ class LightRagClient:
         url = f"{self.url}{endpoint}"
 
         try:
-            response = httpx.post(url, json=json, timeout=self.timeout)
+            response = self.client.post(url, json=json)
             response.raise_for_status()
             return response.json()
         except httpx.HTTPStatusError as e:
@@ -50,7 +57,7 @@ class LightRagClient:
         url = f"{self.url}{endpoint}"
 
         try:
-            response = httpx.get(url, params=params, timeout=self.timeout)
+            response = self.client.get(url, params=params)
             response.raise_for_status()
             return response.json()
         except httpx.HTTPStatusError as e:
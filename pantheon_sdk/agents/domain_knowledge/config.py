@@ -19,6 +19,12 @@ class Retries(BaseSettings):
 class LightRagConfig(BaseSettings):
     url: str = pydantic.Field("localhost")
     timeout: int = pydantic.Field(10)
+
+    # Connection pool
+    http2: bool = pydantic.Field(False)  # requires the `h2` package (httpx[http2])
+    max_connections: int = pydantic.Field(100)
+    max_keepalive_connections: int = pydantic.Field(20)
+    keepalive_expiry: float = pydantic.Field(30.0)
     endpoints: KnowledgeBaseEndpoints = KnowledgeBaseEndpoints()
 
     model_config = SettingsConfigDict(
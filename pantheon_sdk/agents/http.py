@@ -0,0 +1,62 @@
+import importlib.util
+import threading
+from typing import Any
+
+import httpx
+
+
+class PooledHttpClient:
+    """Base class for service clients that keep a long-lived HTTP connection pool.
+
+    The pool is created lazily on first use, so the client can be built (and pickled) before it
+    reaches the process that actually talks to the service.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        timeout: float,
+        http2: bool = False,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+    ):
+        if http2 and importlib.util.find_spec("h2") is None:
+            raise ValueError("http2 requires the `h2` package, install httpx[http2]")
+        self.url = url
+        self.timeout = timeout
+        self.http2 = http2
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._client: httpx.Client | None = None
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> object:
+        odict = self.__dict__.copy()
+
+        for k in ["_client", "_lock"]:
+            del odict[k]
+
+        return odict
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._client = None
+        self._lock = threading.Lock()
+
+    @property
+    def client(self) -> httpx.Client:
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    self._client = httpx.Client(timeout=self.timeout, limits=self.limits, http2=self.http2)
+        return self._client
+
+    def close(self) -> None:
+        """Close the connection pool."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
@@ -1,10 +1,26 @@
+import asyncio
+import threading
+from collections.abc import Sequence
+from typing import Any
+
 from langchain_core.output_parsers import JsonOutputParser, StrOutputParser
 from langchain_core.prompts import PromptTemplate
+from langchain_core.runnables import Runnable
 from langchain_openai import ChatOpenAI
 
 from pantheon_sdk.agents.abc import AbstractChatResponse, AbstractExecutor
 from pantheon_sdk.agents.langchain.config import BasicLangChainConfig, LangChainConfigWithLangfuse
+from pantheon_sdk.agents.models import InteractionSummaryModel, Workflow
 from pantheon_sdk.agents.prompt.parser import AgentOutputPlanParser
+from pantheon_sdk.agents.utils import hash_payload
+
+
+def render_past_interactions(interactions: Sequence[Any] | None) -> str:
+    """Render the interaction summaries for the planner prompt; anything else is left out of it."""
+    summaries = [interaction for interaction in interactions or [] if isinstance(interaction, InteractionSummaryModel)]
+    if not summaries:
+        return "None"
+    return "\n".join(summary.render() for summary in summaries)
 
 
 class ChatResponse(AbstractChatResponse):
@@ -12,12 +28,45 @@ class ChatResponse(AbstractChatResponse):
 
 
 class LangChainExecutor(AbstractExecutor):
+    """LangChain based executor.
+
+    The provider client and the `llm | parser` chain tails are built once per config and shared by all
+    calls, so the provider's HTTP connection pool stays warm. Call `configure` to swap the config;
+    the clients are rebuilt lazily on the next call.
+    """
+
     def __init__(self, config: BasicLangChainConfig | LangChainConfigWithLangfuse):
-        self.config = config
+        self._lock = threading.Lock()
+        self.configure(config)
+
+    def __getstate__(self) -> object:
+        odict = self.__dict__.copy()
+
+        for k in ["_lock", "_llm", "_text_chain", "_json_chain"]:
+            del odict[k]
+
+        return odict
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+        self._reset_clients()
 
-        self._callbacks = []
-        if self.config.langfuse_enabled:
-            self._init_langfuse_callback()
+    def configure(self, config: BasicLangChainConfig | LangChainConfigWithLangfuse) -> None:
+        """Use a new config and drop the clients built for the previous one."""
+        with self._lock:
+            self.config = config
+
+            self._callbacks = []
+            if self.config.langfuse_enabled:
+                self._init_langfuse_callback()
+
+            self._reset_clients()
+
+    def _reset_clients(self) -> None:
+        self._llm: ChatOpenAI | None = None
+        self._text_chain: Runnable | None = None
+        self._json_chain: Runnable | None = None
 
     def _init_langfuse_callback(self):
         from langfuse.callback import CallbackHandler
@@ -30,8 +79,28 @@ class LangChainExecutor(AbstractExecutor):
             )
         )
 
-    def generate_plan(self, prompt: PromptTemplate, **kwargs) -> str:
-        agent = ChatOpenAI(callbacks=self._callbacks, model=self.config.openai_api_model)
+    @property
+    def llm(self) -> ChatOpenAI:
+        if self._llm is None:
+            with self._lock:
+                if self._llm is None:
+                    self._llm = ChatOpenAI(callbacks=self._callbacks, model=self.config.openai_api_model)
+        return self._llm
+
+    @property
+    def text_chain(self) -> Runnable:
+        if self._text_chain is None:
+            self._text_chain = self.llm | StrOutputParser()
+        return self._text_chain
+
+    @property
+    def json_chain(self) -> Runnable:
+        if self._json_chain is None:
+            self._json_chain = self.llm | JsonOutputParser()
+        return self._json_chain
+
+    def _plan_chain(self, prompt: PromptTemplate, kwargs: dict[str, Any]) -> Runnable:
+        agent = self.llm
         output_parser = StrOutputParser()
         if "available_functions" in kwargs:
             agent.bind_tools(tools=[tool.openai_function_spec for tool in kwargs["available_functions"]])
@@ -40,29 +109,77 @@ class LangChainExecutor(AbstractExecutor):
         kwargs["available_functions"] = "\n".join(
             [tool.render_function_spec() for tool in kwargs["available_functions"]]
         )
+        kwargs["past_interactions"] = render_past_interactions(kwargs.get("past_interactions"))
 
-        chain = prompt | agent | output_parser
+        return prompt | agent | output_parser
 
+    def generate_plan(self, prompt: PromptTemplate, **kwargs) -> str:
+        chain = self._plan_chain(prompt, kwargs)
         return chain.invoke(input=kwargs)
 
     def chat(self, prompt: PromptTemplate, **kwargs) -> str:
-        agent = ChatOpenAI(callbacks=self._callbacks, model=self.config.openai_api_model)
-        output_parser = StrOutputParser()
-        chain = prompt | agent | output_parser
+        chain = prompt | self.text_chain
         return chain.invoke(input=kwargs)
 
     def classify_intent(self, prompt: PromptTemplate, **kwargs) -> str:
-        agent = ChatOpenAI(callbacks=self._callbacks, model=self.config.openai_api_model)
-        output_parser = StrOutputParser()
-        chain = prompt | agent | output_parser
+        chain = prompt | self.text_chain
         return chain.invoke(input=kwargs)
 
     def reconfigure(self, prompt: PromptTemplate, **kwargs) -> dict:
-        agent = ChatOpenAI(callbacks=self._callbacks, model=self.config.openai_api_model)
-        output_parser = JsonOutputParser()
-        chain = prompt | agent | output_parser
+        chain = prompt | self.json_chain
         return chain.invoke(input=kwargs)
 
+    async def agenerate_plan(self, prompt: PromptTemplate, **kwargs) -> str:
+        chain = self._plan_chain(prompt, kwargs)
+        return await chain.ainvoke(input=kwargs)
+
+    async def achat(self, prompt: PromptTemplate, **kwargs) -> str:
+        chain = prompt | self.text_chain
+        return await chain.ainvoke(input=kwargs)
+
+    async def aclassify_intent(self, prompt: PromptTemplate, **kwargs) -> str:
+        chain = prompt | self.text_chain
+        return await chain.ainvoke(input=kwargs)
+
+    async def areconfigure(self, prompt: PromptTemplate, **kwargs) -> dict:
+        chain = prompt | self.json_chain
+        return await chain.ainvoke(input=kwargs)
+
+    async def abatch_generate_plan(
+        self, prompt: PromptTemplate, inputs: Sequence[dict[str, Any]], max_concurrency: int = 8
+    ) -> list[Workflow | Exception]:
+        # Inputs offering the same tools share one chain, built once per group. Tools are compared in
+        # full: handoff tools share a package but differ in their target agent, so most groups hold a
+        # single goal and the concurrency limit is shared by all of them.
+        groups: dict[str, list[int]] = {}
+        for i, kwargs in enumerate(inputs):
+            tools = hash_payload([tool.model_dump(mode="json") for tool in kwargs.get("available_functions", [])])
+            groups.setdefault(tools, []).append(i)
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def plan(chain: Runnable, kwargs: dict[str, Any]) -> Any:
+            async with semaphore:
+                return await chain.ainvoke(kwargs)
+
+        calls, order = [], []
+        for indices in groups.values():
+            first = dict(inputs[indices[0]])
+            chain = self._plan_chain(prompt, first)
+            for i in indices:
+                kwargs = {
+                    **inputs[i],
+                    "available_functions": first["available_functions"],
+                    "past_interactions": render_past_interactions(inputs[i].get("past_interactions")),
+                }
+                calls.append(plan(chain, kwargs))
+                order.append(i)
+
+        plans: list[Any] = [None] * len(inputs)
+        for i, result in zip(order, await asyncio.gather(*calls, return_exceptions=True), strict=True):
+            plans[i] = result
+        return plans
+
 
 def agent_executor(config: BasicLangChainConfig | LangChainConfigWithLangfuse):
     return LangChainExecutor(config=config)
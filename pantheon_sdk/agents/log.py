@@ -0,0 +1,107 @@
+"""Logging of events carrying large payloads (plans, results, chat messages).
+
+`log_event` formats nothing unless a sink accepts the record's level. When it does, each payload is
+rendered with bounded effort: strings are cut at `LOG_PAYLOAD_MAX_CHARS` characters, containers and
+pydantic models after `LOG_PAYLOAD_MAX_ITEMS` items or fields, and nesting after a few levels, so
+logging a large result or plan costs about the same as logging a small one. Other objects are
+rendered with their own `repr` and then cut.
+Frequent events can be sampled per event name with `LOG_SAMPLE_RATES` (e.g.
+`{"memory.store": 0.01}`).
+
+With `LOG_FULL_PAYLOADS=true`, every logged event is followed by a DEBUG record holding its
+complete payloads, for sinks that accept DEBUG.
+"""
+
+import random
+import reprlib
+from functools import lru_cache
+from typing import Any
+
+import pydantic
+from loguru import logger
+from pydantic import BaseModel
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class LogConfig(BaseSettings):
+    payload_max_chars: int = 500  # per payload
+    payload_max_items: int = 10  # per container level
+    sample_rates: dict[str, float] = {}  # event name -> fraction of events logged
+    default_sample_rate: float = 1.0
+    full_payloads: bool = False
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_prefix="LOG_",
+        env_file_encoding="utf-8",
+        extra=pydantic.Extra.ignore,
+    )
+
+
+@lru_cache
+def get_log_config() -> LogConfig:
+    return LogConfig()
+
+
+class _PayloadRepr(reprlib.Repr):
+    def repr_instance(self, x: Any, level: int) -> str:
+        """Render pydantic models field by field, within the limits applied to dicts."""
+        if not isinstance(x, BaseModel):
+            return super().repr_instance(x, level)
+        name = type(x).__name__
+        if level <= 0:
+            return f"{name}(...)"
+        pieces = []
+        for i, field in enumerate(type(x).model_fields):
+            if i >= self.maxdict:
+                pieces.append("...")
+                break
+            pieces.append(f"{field}={self.repr1(getattr(x, field), level - 1)}")
+        return f"{name}({', '.join(pieces)})"
+
+
+@lru_cache
+def _repr(max_chars: int, max_items: int) -> reprlib.Repr:
+    r = _PayloadRepr()
+    r.maxstring = r.maxother = max_chars
+    r.maxlist = r.maxtuple = r.maxdict = r.maxset = r.maxfrozenset = r.maxdeque = r.maxarray = max_items
+    r.maxlevel = 4
+    return r
+
+
+def truncate(value: Any, max_chars: int | None = None, max_items: int | None = None) -> str:
+    """Render `value` in at most about `max_chars` characters without rendering it in full."""
+    config = get_log_config()
+    max_chars = config.payload_max_chars if max_chars is None else max_chars
+    max_items = config.payload_max_items if max_items is None else max_items
+
+    text = value if isinstance(value, str) else _repr(max_chars, max_items).repr(value)
+    if len(text) <= max_chars:
+        return text
+    return f"{text[:max_chars]}... ({len(text) - max_chars} more chars)"
+
+
+def _format(event: str, message: str, payloads: dict[str, Any], full: bool = False) -> str:
+    rendered = (f"{key}={repr(value) if full else truncate(value)}" for key, value in payloads.items())
+    return " ".join([f"[{event}]", message, *rendered])
+
+
+def sampled(event: str, sample_rate: float | None = None) -> bool:
+    """Decide whether this occurrence of the event is logged."""
+    if sample_rate is None:
+        config = get_log_config()
+        sample_rate = config.sample_rates.get(event, config.default_sample_rate)
+    return sample_rate >= 1 or random.random() < sample_rate
+
+
+def log_event(
+    event: str, message: str, *, level: str = "INFO", sample_rate: float | None = None, **payloads: Any
+) -> None:
+    """Log `message` with the given payloads, truncated; the event name is bound as `extra["event"]`."""
+    if not sampled(event, sample_rate):
+        return
+
+    event_logger = logger.opt(lazy=True, depth=1).bind(event=event)
+    event_logger.log(level, "{}", lambda: _format(event, message, payloads))
+    if payloads and get_log_config().full_payloads:
+        event_logger.log("DEBUG", "{}", lambda: _format(event, "full payloads", payloads, full=True))
@@ -0,0 +1,99 @@
+"""Append-only chat session log.
+
+Each session is a Redis list of JSON messages plus an offset counting the messages trimmed from its
+head. A message's index is its position in the whole session (`offset + position in the list`), so
+indexes keep increasing even after old messages are trimmed. Appending is one `RPUSH` (and an
+`LTRIM` once the session exceeds `max_messages`), and reading the last N messages is one
+`LRANGE`, whatever the length of the session.
+"""
+
+import json
+from collections.abc import Sequence
+from typing import Any
+
+# Appends the messages, trims the list to ARGV[1] entries (0 keeps everything) and refreshes the TTL
+# (ARGV[2] seconds, 0 for none). Returns the index of the first appended message.
+APPEND_SCRIPT = """
+local length = redis.call('RPUSH', KEYS[1], unpack(ARGV, 3))
+local offset = tonumber(redis.call('GET', KEYS[2]) or '0')
+local max_messages = tonumber(ARGV[1])
+if max_messages > 0 and length > max_messages then
+    redis.call('LTRIM', KEYS[1], length - max_messages, -1)
+    offset = redis.call('INCRBY', KEYS[2], length - max_messages)
+    length = max_messages
+end
+local ttl = tonumber(ARGV[2])
+if ttl > 0 then
+    redis.call('EXPIRE', KEYS[1], ttl)
+    redis.call('EXPIRE', KEYS[2], ttl)
+end
+return offset + length - (#ARGV - 2)
+"""
+
+
+class ChatLog:
+    def __init__(self, url: str, prefix: str = "pantheon:chat:", max_messages: int = 1000, ttl: int | None = None):
+        self.url = url
+        self.prefix = prefix
+        self.max_messages = max_messages
+        self.ttl = ttl
+        self._client: Any = None
+        self._append: Any = None
+
+    def __getstate__(self) -> object:
+        odict = self.__dict__.copy()
+        del odict["_client"]
+        del odict["_append"]
+        return odict
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._client = None
+        self._append = None
+
+    @property
+    def client(self) -> Any:
+        if self._client is None:
+            import redis
+
+            self._client = redis.Redis.from_url(self.url, decode_responses=True)
+        return self._client
+
+    @property
+    def append_script(self) -> Any:
+        if self._append is None:
+            self._append = self.client.register_script(APPEND_SCRIPT)
+        return self._append
+
+    def _keys(self, session_id: str) -> tuple[str, str]:
+        return f"{self.prefix}{session_id}", f"{self.prefix}{session_id}:offset"
+
+    def append(self, session_id: str, messages: Sequence[dict[str, Any]]) -> int:
+        """Append messages to the session and return the index of the first one."""
+        if not messages:
+            return self.length(session_id)
+        encoded = [json.dumps(message, default=str) for message in messages]
+        return int(self.append_script(keys=self._keys(session_id), args=[self.max_messages, self.ttl or 0, *encoded]))
+
+    def tail(self, session_id: str, limit: int) -> list[dict[str, Any]]:
+        """Return the last `limit` messages in order, each with its `index`."""
+        if limit <= 0:
+            return []
+        log_key, offset_key = self._keys(session_id)
+        pipe = self.client.pipeline(transaction=True)
+        pipe.get(offset_key)
+        pipe.llen(log_key)
+        pipe.lrange(log_key, -limit, -1)
+        offset, length, items = pipe.execute()
+
+        first = int(offset or 0) + length - len(items)
+        return [{**json.loads(item), "index": first + i} for i, item in enumerate(items)]
+
+    def length(self, session_id: str) -> int:
+        """Return the number of messages ever appended to the session."""
+        log_key, offset_key = self._keys(session_id)
+        pipe = self.client.pipeline(transaction=True)
+        pipe.get(offset_key)
+        pipe.llen(log_key)
+        offset, length = pipe.execute()
+        return int(offset or 0) + length
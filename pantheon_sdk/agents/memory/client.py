@@ -1,30 +1,146 @@
+import hashlib
+import uuid
+from collections.abc import Sequence
+from datetime import datetime, timezone
 from typing import Any
 
 from loguru import logger
 from mem0 import Memory
 
+from pantheon_sdk.agents.log import log_event
+from pantheon_sdk.agents.memory.chat_log import ChatLog
 from pantheon_sdk.agents.memory.config import MemoryConfig
+from pantheon_sdk.agents.memory.writer import MemoryWriter
 
 
 class MemoryClient:
     def __init__(self, config: MemoryConfig):
         self.memory = Memory.from_config(config.mem0_config)
+        self.chat_log = ChatLog(
+            config.redis.url,
+            prefix=config.chat_log_prefix,
+            max_messages=config.chat_log_max_messages,
+            ttl=config.chat_log_ttl,
+        )
+        self.close_timeout = config.write_close_timeout
+        self.wait_timeout = config.write_wait_timeout
+        # Queued writes for the request path; the methods below write synchronously.
+        self.writer = MemoryWriter(
+            self,
+            enabled=config.write_behind_enabled,
+            max_queue_size=config.write_queue_size,
+            batch_size=config.write_batch_size,
+            batch_interval=config.write_batch_interval,
+            max_retries=config.write_max_retries,
+            retry_backoff=config.write_retry_backoff,
+        )
 
-    def store(self, key: str, interaction: list[Any]) -> None:
+    def write_interaction(self, key: str, interaction: Any) -> None:
+        log_event("memory.store", "Storing interaction", key=key, interaction=interaction)
+        self.memory.add(interaction, run_id=key)
+
+    def store(self, key: str, interaction: Any) -> None:
         try:
-            logger.info(f"Storing interaction: {interaction} key: {key}")
-            self.memory.add(interaction, run_id=key)
+            self.write_interaction(key, interaction)
         except Exception as e:
             logger.error(f"Error storing interaction in Redis: {e}")
 
     def read(self, key: str, limit: int = 10) -> list[dict[str, Any]]:
         try:
-            logger.info(f"Fetching all memories for key: {key}")
+            log_event("memory.read", "Fetching all memories", key=key)
             return self.memory.get_all(run_id=key, limit=limit)
         except Exception as e:
             logger.error(f"Error retrieving interactions from Redis: {e}")
             return []
 
+    def write_interaction_summaries(self, records: Sequence[tuple[str, dict[str, Any], str]]) -> None:
+        """Index compact `(goal, summary, scope)` interaction records under the embeddings of their goals.
+
+        Unlike `store`, this writes to the vector store directly instead of going through mem0's LLM
+        fact extraction, so storing costs one embedding call per record.
+        """
+        created_at = datetime.now(timezone.utc).isoformat()
+        vectors, ids, payloads = [], [], []
+        for goal, summary, scope in records:
+            vectors.append(self.memory.embedding_model.embed(goal, "add"))
+            ids.append(str(uuid.uuid4()))
+            payloads.append(
+                {
+                    **summary,
+                    "data": goal,
+                    "hash": hashlib.md5(goal.encode()).hexdigest(),
+                    "created_at": created_at,
+                    "agent_id": scope,
+                }
+            )
+        self.memory.vector_store.insert(vectors=vectors, ids=ids, payloads=payloads)
+
+    def store_interaction_summary(self, goal: str, summary: dict[str, Any], scope: str) -> None:
+        try:
+            self.write_interaction_summaries([(goal, summary, scope)])
+        except Exception as e:
+            logger.error(f"Error storing interaction summary in Redis: {e}")
+
+    def search_interactions(
+        self,
+        goal: str,
+        scope: str,
+        top_k: int = 5,
+        max_distance: float | None = None,
+        only_successful: bool = False,
+    ) -> list[dict[str, Any]]:
+        """Return up to `top_k` interaction summaries whose goals are closest to `goal`, closest first.
+
+        Each summary carries its goal and `distance` (lower is closer); interactions farther than
+        `max_distance` are left out.
+        """
+        try:
+            # The vector store only filters on ids, so failed interactions are dropped here and more
+            # candidates are fetched to make up for them.
+            limit = top_k * 3 if only_successful else top_k
+            hits = self.memory.search(goal, agent_id=scope, limit=limit).get("results", [])
+        except Exception as e:
+            logger.error(f"Error searching interactions in Redis: {e}")
+            return []
+
+        summaries: list[dict[str, Any]] = []
+        seen: set[tuple[str, str]] = set()
+        for hit in sorted(hits, key=lambda hit: hit["score"]):
+            metadata = hit.get("metadata") or {}
+            if max_distance is not None and hit["score"] > max_distance:
+                break
+            if only_successful and not metadata.get("success", True):
+                continue
+            # Repeated runs of the same goal and plan add nothing for the planner.
+            key = (hit["memory"], metadata.get("plan_summary", ""))
+            if key in seen:
+                continue
+            seen.add(key)
+            summaries.append({**metadata, "goal": hit["memory"], "distance": hit["score"]})
+            if len(summaries) == top_k:
+                break
+        return summaries
+
+    def append_messages(self, session_id: str, messages: Sequence[dict[str, Any]]) -> int | None:
+        """Append new chat messages to the session log; returns the index of the first one."""
+        try:
+            return self.chat_log.append(session_id, messages)
+        except Exception as e:
+            logger.error(f"Error appending chat messages to Redis: {e}")
+            return None
+
+    def read_tail(self, session_id: str, limit: int = 50) -> list[dict[str, Any]]:
+        """Return the last `limit` messages of the session, oldest first."""
+        try:
+            return self.chat_log.tail(session_id, limit)
+        except Exception as e:
+            logger.error(f"Error retrieving chat messages from Redis: {e}")
+            return []
+
+    def close(self, timeout: float | None = None) -> bool:
+        """Apply the queued writes (for up to `timeout` seconds, `write_close_timeout` by default)."""
+        return self.writer.close(self.close_timeout if timeout is None else timeout)
+
 
 def memory_client(config: MemoryConfig) -> MemoryClient:
     return MemoryClient(config=config)
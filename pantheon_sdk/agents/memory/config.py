@@ -26,6 +26,21 @@ class MemoryConfig(BaseSettings):
     embedding_model_dims: int = Field(1536)
     redis: Redis = Redis()
 
+    # Append-only chat session log
+    chat_log_prefix: str = Field("pantheon:chat:")
+    chat_log_max_messages: int = Field(1000)  # older messages are trimmed, 0 keeps everything
+    chat_log_ttl: int | None = Field(None)  # seconds since the last message, sessions never expire when unset
+
+    # Write-behind queue: interactions and chat messages are written by a background thread
+    write_behind_enabled: bool = Field(True)  # write before returning when disabled
+    write_queue_size: int = Field(10_000)  # queued writes, further writes are dropped
+    write_batch_size: int = Field(64)
+    write_batch_interval: float = Field(0.05)  # seconds to wait for a batch to fill
+    write_max_retries: int = Field(3)
+    write_retry_backoff: float = Field(0.5)  # seconds before the first retry, doubled on each one
+    write_close_timeout: float = Field(10.0)  # seconds to flush queued writes on shutdown
+    write_wait_timeout: float = Field(2.0)  # seconds a session read waits for the session's queued writes
+
     @property
     def mem0_config(self) -> dict:
         return {
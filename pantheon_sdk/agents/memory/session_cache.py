@@ -0,0 +1,96 @@
+"""Replica-local cache of recent chat messages per session.
+
+The cache is written through by `BaseAgent.store_chat_context`, so a replica serving consecutive
+turns of a session reads its history without a Redis round trip. The index returned by the chat
+log on every append tells whether another replica wrote to the session in between, in which case
+the entry is dropped and reloaded on the next read.
+"""
+
+import threading
+from collections.abc import Sequence
+from typing import Any
+
+from pantheon_sdk.agents.cache import TTLCache
+from pantheon_sdk.agents.metrics import get_counter
+
+_hits = get_counter("pantheon_chat_session_cache_hits", "Chat context reads served by the replica cache")
+_misses = get_counter("pantheon_chat_session_cache_misses", "Chat context reads that went to the memory backend")
+
+
+class _Session:
+    def __init__(self, messages: list[dict[str, Any]], complete: bool):
+        self.messages = messages
+        # True when the entry holds every message of the session.
+        self.complete = complete
+
+    @property
+    def next_index(self) -> int:
+        return self.messages[-1]["index"] + 1 if self.messages else 0
+
+
+class ChatSessionCache:
+    """Latest `max_messages` messages of up to `maxsize` sessions, each kept for `ttl` seconds after its last use."""
+
+    def __init__(self, maxsize: int = 1024, ttl: float | None = 300.0, max_messages: int = 50):
+        self.max_messages = max_messages
+        self._sessions: TTLCache[_Session] = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> object:
+        odict = self.__dict__.copy()
+        del odict["_lock"]
+        return odict
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __contains__(self, session_id: str) -> bool:
+        return session_id in self._sessions
+
+    def get(self, session_id: str, limit: int) -> list[dict[str, Any]] | None:
+        """Return the last `limit` messages, or None if the cache cannot answer."""
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is None or (len(session.messages) < limit and not session.complete):
+                _misses.inc()
+                return None
+            self._sessions.set(session_id, session)  # refresh the TTL
+            _hits.inc()
+            return session.messages[-limit:]
+
+    def next_index(self, session_id: str) -> int | None:
+        """Return the index the next message of a cached session gets, or None if it is not cached."""
+        with self._lock:
+            session = self._sessions.get(session_id)
+            return session.next_index if session is not None else None
+
+    def load(self, session_id: str, messages: Sequence[dict[str, Any]], limit: int) -> None:
+        """Cache the result of reading the last `limit` messages from the backend."""
+        with self._lock:
+            self._sessions.set(
+                session_id, _Session(list(messages[-self.max_messages :]), complete=len(messages) < limit)
+            )
+
+    def append(self, session_id: str, messages: Sequence[dict[str, Any]], first_index: int | None) -> None:
+        """Add messages just stored in the backend at `first_index` (None if storing failed)."""
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if first_index is None or (session is not None and first_index != session.next_index):
+                # The backend and the cache may disagree; read the session again next time.
+                self._sessions.pop(session_id)
+                return
+            if session is None:
+                if first_index != 0:
+                    return
+                session = _Session([], complete=True)
+
+            session.messages.extend({**message, "index": first_index + i} for i, message in enumerate(messages))
+            if len(session.messages) > self.max_messages:
+                session.messages = session.messages[-self.max_messages :]
+                session.complete = False
+            self._sessions.set(session_id, session)
+
+    def invalidate(self, session_id: str) -> None:
+        with self._lock:
+            self._sessions.pop(session_id)
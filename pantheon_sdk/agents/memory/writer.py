@@ -0,0 +1,315 @@
+"""Write-behind queue for memory writes.
+
+Interactions and chat messages are queued and written by a background thread, so requests do not
+wait for embedding calls or Redis round trips. The thread takes up to `batch_size` queued writes at
+a time: chat messages of the same session are appended with a single call and interaction summaries
+are inserted together. A failed write is set aside and retried once its backoff (exponential in
+the number of attempts) has passed, then dropped; later writes for the same key wait behind it,
+while writes for other keys go ahead. When the queue is full new writes are dropped rather than
+blocking the request.
+
+Writes are applied in submission order, and `wait(key)` blocks until the writes submitted for a key
+(e.g. a chat session) are applied, for readers that need to see them.
+"""
+
+from __future__ import annotations
+
+import heapq
+import queue
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from loguru import logger
+
+from pantheon_sdk.agents.metrics import get_counter, get_gauge
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from pantheon_sdk.agents.memory.client import MemoryClient
+
+_writes = get_counter("pantheon_memory_writes", "Memory writes applied", tag_keys=("kind",))
+_retries = get_counter("pantheon_memory_write_retries", "Memory write attempts retried", tag_keys=("kind",))
+_drops = get_counter("pantheon_memory_write_drops", "Memory writes dropped", tag_keys=("kind", "reason"))
+_queue_depth = get_gauge("pantheon_memory_write_queue_depth", "Memory writes queued or being applied")
+
+_CLOSE = object()
+_RETRY = object()
+
+
+@dataclass
+class _Write:
+    kind: str  # "interaction", "summary" or "messages"
+    key: str
+    args: tuple
+    on_done: Callable[[Any], None] | None = None
+    attempts: int = 0  # failed attempts so far
+
+
+class MemoryWriter:
+    """Applies the writes of a `MemoryClient` in a background thread.
+
+    With `enabled=False` every write is applied before the call returns, retrying after a sleep.
+    """
+
+    def __init__(
+        self,
+        client: MemoryClient,
+        enabled: bool = True,
+        max_queue_size: int = 10_000,
+        batch_size: int = 64,
+        batch_interval: float = 0.05,
+        max_retries: int = 3,
+        retry_backoff: float = 0.5,
+    ):
+        self.client = client
+        self.enabled = enabled
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.batch_interval = batch_interval
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self._init_state()
+
+    def _init_state(self) -> None:
+        self._queue: queue.Queue = queue.Queue()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+        # Writes queued or being applied, in total and per key.
+        self._unfinished = 0
+        self._pending: Counter[str] = Counter()
+        self._cond = threading.Condition()
+        # Writer thread only: writes waiting for a retry, by key, and when each key is due.
+        self._held: dict[str, list[_Write]] = {}
+        self._retry_at: list[tuple[float, str]] = []
+
+    def __getstate__(self) -> object:
+        odict = self.__dict__.copy()
+        for k in ["_queue", "_thread", "_closed", "_unfinished", "_pending", "_cond", "_held", "_retry_at"]:
+            del odict[k]
+        return odict
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._init_state()
+
+    def __len__(self) -> int:
+        return self._unfinished
+
+    def store(self, key: str, interaction: Any) -> bool:
+        return self._submit(_Write("interaction", key, (key, interaction)))
+
+    def store_interaction_summary(self, goal: str, summary: dict[str, Any], scope: str) -> bool:
+        return self._submit(_Write("summary", scope, (goal, summary, scope)))
+
+    def append_messages(
+        self,
+        session_id: str,
+        messages: Sequence[dict[str, Any]],
+        on_done: Callable[[int | None], None] | None = None,
+    ) -> bool:
+        """Queue messages for the session log.
+
+        `on_done` is called from the writer thread with the index of the first message, or None if
+        the messages were not stored.
+        """
+        return self._submit(_Write("messages", session_id, (session_id, list(messages)), on_done))
+
+    def _submit(self, write: _Write) -> bool:
+        """Queue the write; returns False if it was dropped."""
+        if not self.enabled:
+            self._apply([write], defer=False)
+            return True
+
+        with self._cond:
+            if self._closed or self._unfinished >= self.max_queue_size:
+                reason = "closed" if self._closed else "queue_full"
+                _drops.inc(tags={"kind": write.kind, "reason": reason})
+                logger.warning(f"Dropping memory write ({write.kind}, {write.key!r}): {reason}")
+                dropped = True
+            else:
+                self._unfinished += 1
+                self._pending[write.key] += 1
+                _queue_depth.set(self._unfinished)
+                self._queue.put(write)
+                self._ensure_thread()
+                dropped = False
+
+        if dropped:
+            self._notify(write, None)
+        return not dropped
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="pantheon-memory-writer", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        closing = False
+        while not closing or self._held:
+            batch, close = self._next_batch(closing)
+            closing = closing or close
+            if batch:
+                deferred: list[_Write] = []
+                try:
+                    deferred = self._apply(batch)
+                finally:
+                    deferred_ids = {id(write) for write in deferred}
+                    self._finish([write for write in batch if id(write) not in deferred_ids])
+
+    def _next_batch(self, closing: bool) -> tuple[list[_Write], bool]:
+        """Collect the retries that are due, then up to `batch_size` queued writes.
+
+        Blocks until a write is queued or a retry is due; once closing, only waits for retries.
+        """
+        if closing:
+            time.sleep(self._next_retry_in())
+            return self._due_retries(), True
+
+        batch = self._due_retries()
+        if not batch:
+            try:
+                item = self._queue.get(timeout=self._next_retry_in() if self._retry_at else None)
+            except queue.Empty:
+                return self._due_retries(), False
+            if item is _CLOSE:
+                return [], True
+            batch.append(item)
+
+        deadline = time.monotonic() + self.batch_interval
+        while len(batch) < self.batch_size:
+            try:
+                item = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                break
+            if item is _CLOSE:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _next_retry_in(self) -> float:
+        return max(self._retry_at[0][0] - time.monotonic(), 0) if self._retry_at else 0
+
+    def _due_retries(self) -> list[_Write]:
+        now = time.monotonic()
+        batch: list[_Write] = []
+        while self._retry_at and self._retry_at[0][0] <= now:
+            _, key = heapq.heappop(self._retry_at)
+            batch.extend(self._held.pop(key))
+        return batch
+
+    def _defer(self, writes: Sequence[_Write], delay: float) -> None:
+        """Set the writes aside until `delay` seconds from now."""
+        due = time.monotonic() + delay
+        for write in writes:
+            if write.key not in self._held:
+                self._held[write.key] = []
+                heapq.heappush(self._retry_at, (due, write.key))
+            self._held[write.key].append(write)
+
+    def _finish(self, batch: Sequence[_Write]) -> None:
+        with self._cond:
+            self._unfinished -= len(batch)
+            for write in batch:
+                self._pending[write.key] -= 1
+                if not self._pending[write.key]:
+                    del self._pending[write.key]
+            _queue_depth.set(self._unfinished)
+            self._cond.notify_all()
+
+    def _apply(self, batch: Sequence[_Write], defer: bool = True) -> list[_Write]:
+        """Apply the writes; returns the ones set aside for a retry."""
+        deferred: list[_Write] = []
+        sessions: dict[str, list[_Write]] = {}
+        summaries: list[_Write] = []
+        for write in batch:
+            if write.key in self._held:
+                # An earlier write for the key is waiting for a retry; keep the order.
+                self._held[write.key].append(write)
+                deferred.append(write)
+            elif write.kind == "messages":
+                sessions.setdefault(write.key, []).append(write)
+            elif write.kind == "summary":
+                summaries.append(write)
+            elif self._attempt([write], defer, self.client.write_interaction, *write.args) is _RETRY:
+                deferred.append(write)
+
+        for session_id, writes in sessions.items():
+            messages = [message for write in writes for message in write.args[1]]
+            first_index = self._attempt(writes, defer, self.client.chat_log.append, session_id, messages)
+            if first_index is _RETRY:
+                deferred.extend(writes)
+                continue
+            for write in writes:
+                self._notify(write, first_index)
+                if first_index is not None:
+                    first_index += len(write.args[1])
+
+        if summaries:
+            args = [write.args for write in summaries]
+            if self._attempt(summaries, defer, self.client.write_interaction_summaries, args) is _RETRY:
+                deferred.extend(summaries)
+        return deferred
+
+    @staticmethod
+    def _notify(write: _Write, result: Any) -> None:
+        if write.on_done is None:
+            return
+        try:
+            write.on_done(result)
+        except Exception as e:
+            logger.error(f"Memory write callback failed: {e}")
+
+    def _attempt(self, writes: Sequence[_Write], defer: bool, fn: Callable[..., Any], *args: Any) -> Any:
+        """Call `fn` and return its result, or None once the writes ran out of retries.
+
+        On a failure with retries left, the writes are set aside and `_RETRY` is returned, or with
+        `defer=False` the call is retried after sleeping.
+        """
+        kind = writes[0].kind
+        while True:
+            try:
+                result = fn(*args)
+            except Exception as e:
+                attempts = max(write.attempts for write in writes) + 1
+                for write in writes:
+                    write.attempts = attempts
+                if attempts > self.max_retries:
+                    logger.error(f"Dropping {len(writes)} memory write(s) ({kind}) after {attempts} attempts: {e}")
+                    _drops.inc(len(writes), tags={"kind": kind, "reason": "failed"})
+                    return None
+                _retries.inc(tags={"kind": kind})
+                delay = self.retry_backoff * 2 ** (attempts - 1)
+                if defer:
+                    self._defer(writes, delay)
+                    return _RETRY
+                time.sleep(delay)
+            else:
+                _writes.inc(len(writes), tags={"kind": kind})
+                return result
+
+    def wait(self, key: str, timeout: float | None = None) -> bool:
+        """Block until the writes queued for `key` are applied; returns False on timeout."""
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._pending[key], timeout)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Block until every queued write is applied; returns False on timeout."""
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._unfinished, timeout)
+
+    def close(self, timeout: float | None = None) -> bool:
+        """Stop accepting writes and apply the queued ones; returns False if they did not finish in time."""
+        with self._cond:
+            if self._closed:
+                return not self._unfinished
+            self._closed = True
+            self._queue.put(_CLOSE)
+            thread = self._thread
+        if thread is None:
+            return True
+        thread.join(timeout)
+        return not thread.is_alive()
@@ -0,0 +1,114 @@
+"""Lightweight counters and gauges.
+
+Values are always kept in-process, so they can be read back (e.g. in tests or `stats` endpoints).
+When the process runs inside Ray they are also exported through `ray.util.metrics`.
+"""
+
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Mapping, Sequence
+
+from loguru import logger
+
+Tags = Mapping[str, str]
+
+
+def _tags_key(tags: Tags | None) -> tuple[tuple[str, str], ...]:
+    return tuple(sorted((tags or {}).items()))
+
+
+class _Metric(ABC):
+    ray_metric_class: str
+
+    def __init__(self, name: str, description: str = "", tag_keys: Sequence[str] = ()):
+        self.name = name
+        self.description = description
+        self.tag_keys = tuple(tag_keys)
+        self._values: dict[tuple[tuple[str, str], ...], float] = {}
+        self._lock = threading.Lock()
+        self._ray_metric = None
+
+    def __getstate__(self) -> object:
+        odict = self.__dict__.copy()
+        del odict["_lock"]
+        odict["_ray_metric"] = None
+        return odict
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _export(self, value: float, tags: Tags | None) -> None:
+        try:
+            import ray
+
+            if not ray.is_initialized():
+                return
+            if self._ray_metric is None:
+                from ray.util import metrics
+
+                self._ray_metric = getattr(metrics, self.ray_metric_class)(
+                    self.name, description=self.description, tag_keys=self.tag_keys
+                )
+            self._record(self._ray_metric, value, dict(tags or {}))
+        except Exception as e:
+            logger.debug(f"Failed to export metric {self.name}: {e}")
+
+    @abstractmethod
+    def _record(self, metric, value: float, tags: dict[str, str]) -> None:
+        """Record the value on the Ray metric."""
+
+    def value(self, tags: Tags | None = None) -> float:
+        with self._lock:
+            return self._values.get(_tags_key(tags), 0.0)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class Counter(_Metric):
+    ray_metric_class = "Counter"
+
+    def inc(self, value: float = 1.0, tags: Tags | None = None) -> None:
+        key = _tags_key(tags)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + value
+        self._export(value, tags)
+
+    def _record(self, metric, value: float, tags: dict[str, str]) -> None:
+        metric.inc(value, tags=tags)
+
+
+class Gauge(_Metric):
+    ray_metric_class = "Gauge"
+
+    def set(self, value: float, tags: Tags | None = None) -> None:
+        with self._lock:
+            self._values[_tags_key(tags)] = value
+        self._export(value, tags)
+
+    def _record(self, metric, value: float, tags: dict[str, str]) -> None:
+        metric.set(value, tags=tags)
+
+
+_registry: dict[str, _Metric] = {}
+_registry_lock = threading.Lock()
+
+
+def _get_or_create(klass: type[_Metric], name: str, description: str, tag_keys: Sequence[str]) -> _Metric:
+    with _registry_lock:
+        metric = _registry.get(name)
+        if metric is None:
+            metric = _registry[name] = klass(name, description, tag_keys)
+        elif not isinstance(metric, klass):
+            raise ValueError(f"Metric {name} is already registered as a {type(metric).__name__}")
+        return metric
+
+
+def get_counter(name: str, description: str = "", tag_keys: Sequence[str] = ()) -> Counter:
+    return _get_or_create(Counter, name, description, tag_keys)
+
+
+def get_gauge(name: str, description: str = "", tag_keys: Sequence[str] = ()) -> Gauge:
+    return _get_or_create(Gauge, name, description, tag_keys)
@@ -4,6 +4,12 @@ from typing import Any, Literal
 
 from pydantic import BaseModel, Field, computed_field, field_validator, model_validator
 
+from pantheon_sdk.agents.orchestration.models import CheckpointPolicy
+
+
+def generate_workflow_id() -> str:
+    return f"dag-{uuid.uuid4().hex[:8]}"
+
 
 class ToolModel(BaseModel):
     name: str
@@ -69,6 +75,9 @@ class WorkflowStep(BaseModel):
     parameters: list[ParameterItem] = Field(default_factory=list)
     inputs: list[InputItem] = Field(default_factory=list)
     outputs: list[OutputItem] = Field(default_factory=list)
+    dependencies: list[str] = Field(default_factory=list, description="Names of the steps to run before this one")
+    checkpoint: bool | None = Field(default=None, description="Overrides the workflow checkpoint policy")
+    timeout: float | None = Field(default=None, gt=0, description="Overrides `WORKFLOW_STEP_TIMEOUT` (seconds)")
 
     @property
     def task_id(self) -> str:
@@ -113,13 +122,17 @@ class WorkflowStep(BaseModel):
 
 
 class Workflow(BaseModel):
-    id: str = Field(default_factory=lambda x: f"dag-{uuid.uuid4().hex[:8]}")
+    id: str = Field(default_factory=generate_workflow_id)
     name: str
     description: str
     thought: str | None = None
     parameters: list[Any] = Field(default_factory=list)
     steps: list[WorkflowStep]
     outputs: list[OutputItem] = Field(default_factory=list)
+    checkpoint_policy: CheckpointPolicy | None = Field(
+        default=None, description="Overrides `WORKFLOW_CHECKPOINT_POLICY` for this workflow"
+    )
+    timeout: float | None = Field(default=None, gt=0, description="Overrides `WORKFLOW_TIMEOUT` (seconds)")
 
 
 class ChatRequest(BaseModel):
@@ -128,10 +141,23 @@ class ChatRequest(BaseModel):
     session_uuid: str | None = None
 
 
+class BatchRequest(BaseModel):
+    goals: list[str] = Field(..., min_length=1, description="Goals to handle; duplicates are handled once")
+    context: Any = Field(default=None, description="Context passed to every goal")
+
+
+class BatchGoalResult(BaseModel):
+    goal: str
+    positions: list[int] = Field(..., description="Indices of the goal in the submitted list")
+    result: Any = None
+    error: str | None = Field(default=None, description="Set when the goal failed")
+
+
 class ChatMessageModel(BaseModel):
     role: str = Field(..., description="Sender role: 'user' or 'assistant'")
     content: str = Field(..., description="Message content")
     timestamp: datetime | None = Field(default_factory=datetime.utcnow, description="Message timestamp")
+    index: int | None = Field(default=None, description="Position in the session, assigned when stored")
 
 
 class ChatContextModel(BaseModel):
@@ -146,6 +172,20 @@ class MemoryModel(BaseModel):
     context: dict[str, Any] | None = Field(default=None, description="Used when plan is provided")
 
 
+class InteractionSummaryModel(BaseModel):
+    goal: str
+    plan_summary: str = Field(..., description="Plan name and the tools of its steps")
+    outcome: str = Field(..., description="Truncated result, or the error if the workflow failed")
+    success: bool = True
+    distance: float | None = Field(default=None, description="Distance to the current goal, lower is closer")
+
+    def render(self) -> str:
+        return f"""- goal: {self.goal}
+    - plan: {self.plan_summary}
+    - {"outcome" if self.success else "failed with"}: {self.outcome}
+"""
+
+
 class AgentModel(BaseModel):
     name: str
     description: str
@@ -183,6 +223,13 @@ class InsightModel(BaseModel):
     domain_knowledge: str = Field(..., description="Insight from the private domain knowledge")
 
 
+class PlanningContextModel(BaseModel):
+    insights: list[InsightModel] = Field(default_factory=list, description="Insights from the domain knowledge")
+    past_interactions: Any = Field(default_factory=list, description="Past interactions for similar goals")
+    agents: list[AgentModel] = Field(default_factory=list, description="Most relevant agents for the goal")
+    tools: list[ToolModel] = Field(default_factory=list, description="Most relevant tools for the goal")
+
+
 class HandoffParamsModel(BaseModel):
     endpoint: str = Field(..., description="Endpoint to hand off to")
     path: str = Field(default="/{goal}", description="Path to append to the endpoint")
@@ -0,0 +1,122 @@
+"""Catalog of the workflows shipped as YAML files with the agent package.
+
+Files are parsed and validated into `Workflow` models once and indexed by workflow id. A refresh
+only stats the files and re-parses the ones whose mtime or size changed, and refreshes are
+throttled to `refresh_interval` seconds.
+"""
+
+import os
+import threading
+import time
+from functools import lru_cache
+from typing import Any
+
+from loguru import logger
+
+from pantheon_sdk.agents.models import Workflow
+from pantheon_sdk.agents.orchestration.utils import determine_workflow_path, parse_workflow_file
+
+WORKFLOW_FILE_EXTENSIONS = (".yaml", ".yml")
+
+
+class CatalogEntry:
+    def __init__(self, path: str, stamp: tuple[float, int], raw: dict[str, Any], workflow: Workflow):
+        self.path = path
+        self.stamp = stamp
+        self.raw = raw
+        self.workflow = workflow
+
+
+class WorkflowCatalog:
+    def __init__(self, directory: str | None = None, refresh_interval: float = 5.0):
+        self._directory = directory
+        self.refresh_interval = refresh_interval
+        self._entries: dict[str, CatalogEntry] = {}  # by path
+        self._failed: dict[str, tuple[float, int]] = {}  # files that failed to parse, by path
+        self._last_refresh: float | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def directory(self) -> str:
+        if self._directory is None:
+            self._directory = determine_workflow_path()
+        return self._directory
+
+    def _scan(self) -> dict[str, tuple[float, int]]:
+        stamps = {}
+        for root, _, files in os.walk(self.directory):
+            for file in files:
+                if file.endswith(WORKFLOW_FILE_EXTENSIONS):
+                    path = os.path.join(root, file)
+                    try:
+                        stat = os.stat(path)
+                    except OSError:
+                        continue
+                    stamps[path] = (stat.st_mtime, stat.st_size)
+        return stamps
+
+    def _load(self, path: str, stamp: tuple[float, int]) -> None:
+        try:
+            raw = parse_workflow_file(path)
+            entry = CatalogEntry(path, stamp, raw, Workflow(**raw))
+        except Exception as e:
+            logger.warning(f"Failed to load workflow file {path}: {e}")
+            self._entries.pop(path, None)
+            self._failed[path] = stamp
+            return
+        self._failed.pop(path, None)
+        self._entries[path] = entry
+
+    def refresh(self, force: bool = False) -> None:
+        """Re-parse the files that were added or changed and drop the deleted ones."""
+        with self._lock:
+            now = time.monotonic()
+            if not force and self._last_refresh is not None and now - self._last_refresh < self.refresh_interval:
+                return
+            self._last_refresh = now
+
+            stamps = self._scan()
+            for path in set(self._entries) - set(stamps):
+                del self._entries[path]
+            for path in set(self._failed) - set(stamps):
+                del self._failed[path]
+
+            for path, stamp in sorted(stamps.items()):
+                entry = self._entries.get(path)
+                if (entry is None or entry.stamp != stamp) and self._failed.get(path) != stamp:
+                    self._load(path, stamp)
+
+    def _sorted_entries(self) -> list[tuple[str, CatalogEntry]]:
+        """Refresh, then return the entries by path, copied under the lock another thread refreshes with."""
+        self.refresh()
+        with self._lock:
+            return sorted(self._entries.items())
+
+    def workflows(self) -> dict[str, Workflow]:
+        """Return the valid workflows by id; a later file wins over an earlier one with the same id."""
+        workflows: dict[str, Workflow] = {}
+        for path, entry in self._sorted_entries():
+            if entry.workflow.id in workflows:
+                logger.warning(f"Workflow {entry.workflow.id} in {path} overrides an earlier definition")
+            workflows[entry.workflow.id] = entry.workflow
+        return workflows
+
+    def get(self, workflow_id: str) -> Workflow | None:
+        return self.workflows().get(workflow_id)
+
+    def raw_workflows(self) -> dict[str, dict[str, Any]]:
+        """Return the parsed file contents by path."""
+        return {path: entry.raw for path, entry in self._sorted_entries()}
+
+
+@lru_cache
+def _workflow_catalog() -> WorkflowCatalog:
+    return WorkflowCatalog()
+
+
+def get_workflow_catalog(refresh_interval: float | None = None) -> WorkflowCatalog:
+    """Return the process-wide catalog, setting its refresh interval when given."""
+    catalog = _workflow_catalog()
+    if refresh_interval is not None:
+        catalog.refresh_interval = refresh_interval
+    return catalog
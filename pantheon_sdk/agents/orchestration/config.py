@@ -2,12 +2,45 @@ from functools import lru_cache
 
 from pydantic_settings import BaseSettings
 
-from pantheon_sdk.agents.orchestration.models import WorkflowSettings
+from pantheon_sdk.agents.orchestration.models import CheckpointPolicy, StepCacheSettings, WorkflowSettings
 
 
 class BasicWorkflowConfig(BaseSettings):
     WORKFLOWS_TO_RUN: dict[str, WorkflowSettings] = {}
+    WORKFLOW_CATALOG_REFRESH_INTERVAL: float = 5.0  # seconds between checks of the workflow files for changes
     WORKFLOW_STEP_MAX_RETRIES: int = 5  # Задаю дефолт так как мне кажется, что она не настолько динамическая
+    WORKFLOW_COMPILED_STEP_CACHE_SIZE: int = 256  # remote step functions kept per runner
+    WORKFLOW_INDEX_MAX_SIZE: int = 10_000  # workflows kept in the index served by `list_workflows`
+    WORKFLOW_INDEX_SHARED: bool = True  # one index for all replicas, kept in a detached actor
+    WORKFLOW_INDEX_RECONCILE_INTERVAL: float = 60.0  # seconds between syncs of the index with Ray storage
+    WORKFLOW_CHECKPOINT_POLICY: CheckpointPolicy = CheckpointPolicy.ALL  # plans and steps can override it
+
+    # Timeouts in seconds, unlimited when unset; plans and steps can override them. Both are further
+    # bounded by the request deadline.
+    WORKFLOW_TIMEOUT: float | None = None
+    WORKFLOW_STEP_TIMEOUT: float | None = None
+
+    # Background workflow scheduler
+    WORKFLOW_SCHEDULER_TICK: float = 1.0  # seconds between schedule checks
+    WORKFLOW_SCHEDULER_MAX_CONCURRENCY: int = 4  # background runs in flight per agent
+    WORKFLOW_SCHEDULER_LEASE_TTL: float = 15.0  # seconds a replica stays leader without renewing
+    WORKFLOW_SCHEDULER_DRAIN_TIMEOUT: float = 30.0  # seconds `stop_daemon` waits for running workflows
+
+    # In-process fast path (`hybrid` workflow entrypoint)
+    WORKFLOW_LOCAL_MAX_STEPS: int = 3  # larger plans always go to Ray
+
+    # Step result memoization; only the tools listed in WORKFLOW_STEP_CACHE_TOOLS are cached
+    WORKFLOW_STEP_CACHE_ENABLED: bool = False
+    WORKFLOW_STEP_CACHE_TOOLS: dict[str, StepCacheSettings] = {}  # tool name -> settings
+    WORKFLOW_STEP_CACHE_MAX_SIZE: int = 1024  # results kept in memory per worker process
+    WORKFLOW_STEP_CACHE_REDIS_URL: str | None = None  # shared tier, disabled when unset
+    WORKFLOW_STEP_CACHE_REDIS_PREFIX: str = "pantheon:step-result:"
+
+    # Warm tool-worker pool (replaces per-step pip runtime envs when enabled)
+    WORKFLOW_TOOL_POOL_ENABLED: bool = False
+    WORKFLOW_TOOL_POOL_MIN_SIZE: int = 1  # workers kept warm per tool while it is in use
+    WORKFLOW_TOOL_POOL_MAX_SIZE: int = 4  # workers per tool
+    WORKFLOW_TOOL_POOL_IDLE_TIMEOUT: float = 600.0  # seconds before an idle worker is evicted
 
 
 @lru_cache
@@ -0,0 +1,79 @@
+"""Minimal cron expressions for workflow schedules.
+
+Supports the standard five fields (minute, hour, day of month, month, day of week) with `*`,
+single values, ranges `a-b`, steps `*/n` and `a-b/n`, and comma-separated lists. Day of week is
+0-6 starting on Sunday (7 is accepted for Sunday too). As in cron, when both day fields are
+restricted a day matches if either does. Times are evaluated in UTC.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+# (min, max) per field
+FIELD_RANGES = [(0, 59), (0, 23), (1, 31), (1, 12), (0, 7)]
+# Searching further than this means the expression can never match (e.g. February 30th).
+MAX_LOOKAHEAD_DAYS = 366 * 5
+
+
+def _parse_field(field: str, low: int, high: int) -> set[int]:
+    values: set[int] = set()
+    for part in field.split(","):
+        base, _, step_str = part.partition("/")
+        step = int(step_str) if step_str else 1
+        if step < 1:
+            raise ValueError(f"Invalid cron step: {part}")
+
+        if base == "*":
+            start, end = low, high
+        elif "-" in base:
+            start, end = (int(x) for x in base.split("-", 1))
+        else:
+            start = int(base)
+            end = high if step_str else start
+
+        if not low <= start <= end <= high:
+            raise ValueError(f"Cron value out of range {low}-{high}: {part}")
+        values.update(range(start, end + 1, step))
+    return values
+
+
+class CronSchedule:
+    def __init__(self, expression: str):
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"Cron expression must have 5 fields: {expression!r}")
+        self.expression = expression
+        self.minutes, self.hours, self.days, self.months, weekdays = (
+            _parse_field(field, low, high) for field, (low, high) in zip(fields, FIELD_RANGES, strict=True)
+        )
+        self.weekdays = {day % 7 for day in weekdays}
+        self._any_day = fields[2] == "*"
+        self._any_weekday = fields[4] == "*"
+
+    def __repr__(self) -> str:
+        return f"CronSchedule({self.expression!r})"
+
+    def _day_matches(self, day: datetime) -> bool:
+        if day.month not in self.months:
+            return False
+        day_match = day.day in self.days
+        weekday_match = (day.weekday() + 1) % 7 in self.weekdays  # cron counts from Sunday
+        if self._any_day or self._any_weekday:
+            return day_match and weekday_match
+        return day_match or weekday_match
+
+    def next_after(self, moment: datetime) -> datetime:
+        """Return the first matching time strictly after `moment`."""
+        if moment.tzinfo is None:
+            moment = moment.replace(tzinfo=timezone.utc)
+        start = moment.astimezone(timezone.utc).replace(second=0, microsecond=0) + timedelta(minutes=1)
+
+        day = start.replace(hour=0, minute=0)
+        for _ in range(MAX_LOOKAHEAD_DAYS):
+            if self._day_matches(day):
+                for hour in sorted(self.hours):
+                    for minute in sorted(self.minutes):
+                        candidate = day.replace(hour=hour, minute=minute)
+                        if candidate >= start:
+                            return candidate
+            day += timedelta(days=1)
+        raise ValueError(f"Cron expression never matches: {self.expression!r}")
@@ -0,0 +1,108 @@
+"""Dependency analysis for workflow plans.
+
+A step depends on another step when it
+- lists it in `dependencies`,
+- references one of its outputs with `{{steps.<step>.outputs.<output>}}` in its inputs or parameters, or
+- declares an input without a value whose name matches an output of an earlier step.
+"""
+
+import re
+from typing import Any
+
+from pantheon_sdk.agents.models import Workflow, WorkflowStep
+
+STEP_OUTPUT_REFERENCE = re.compile(r"\{\{\s*steps\.([\w-]+)\.outputs\.([\w-]+)\s*\}\}")
+
+
+def find_step_references(value: Any) -> list[tuple[str, str]]:
+    """Return all `(step, output)` pairs referenced in a (possibly nested) value."""
+    if isinstance(value, str):
+        return STEP_OUTPUT_REFERENCE.findall(value)
+    if isinstance(value, list | tuple):
+        return [ref for item in value for ref in find_step_references(item)]
+    if isinstance(value, dict):
+        return [ref for item in value.values() for ref in find_step_references(item)]
+    return []
+
+
+def link_implicit_inputs(workflow: Workflow) -> Workflow:
+    """Return a copy of the workflow where value-less inputs reference the earlier step producing them."""
+    linked = workflow.model_copy(deep=True)
+    producers: dict[str, str] = {}
+    for step in linked.steps:
+        for item in step.inputs:
+            if item.value in (None, "") and item.name in producers:
+                item.value = f"{{{{steps.{producers[item.name]}.outputs.{item.name}}}}}"
+        for output in step.outputs:
+            producers[output.name] = step.name
+    return linked
+
+
+def build_dependency_graph(workflow: Workflow) -> dict[str, list[str]]:
+    """Map each step name to the names of the steps it depends on, in plan order."""
+    workflow = link_implicit_inputs(workflow)
+    names = [step.name for step in workflow.steps]
+    if len(set(names)) != len(names):
+        raise ValueError(f"Workflow {workflow.id} has duplicate step names")
+
+    graph: dict[str, list[str]] = {}
+    for step in workflow.steps:
+        deps = list(step.dependencies)
+        for item in [*step.inputs, *step.parameters]:
+            deps.extend(ref_step for ref_step, _ in find_step_references(item.value))
+
+        unknown = [dep for dep in deps if dep not in names]
+        if unknown:
+            raise ValueError(f"Step {step.name} depends on unknown steps: {unknown}")
+
+        graph[step.name] = [dep for dep in dict.fromkeys(deps) if dep != step.name]
+    return graph
+
+
+def topological_order(workflow: Workflow) -> list[WorkflowStep]:
+    """Order steps so every step comes after its dependencies, keeping plan order otherwise."""
+    graph = build_dependency_graph(workflow)
+    steps = {step.name: step for step in workflow.steps}
+    ordered: list[WorkflowStep] = []
+    done: set[str] = set()
+
+    while len(ordered) < len(steps):
+        ready = [name for name, deps in graph.items() if name not in done and all(dep in done for dep in deps)]
+        if not ready:
+            raise ValueError(f"Workflow {workflow.id} has cyclic step dependencies")
+        for name in ready:
+            ordered.append(steps[name])
+            done.add(name)
+    return ordered
+
+
+def find_sinks(workflow: Workflow) -> list[str]:
+    """Return the steps no other step depends on, in topological order; the last one is the final step."""
+    graph = build_dependency_graph(workflow)
+    required = {dep for deps in graph.values() for dep in deps}
+    return [step.name for step in topological_order(workflow) if step.name not in required]
+
+
+def extract_output(result: Any, output_name: str) -> Any:
+    """Pick a named output from a step result; non-dict results are treated as the single output."""
+    if isinstance(result, dict) and output_name in result:
+        return result[output_name]
+    return result
+
+
+def resolve_references(value: Any, results: dict[str, Any]) -> Any:
+    """Substitute `{{steps.<step>.outputs.<output>}}` references with upstream step results.
+
+    A value that is exactly one reference is replaced by the referenced object itself; references
+    embedded in a longer string are rendered with `str`.
+    """
+    if isinstance(value, str):
+        match = STEP_OUTPUT_REFERENCE.fullmatch(value.strip())
+        if match:
+            return extract_output(results[match.group(1)], match.group(2))
+        return STEP_OUTPUT_REFERENCE.sub(lambda m: str(extract_output(results[m.group(1)], m.group(2))), value)
+    if isinstance(value, list):
+        return [resolve_references(item, results) for item in value]
+    if isinstance(value, dict):
+        return {key: resolve_references(item, results) for key, item in value.items()}
+    return value
@@ -0,0 +1,220 @@
+"""Workflow index.
+
+Listing workflows straight from Ray storage costs one metadata read per workflow. Runners record
+the workflows they start here instead, so listings are served from memory with filtering and
+cursor-based pagination.
+
+With `WORKFLOW_INDEX_SHARED` the index lives in a named, detached actor, so every replica of an
+agent sees the same workflows and the index survives replica restarts.
+"""
+
+import base64
+import bisect
+import threading
+import time
+from collections.abc import Iterable
+
+import ray
+from loguru import logger
+from pydantic import BaseModel, Field
+
+from pantheon_sdk.agents.orchestration.config import BasicWorkflowConfig
+
+WORKFLOW_INDEX_NAME = "pantheon-workflow-index"
+
+
+class WorkflowIndexEntry(BaseModel):
+    workflow_id: str
+    status: str
+    created_at: float = Field(default_factory=time.time)
+    updated_at: float = Field(default_factory=time.time)
+    name: str | None = None
+    plan_hash: str | None = None
+    agent: str | None = None
+    runner: str | None = None
+
+
+class WorkflowPage(BaseModel):
+    items: list[WorkflowIndexEntry]
+    next_cursor: str | None = None
+
+
+def encode_cursor(entry: WorkflowIndexEntry) -> str:
+    return base64.urlsafe_b64encode(f"{entry.created_at!r}:{entry.workflow_id}".encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[float, str]:
+    try:
+        created_at, workflow_id = base64.urlsafe_b64decode(cursor.encode()).decode().split(":", 1)
+        return float(created_at), workflow_id
+    except Exception as e:
+        raise ValueError(f"Invalid workflow cursor: {cursor}") from e
+
+
+class WorkflowIndex:
+    """Bounded, thread-safe index of workflows ordered by creation time.
+
+    Pages are returned newest first; the oldest entries are dropped once `max_size` is reached.
+    """
+
+    def __init__(self, max_size: int = 10_000):
+        self.max_size = max_size
+        self._entries: dict[str, WorkflowIndexEntry] = {}
+        self._order: list[tuple[float, str]] = []  # (created_at, workflow_id), ascending
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, workflow_id: str) -> bool:
+        return workflow_id in self._entries
+
+    def get(self, workflow_id: str) -> WorkflowIndexEntry | None:
+        return self._entries.get(workflow_id)
+
+    def add(self, entry: WorkflowIndexEntry) -> None:
+        """Add or replace an entry; entries older than every entry of a full index are not kept."""
+        with self._lock:
+            if (
+                entry.workflow_id not in self._entries
+                and len(self._order) >= self.max_size
+                and (entry.created_at, entry.workflow_id) < self._order[0]
+            ):
+                return
+            previous = self._entries.pop(entry.workflow_id, None)
+            if previous is not None:
+                self._order.remove((previous.created_at, previous.workflow_id))
+            self._entries[entry.workflow_id] = entry
+            bisect.insort(self._order, (entry.created_at, entry.workflow_id))
+
+            while len(self._order) > self.max_size:
+                _, oldest = self._order.pop(0)
+                del self._entries[oldest]
+
+    def find(self, status: str, runner: str | None = None) -> list[str]:
+        """Return the ids of workflows with the given status (and runner)."""
+        with self._lock:
+            return [
+                entry.workflow_id
+                for entry in self._entries.values()
+                if entry.status == status and runner in (None, entry.runner)
+            ]
+
+    def statuses(self, workflow_ids: Iterable[str]) -> dict[str, str]:
+        """Return the status of each of the given workflows that is in the index."""
+        with self._lock:
+            return {wf_id: self._entries[wf_id].status for wf_id in workflow_ids if wf_id in self._entries}
+
+    def update_status(self, workflow_id: str, status: str) -> None:
+        with self._lock:
+            entry = self._entries.get(workflow_id)
+            if entry is not None:
+                entry.status = status
+                entry.updated_at = time.time()
+
+    def list(
+        self,
+        status: str | None = None,
+        agent: str | None = None,
+        plan_hash: str | None = None,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> WorkflowPage:
+        """Return up to `limit` entries matching the filters, starting after `cursor`."""
+        with self._lock:
+            end = len(self._order)
+            if cursor is not None:
+                end = bisect.bisect_left(self._order, decode_cursor(cursor))
+
+            items: list[WorkflowIndexEntry] = []
+            position = end
+            while position > 0 and len(items) < limit:
+                position -= 1
+                entry = self._entries[self._order[position][1]]
+                if (
+                    status in (None, entry.status)
+                    and agent in (None, entry.agent)
+                    and plan_hash in (None, entry.plan_hash)
+                ):
+                    items.append(entry.model_copy())
+
+            next_cursor = encode_cursor(items[-1]) if len(items) == limit and position > 0 else None
+            return WorkflowPage(items=items, next_cursor=next_cursor)
+
+
+@ray.remote
+class WorkflowIndexActor(WorkflowIndex):
+    """`WorkflowIndex` shared by every replica through a named, detached actor."""
+
+    def size(self) -> int:
+        return len(self)
+
+    def contains(self, workflow_id: str) -> bool:
+        return workflow_id in self
+
+
+class SharedWorkflowIndex:
+    """Client of the shared index actor with the interface of `WorkflowIndex`.
+
+    Writes are sent without waiting for them; reads wait for the actor, which applies calls from
+    one client in order.
+    """
+
+    def __init__(self, name: str = WORKFLOW_INDEX_NAME, max_size: int = 10_000):
+        self.name = name
+        self.max_size = max_size
+        self._actor = None
+
+    @property
+    def actor(self):
+        if self._actor is None:
+            self._actor = WorkflowIndexActor.options(name=self.name, lifetime="detached", get_if_exists=True).remote(
+                self.max_size
+            )
+        return self._actor
+
+    def __len__(self) -> int:
+        return ray.get(self.actor.size.remote())
+
+    def __contains__(self, workflow_id: str) -> bool:
+        return ray.get(self.actor.contains.remote(workflow_id))
+
+    def get(self, workflow_id: str) -> WorkflowIndexEntry | None:
+        return ray.get(self.actor.get.remote(workflow_id))
+
+    def add(self, entry: WorkflowIndexEntry) -> None:
+        self._send("add", entry)
+
+    def find(self, status: str, runner: str | None = None) -> list[str]:
+        return ray.get(self.actor.find.remote(status, runner))
+
+    def statuses(self, workflow_ids: Iterable[str]) -> dict[str, str]:
+        return ray.get(self.actor.statuses.remote(list(workflow_ids)))
+
+    def update_status(self, workflow_id: str, status: str) -> None:
+        self._send("update_status", workflow_id, status)
+
+    def list(
+        self,
+        status: str | None = None,
+        agent: str | None = None,
+        plan_hash: str | None = None,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> WorkflowPage:
+        if cursor is not None:
+            decode_cursor(cursor)  # raise ValueError here rather than from the actor
+        return ray.get(self.actor.list.remote(status, agent, plan_hash, limit, cursor))
+
+    def _send(self, method: str, *args) -> None:
+        try:
+            getattr(self.actor, method).remote(*args)
+        except Exception as e:
+            logger.warning(f"Failed to update the workflow index {self.name}: {e}")
+
+
+def create_workflow_index(config: BasicWorkflowConfig) -> WorkflowIndex | SharedWorkflowIndex:
+    """Return the index configured for runners that record workflows in Ray."""
+    if config.WORKFLOW_INDEX_SHARED:
+        return SharedWorkflowIndex(max_size=config.WORKFLOW_INDEX_MAX_SIZE)
+    return WorkflowIndex(max_size=config.WORKFLOW_INDEX_MAX_SIZE)
@@ -0,0 +1,271 @@
+"""In-process workflow execution.
+
+Ray Workflows checkpoint every step and schedule a remote task per step, which costs hundreds of
+milliseconds even for a single `return_answer_tool` step. `LocalWorkflowRunner` runs plans whose
+tools are already installed in the current process with asyncio, and `HybridWorkflowRunner` routes
+each plan to it or to `DAGRunner` by plan size and tool availability.
+
+Steps whose parameters are passed as environment variables never run in-process: the environment
+is shared by every request served by the replica, so they are left to Ray workers, which get their
+own.
+"""
+
+import asyncio
+import inspect
+import time
+from collections.abc import Sequence
+from typing import Any
+
+from loguru import logger
+from ray.workflow.common import WorkflowStatus
+
+from pantheon_sdk.agents import abc
+from pantheon_sdk.agents.cache import TTLCache
+from pantheon_sdk.agents.deadline import (
+    DeadlineExceededError,
+    deadline_passed,
+    deadline_scope,
+    earliest,
+    get_deadline,
+    time_left,
+)
+from pantheon_sdk.agents.models import ToolModel, Workflow, WorkflowStep
+from pantheon_sdk.agents.orchestration.config import BasicWorkflowConfig
+from pantheon_sdk.agents.orchestration.dag import (
+    build_dependency_graph,
+    find_sinks,
+    link_implicit_inputs,
+    resolve_references,
+    topological_order,
+)
+from pantheon_sdk.agents.orchestration.index import (
+    SharedWorkflowIndex,
+    WorkflowIndex,
+    WorkflowIndexEntry,
+    WorkflowPage,
+    create_workflow_index,
+)
+from pantheon_sdk.agents.orchestration.runner import DAGRunner
+from pantheon_sdk.agents.orchestration.step_cache import call_memoized, get_step_cache_settings, step_result_cache_for
+from pantheon_sdk.agents.orchestration.utils import current_agent_name, load_tool_entrypoint
+from pantheon_sdk.agents.utils import hash_payload
+
+# How long a tool that is not installed locally is remembered as such.
+MISSING_TOOL_TTL = 60.0
+
+
+def _call_tool(function, kwargs: dict[str, Any]) -> Any:
+    result = function(**kwargs)
+    # Async tools get their own event loop in the worker thread.
+    if inspect.iscoroutine(result):
+        result = asyncio.run(result)
+    return result
+
+
+class LocalWorkflowRunner(abc.AbstractWorkflowRunner):
+    """Runs workflows in the current process.
+
+    Independent steps run concurrently, each tool call in a worker thread. Nothing is
+    checkpointed, so the runner is meant for short interactive plans that never need to resume.
+
+    A step that times out is abandoned, not killed: Python threads cannot be interrupted. Tools
+    can read the request deadline with `get_deadline()` to stop early.
+    """
+
+    def __init__(self, config: BasicWorkflowConfig, index: WorkflowIndex | SharedWorkflowIndex | None = None):
+        self.config = config
+        self.index = index if index is not None else WorkflowIndex(max_size=config.WORKFLOW_INDEX_MAX_SIZE)
+        self._missing_tools: TTLCache[bool] = TTLCache(maxsize=1024, ttl=MISSING_TOOL_TTL)
+
+    def reconfigure(self, config: dict[str, Any]) -> None:
+        """Reconfigure the runner with new settings.
+
+        Args:
+            config: New configuration settings
+
+        """
+        self.config = BasicWorkflowConfig(**config)
+
+    def start_daemon(self, include_failed=False) -> None:
+        pass
+
+    def stop_daemon(self) -> None:
+        pass
+
+    def run_background_workflows(self) -> None:
+        """Background workflows need durable execution and are left to `DAGRunner`."""
+
+    async def list_workflows(
+        self,
+        status: str | None = None,
+        agent: str | None = None,
+        plan_hash: str | None = None,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> WorkflowPage:
+        return self.index.list(status=status, agent=agent, plan_hash=plan_hash, limit=limit, cursor=cursor)
+
+    def has_tool(self, tool: ToolModel) -> bool:
+        """Check whether the requested version of the tool is installed in the current process."""
+        key = tool.render_pip_dependency()
+        if key in self._missing_tools:
+            return False
+        try:
+            load_tool_entrypoint(tool.package_name, tool.version)
+        except Exception:
+            self._missing_tools.set(key, True)
+            return False
+        return True
+
+    def can_run(self, plan: Workflow) -> bool:
+        return all(not step.env_vars and self.has_tool(step.tool) for step in plan.steps)
+
+    async def run_step(self, step: WorkflowStep, upstream_results: dict[str, Any]) -> Any:
+        if step.env_vars:
+            raise ValueError(f"Step {step.name} takes environment variables and cannot run in-process")
+        tool = load_tool_entrypoint(step.tool.package_name, step.tool.version)
+        # Tools are exported as Ray remote functions; call the plain function.
+        function = getattr(tool, "_function", tool)
+        kwargs = resolve_references(step.args, upstream_results)
+        timeout = time_left(timeout=step.timeout or self.config.WORKFLOW_STEP_TIMEOUT)
+        call = asyncio.to_thread(
+            call_memoized,
+            step_result_cache_for(self.config),
+            get_step_cache_settings(self.config, step.tool),
+            step.tool,
+            step.env_vars,
+            kwargs,
+            lambda: _call_tool(function, kwargs),
+        )
+        try:
+            return await asyncio.wait_for(call, timeout=timeout)
+        except asyncio.TimeoutError as e:
+            time_left()  # raises if it was the deadline that passed
+            raise TimeoutError(f"Step {step.name} timed out after {timeout:.1f}s") from e
+
+    async def _execute(self, dag_spec: Workflow) -> Any:
+        dag_spec = link_implicit_inputs(dag_spec)
+        graph = build_dependency_graph(dag_spec)
+        sinks = find_sinks(dag_spec)
+
+        tasks: dict[str, asyncio.Task] = {}
+
+        async def run_when_ready(step: WorkflowStep) -> Any:
+            upstream = await asyncio.gather(*[tasks[dep] for dep in graph[step.name]])
+            return await self.run_step(step, dict(zip(graph[step.name], upstream, strict=True)))
+
+        for step in topological_order(dag_spec):
+            tasks[step.name] = asyncio.create_task(run_when_ready(step))
+
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            raise
+        return tasks[sinks[-1]].result() if sinks else None
+
+    async def run(self, dag_spec: Workflow, context: Any = None, async_mode=False) -> Any:
+        """Run the workflow in the current process.
+
+        With `async_mode` the workflow is started in the background and the `asyncio.Task` is returned.
+        """
+        if async_mode:
+            return asyncio.create_task(self.run(dag_spec, context))
+
+        timeout = dag_spec.timeout or self.config.WORKFLOW_TIMEOUT
+        deadline = earliest(get_deadline(), time.time() + timeout if timeout else None)
+        self.index.add(
+            WorkflowIndexEntry(
+                workflow_id=dag_spec.id,
+                status=WorkflowStatus.RUNNING.value,
+                name=dag_spec.name,
+                plan_hash=hash_payload(dag_spec.model_dump(mode="json", exclude={"id"})),
+                agent=current_agent_name(),
+                runner="local",
+            )
+        )
+        try:
+            with deadline_scope(deadline):
+                result = await asyncio.wait_for(self._execute(dag_spec), timeout=time_left())
+        except asyncio.CancelledError:
+            self.index.update_status(dag_spec.id, WorkflowStatus.CANCELED.value)
+            raise
+        except Exception as e:
+            if isinstance(e, asyncio.TimeoutError | TimeoutError) and deadline_passed(deadline):
+                self.index.update_status(dag_spec.id, WorkflowStatus.CANCELED.value)
+                if isinstance(e, DeadlineExceededError):
+                    raise
+                raise DeadlineExceededError(f"Workflow {dag_spec.id} did not finish before its deadline") from e
+            self.index.update_status(dag_spec.id, WorkflowStatus.FAILED.value)
+            raise
+        self.index.update_status(dag_spec.id, WorkflowStatus.SUCCESSFUL.value)
+        return result
+
+
+class HybridWorkflowRunner(abc.AbstractWorkflowRunner):
+    """Routes small plans whose tools are installed locally in-process and everything else to Ray.
+
+    A plan runs in-process when it has at most `WORKFLOW_LOCAL_MAX_STEPS` steps, every tool it uses
+    can be loaded in the current process and none of its steps takes environment variables.
+    """
+
+    def __init__(self, config: BasicWorkflowConfig):
+        self.config = config
+        # Both runners record their workflows in the same index, so listings need no merging.
+        self.index = create_workflow_index(config)
+        self.local_runner = LocalWorkflowRunner(config, index=self.index)
+        self.ray_runner = DAGRunner(config, index=self.index)
+
+    def reconfigure(self, config: dict[str, Any]) -> None:
+        """Reconfigure both runners with new settings.
+
+        Args:
+            config: New configuration settings
+
+        """
+        self.config = BasicWorkflowConfig(**config)
+        self.local_runner.reconfigure(config)
+        self.ray_runner.reconfigure(config)
+
+    def start_daemon(self, include_failed=False) -> None:
+        self.ray_runner.start_daemon(include_failed)
+
+    def stop_daemon(self) -> None:
+        self.ray_runner.stop_daemon()
+
+    def run_background_workflows(self) -> None:
+        self.ray_runner.run_background_workflows()
+
+    def prefetch_tools(self, tools: Sequence[ToolModel]) -> None:
+        self.ray_runner.prefetch_tools([tool for tool in tools if not self.local_runner.has_tool(tool)])
+
+    async def list_workflows(
+        self,
+        status: str | None = None,
+        agent: str | None = None,
+        plan_hash: str | None = None,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> WorkflowPage:
+        return await self.ray_runner.list_workflows(
+            status=status, agent=agent, plan_hash=plan_hash, limit=limit, cursor=cursor
+        )
+
+    def select_runner(self, dag_spec: Workflow) -> abc.AbstractWorkflowRunner:
+        if len(dag_spec.steps) <= self.config.WORKFLOW_LOCAL_MAX_STEPS and self.local_runner.can_run(dag_spec):
+            return self.local_runner
+        return self.ray_runner
+
+    async def run(self, dag_spec: Workflow, context: Any = None, async_mode=False) -> Any:
+        runner = self.select_runner(dag_spec)
+        logger.debug(f"Running workflow {dag_spec.id} with {type(runner).__name__}")
+        return await runner.run(dag_spec, context, async_mode=async_mode)
+
+
+def local_runner(config: BasicWorkflowConfig) -> LocalWorkflowRunner:
+    return LocalWorkflowRunner(config)
+
+
+def hybrid_runner(config: BasicWorkflowConfig) -> HybridWorkflowRunner:
+    return HybridWorkflowRunner(config)
@@ -1,5 +1,45 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+from pantheon_sdk.agents.const import StrEnumMixIn
+from pantheon_sdk.agents.orchestration.cron import CronSchedule
+
+
+class CheckpointPolicy(StrEnumMixIn):
+    """Which workflow steps persist their results to workflow storage."""
+
+    NONE = "none"  # nothing is checkpointed, the workflow cannot be resumed
+    FINAL = "final"  # only the steps producing the workflow result
+    ALL = "all"  # every step, the workflow resumes from the last finished step
 
 
 class WorkflowSettings(BaseModel):
+    """Settings of a background workflow.
+
+    Without `interval` or `cron` the workflow runs once per deployment of the agent, when the daemon starts.
+    """
+
     enabled: bool = True
+    interval: float | None = Field(default=None, gt=0, description="Seconds between runs")
+    cron: str | None = Field(default=None, description="Five-field cron expression, evaluated in UTC")
+    jitter: float = Field(default=0.0, ge=0, description="Random delay of up to this many seconds per run")
+    allow_overlap: bool = Field(default=False, description="Start a run while the previous one is still running")
+
+    @field_validator("cron")
+    @classmethod
+    def validate_cron(cls, v: str | None) -> str | None:
+        if v is not None:
+            CronSchedule(v)
+        return v
+
+    @model_validator(mode="after")
+    def validate_schedule(self) -> "WorkflowSettings":
+        if self.interval is not None and self.cron is not None:
+            raise ValueError("Set either interval or cron, not both")
+        return self
+
+
+class StepCacheSettings(BaseModel):
+    """Result caching for one tool. Only enable it for tools whose result depends on their inputs alone."""
+
+    ttl: float = 300.0  # seconds a cached result is reused
+    deterministic: bool = False  # results of deterministic tools never expire
@@ -0,0 +1,182 @@
+"""Pool of warm tool workers.
+
+Without the pool every workflow step carries `RuntimeEnv(pip=[...])`, so a cold node installs the
+tool package before the step can start. With the pool each tool package/version gets long-lived
+worker actors whose runtime env is built once and reused by all steps calling that tool.
+
+The pool itself is a named, detached actor shared by every runner in the Ray namespace.
+"""
+
+import time
+import uuid
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+import ray
+from loguru import logger
+from ray.actor import ActorHandle
+from ray.runtime_env import RuntimeEnv
+
+from pantheon_sdk.agents.models import ToolModel
+from pantheon_sdk.agents.orchestration.utils import load_tool_entrypoint, patched_environ
+
+TOOL_WORKER_POOL_NAME = "pantheon-tool-worker-pool"
+
+
+@ray.remote
+class ToolWorker:
+    """Worker actor with one tool package installed in its runtime env."""
+
+    def __init__(self, package_name: str):
+        self.package_name = package_name
+        self._function = None
+
+    def _load(self):
+        if self._function is None:
+            tool = load_tool_entrypoint(self.package_name)
+            # Tools are exported as Ray remote functions; the worker calls the plain function.
+            self._function = getattr(tool, "_function", tool)
+        return self._function
+
+    def warm_up(self) -> bool:
+        self._load()
+        return True
+
+    def run(self, kwargs: dict[str, Any], env_vars: dict[str, Any]) -> Any:
+        function = self._load()
+        with patched_environ(env_vars):
+            return function(**kwargs)
+
+
+@dataclass
+class _WorkerSlot:
+    handle: ActorHandle
+    worker_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    in_flight: int = 0
+    last_used: float = field(default_factory=time.monotonic)
+
+
+@ray.remote
+class ToolWorkerPool:
+    """Hands out warm `ToolWorker` actors keyed by pip requirement (`package==version`).
+
+    Idle workers are reused first; a new worker is started while a tool has fewer than `max_size`
+    workers, otherwise the least loaded one is shared. Workers idle for longer than `idle_timeout`
+    are evicted down to `min_size`, and a tool that has been idle that long is dropped entirely.
+    """
+
+    def __init__(self, min_size: int, max_size: int, idle_timeout: float):
+        self.min_size = min_size
+        self.max_size = max(max_size, 1)
+        self.idle_timeout = idle_timeout
+        self._workers: dict[str, list[_WorkerSlot]] = {}
+
+    def _spawn(self, requirement: str, package_name: str) -> _WorkerSlot:
+        logger.info(f"Starting tool worker for {requirement}")
+        handle = ToolWorker.options(runtime_env=RuntimeEnv(pip=[requirement])).remote(package_name)
+        slot = _WorkerSlot(handle=handle)
+        self._workers.setdefault(requirement, []).append(slot)
+        return slot
+
+    def _evict_idle(self) -> None:
+        now = time.monotonic()
+        for requirement, slots in list(self._workers.items()):
+            idle = [slot for slot in slots if slot.in_flight == 0 and now - slot.last_used > self.idle_timeout]
+            keep = 0 if len(idle) == len(slots) else self.min_size
+            for slot in idle[: max(len(slots) - keep, 0)]:
+                logger.info(f"Evicting idle tool worker {slot.worker_id} for {requirement}")
+                ray.kill(slot.handle)
+                slots.remove(slot)
+            if not slots:
+                del self._workers[requirement]
+
+    def acquire(self, requirement: str, package_name: str) -> tuple[str, ActorHandle]:
+        self._evict_idle()
+        slots = self._workers.get(requirement, [])
+
+        slot = next((slot for slot in slots if slot.in_flight == 0), None)
+        if slot is None and len(slots) < self.max_size:
+            slot = self._spawn(requirement, package_name)
+        if slot is None:
+            slot = min(slots, key=lambda s: s.in_flight)
+
+        slot.in_flight += 1
+        slot.last_used = time.monotonic()
+        return slot.worker_id, slot.handle
+
+    def release(self, requirement: str, worker_id: str) -> None:
+        for slot in self._workers.get(requirement, []):
+            if slot.worker_id == worker_id:
+                slot.in_flight = max(slot.in_flight - 1, 0)
+                slot.last_used = time.monotonic()
+                return
+
+    def discard(self, requirement: str, worker_id: str) -> None:
+        """Drop a worker that died so it is not handed out again."""
+        slots = self._workers.get(requirement, [])
+        self._workers[requirement] = [slot for slot in slots if slot.worker_id != worker_id]
+
+    def prefetch(self, tools: Sequence[tuple[str, str]]) -> None:
+        """Make sure `min_size` workers are running (and have loaded the tool) for each tool."""
+        self._evict_idle()
+        for requirement, package_name in tools:
+            slots = self._workers.get(requirement, [])
+            for _ in range(self.min_size - len(slots)):
+                self._spawn(requirement, package_name).handle.warm_up.remote()
+            for slot in self._workers.get(requirement, []):
+                slot.last_used = time.monotonic()
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        return {
+            requirement: {"workers": len(slots), "busy": sum(1 for slot in slots if slot.in_flight)}
+            for requirement, slots in self._workers.items()
+        }
+
+    def shutdown(self) -> None:
+        for slots in self._workers.values():
+            for slot in slots:
+                ray.kill(slot.handle)
+        self._workers.clear()
+
+
+def get_tool_worker_pool(min_size: int, max_size: int, idle_timeout: float) -> ActorHandle:
+    """Return the shared pool actor, creating it on first use.
+
+    The sizing arguments only apply when the pool is created.
+    """
+    return ToolWorkerPool.options(name=TOOL_WORKER_POOL_NAME, lifetime="detached", get_if_exists=True).remote(
+        min_size, max_size, idle_timeout
+    )
+
+
+def tool_pool_key(tool: ToolModel) -> tuple[str, str]:
+    return tool.render_pip_dependency(), tool.package_name
+
+
+def run_on_tool_worker(
+    pool: ActorHandle,
+    tool_key: tuple[str, str],
+    kwargs: dict[str, Any],
+    env_vars: dict[str, Any],
+    timeout: float | None = None,
+) -> Any:
+    """Run a tool call on a pooled worker, returning the worker to the pool afterwards.
+
+    A call still running after `timeout` seconds cannot be interrupted inside the actor, so the
+    worker is killed and dropped from the pool.
+    """
+    requirement, package_name = tool_key
+    worker_id, worker = ray.get(pool.acquire.remote(requirement, package_name))
+    try:
+        return ray.get(worker.run.remote(kwargs, env_vars), timeout=timeout)
+    except ray.exceptions.GetTimeoutError:
+        logger.warning(f"Tool call on {requirement} timed out after {timeout:.1f}s, killing worker {worker_id}")
+        ray.kill(worker)
+        pool.discard.remote(requirement, worker_id)
+        raise
+    except ray.exceptions.RayActorError:
+        pool.discard.remote(requirement, worker_id)
+        raise
+    finally:
+        pool.release.remote(requirement, worker_id)
@@ -1,27 +1,107 @@
+import asyncio
+import time
 import uuid
+from collections.abc import Callable, Sequence
 from typing import Any
 
 import ray
+from loguru import logger
 from ray import workflow
 from ray.runtime_env import RuntimeEnv
+from ray.workflow.common import WorkflowStatus
 
 from pantheon_sdk.agents import abc
-from pantheon_sdk.agents.const import EntrypointGroup
-from pantheon_sdk.agents.models import Workflow, WorkflowStep
+from pantheon_sdk.agents.cache import TTLCache
+from pantheon_sdk.agents.deadline import (
+    DEADLINE_ENV_VAR,
+    DeadlineExceededError,
+    deadline_passed,
+    earliest,
+    get_deadline,
+    time_left,
+)
+from pantheon_sdk.agents.models import ToolModel, Workflow, WorkflowStep
+from pantheon_sdk.agents.orchestration.catalog import get_workflow_catalog
 from pantheon_sdk.agents.orchestration.config import BasicWorkflowConfig
-from pantheon_sdk.agents.orchestration.utils import get_workflows_from_files
-from pantheon_sdk.agents.utils import get_entry_points
+from pantheon_sdk.agents.orchestration.dag import (
+    build_dependency_graph,
+    find_sinks,
+    link_implicit_inputs,
+    resolve_references,
+    topological_order,
+)
+from pantheon_sdk.agents.orchestration.index import (
+    SharedWorkflowIndex,
+    WorkflowIndex,
+    WorkflowIndexEntry,
+    WorkflowPage,
+    create_workflow_index,
+)
+from pantheon_sdk.agents.orchestration.models import CheckpointPolicy, WorkflowSettings
+from pantheon_sdk.agents.orchestration.pool import get_tool_worker_pool, run_on_tool_worker, tool_pool_key
+from pantheon_sdk.agents.orchestration.scheduler import SCHEDULER_LEASE_NAME, RayLease, WorkflowScheduler
+from pantheon_sdk.agents.orchestration.step_cache import call_memoized, get_step_cache_settings, step_result_cache_for
+from pantheon_sdk.agents.orchestration.utils import (
+    current_agent_name,
+    current_deployment_id,
+    load_tool_entrypoint,
+)
+from pantheon_sdk.agents.utils import hash_payload
 
 
 @ray.remote
-def generate_request_id() -> str:
-    # Generate a unique idempotency token.
-    return uuid.uuid4().hex
+def collect_final_result(*results: Any) -> Any:
+    # Depending on every sink makes Ray run all branches; the last sink is the final step.
+    return results[-1]
+
+
+def call_with_limits(remote_function, kwargs: dict[str, Any], limits: dict[str, float | None]) -> Any:
+    """Run the tool as a child task and force-cancel it once the step timeout or deadline passes."""
+    timeout = time_left(limits["deadline"], limits["timeout"])
+    ref = remote_function.remote(**kwargs)
+    try:
+        return ray.get(ref, timeout=timeout)
+    except ray.exceptions.GetTimeoutError as e:
+        ray.cancel(ref, force=True)
+        if deadline_passed(limits["deadline"]):
+            raise DeadlineExceededError("Workflow deadline exceeded") from e
+        raise TimeoutError(f"Step timed out after {timeout:.1f}s") from e
+
+
+def call_with_retries(call: Callable[[], Any], limits: dict[str, float | None], max_retries: int) -> Any:
+    """Retry a failing call of a step with limits, except on timeouts and once the deadline has passed.
+
+    Ray Workflows retries every application error of a step with `retry_exceptions`, which would
+    give a timed-out step a fresh timeout on each attempt, so steps with limits retry here instead.
+    """
+    attempt = 0
+    while True:
+        try:
+            return call()
+        except TimeoutError:  # also step timeouts, `DeadlineExceededError` and `GetTimeoutError`
+            raise
+        except Exception:
+            if attempt >= max_retries or deadline_passed(limits["deadline"]):
+                raise
+            attempt += 1
+            logger.warning(f"Step call failed, retrying ({attempt}/{max_retries})")
 
 
 class DAGRunner(abc.AbstractWorkflowRunner):
-    def __init__(self, config: BasicWorkflowConfig):
+    def __init__(self, config: BasicWorkflowConfig, index: WorkflowIndex | SharedWorkflowIndex | None = None):
         self.config = config
+        self.index = index if index is not None else create_workflow_index(config)
+        self._index_reconciled_at: float | None = None
+        self._index_reconciliation: asyncio.Task | None = None
+        # Workflows whose metadata was already read: they are in the index, or too old to stay in it.
+        self._reconciled_ids: set[str] = set()
+        self._scheduler: WorkflowScheduler | None = None
+        self._pool = None
+        # Remote step functions only depend on the tool and its env vars, so they are compiled once
+        # and reused by every workflow calling the same tool.
+        self._compiled_steps: TTLCache[ray.remote_function.RemoteFunction] = TTLCache(
+            maxsize=config.WORKFLOW_COMPILED_STEP_CACHE_SIZE
+        )
 
     def reconfigure(self, config: dict[str, Any]) -> None:
         """Reconfigure the agent with new settings.
@@ -31,94 +111,380 @@ class DAGRunner(abc.AbstractWorkflowRunner):
 
         """
         self.config = BasicWorkflowConfig(**config)
+        self._compiled_steps = TTLCache(maxsize=self.config.WORKFLOW_COMPILED_STEP_CACHE_SIZE)
 
-    @classmethod
-    def start_daemon(cls: "DAGRunner", include_failed=False) -> None:
-        pass  # Ensure the method is not empty if all lines are commented
+    @property
+    def scheduler(self) -> WorkflowScheduler:
+        if self._scheduler is None:
+            self._scheduler = WorkflowScheduler(
+                submit=self._submit_background,
+                source=self._background_workflows,
+                is_done=lambda handle: handle[1] is None or bool(ray.wait([handle[1]], timeout=0)[0]),
+                cancel=lambda handle: self.cancel(handle[0]),
+                lease=RayLease(
+                    f"{SCHEDULER_LEASE_NAME}:{current_agent_name() or 'default'}",
+                    ttl=self.config.WORKFLOW_SCHEDULER_LEASE_TTL,
+                ),
+                deployment_id=current_deployment_id,
+                max_concurrency=self.config.WORKFLOW_SCHEDULER_MAX_CONCURRENCY,
+                tick=self.config.WORKFLOW_SCHEDULER_TICK,
+                drain_timeout=self.config.WORKFLOW_SCHEDULER_DRAIN_TIMEOUT,
+            )
+        return self._scheduler
 
-    @classmethod
-    def stop_daemon(cls: "DAGRunner") -> None:
-        #  TODO(team): Stop all workflows  # https://github.com/project/issues/124
-        pass
+    def start_daemon(self, include_failed=False) -> None:
+        """Start the background workflow scheduler."""
+        self.scheduler.start()
+
+    def stop_daemon(self) -> None:
+        """Stop scheduling background workflows and drain the running ones."""
+        if self._scheduler is not None:
+            self._scheduler.stop()
+
+    def cancel(self, workflow_id: str) -> None:
+        """Cancel a running workflow; Ray stops its in-flight steps."""
+        try:
+            workflow.cancel(workflow_id)
+        finally:
+            self.index.update_status(workflow_id, WorkflowStatus.CANCELED.value)
+
+    def _submit_background(self, dag_spec: Workflow) -> tuple[str, ray.ObjectRef] | None:
+        """Start a background run; returns None for an empty plan, which has nothing to wait for."""
+        ref = self.submit(dag_spec, async_mode=True)
+        return None if ref is None else (dag_spec.id, ref)
+
+    def _background_workflows(self) -> list[tuple[Workflow, WorkflowSettings]]:
+        """Return the enabled static workflows with their settings, read from the workflow catalog."""
+        wfs = get_workflow_catalog(self.config.WORKFLOW_CATALOG_REFRESH_INTERVAL).workflows()
+        return [
+            (wf, self.config.WORKFLOWS_TO_RUN[wf_id])
+            for wf_id, wf in wfs.items()
+            if wf_id in self.config.WORKFLOWS_TO_RUN and self.config.WORKFLOWS_TO_RUN[wf_id].enabled
+        ]
 
     def run_background_workflows(
         self,
     ) -> None:
-        """Run static workflows in the workflow runner engine."""
-        wfs = get_workflows_from_files()
+        """Schedule the enabled static workflows and make sure the scheduler is running.
+
+        The scheduler keeps polling the workflow catalog, so edited, added and removed workflow
+        files are picked up without a restart.
+        """
+        self.scheduler.refresh()
+        self.start_daemon()
+
+    def _schedule_index_reconciliation(self) -> None:
+        """Start a background sync of the index with Ray storage every `WORKFLOW_INDEX_RECONCILE_INTERVAL` seconds."""
+        now = time.monotonic()
+        if (
+            self._index_reconciled_at is not None
+            and now - self._index_reconciled_at < self.config.WORKFLOW_INDEX_RECONCILE_INTERVAL
+        ) or (self._index_reconciliation is not None and not self._index_reconciliation.done()):
+            return
+        self._index_reconciled_at = now
+        self._index_reconciliation = asyncio.create_task(asyncio.to_thread(self._reconcile_index))
+
+    def _reconcile_index(self) -> None:
+        """Sync the index with Ray storage.
+
+        Workflows missing from the index (started before the index existed, or recorded by a
+        replica whose update was lost) are added from their metadata, and statuses that changed in
+        storage (e.g. a workflow resumed elsewhere) are updated. The metadata of a workflow is read
+        at most once per runner, so workflows too old to stay in a full index are not read again.
+        """
+        try:
+            stored = {wf_id: str(wf_status.value) for wf_id, wf_status in workflow.list_all()}
+            indexed = self.index.statuses(stored)
+            for wf_id, wf_status in stored.items():
+                if wf_id in indexed:
+                    if indexed[wf_id] != wf_status:
+                        self.index.update_status(wf_id, wf_status)
+                elif wf_id not in self._reconciled_ids:
+                    self.index.add(self._entry_from_storage(wf_id, wf_status))
+                    self._reconciled_ids.add(wf_id)
+            self._reconciled_ids.intersection_update(stored)
+        except Exception as e:
+            logger.warning(f"Failed to reconcile the workflow index with Ray storage: {e}")
+
+    @staticmethod
+    def _entry_from_storage(workflow_id: str, status: str) -> WorkflowIndexEntry:
+        try:
+            metadata = workflow.get_metadata(workflow_id)
+        except Exception as e:
+            logger.warning(f"Failed to read the metadata of workflow {workflow_id}: {e}")
+            metadata = {}
+        user_metadata = metadata.get("user_metadata", {})
+        start_time = metadata.get("stats", {}).get("start_time") or 0.0
+        return WorkflowIndexEntry(
+            workflow_id=workflow_id,
+            status=status,
+            created_at=start_time,
+            updated_at=metadata.get("stats", {}).get("end_time") or start_time,
+            name=user_metadata.get("plan", {}).get("name"),
+            plan_hash=user_metadata.get("plan_hash"),
+            agent=user_metadata.get("agent"),
+            runner="ray",
+        )
+
+    def _refresh_running(self) -> None:
+        for wf_id in self.index.find(WorkflowStatus.RUNNING.value, runner="ray"):
+            self.index.update_status(wf_id, str(workflow.get_status(wf_id).value))
+
+    def _list_indexed(self, **filters: Any) -> WorkflowPage:
+        self._refresh_running()
+        return self.index.list(**filters)
+
+    async def list_workflows(
+        self,
+        status: str | None = None,
+        agent: str | None = None,
+        plan_hash: str | None = None,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> WorkflowPage:
+        """List workflows from the index, newest first.
+
+        Only the statuses of workflows still running are read from Ray storage, off the event loop;
+        the whole index is reconciled with storage periodically in the background.
+        """
+        self._schedule_index_reconciliation()
+        return await asyncio.to_thread(
+            self._list_indexed, status=status, agent=agent, plan_hash=plan_hash, limit=limit, cursor=cursor
+        )
 
-        for _, wf_dict in wfs.items():
-            wf = Workflow(**wf_dict)
-            if wf.id in self.config.WORKFLOWS_TO_RUN and self.config.WORKFLOWS_TO_RUN[wf.id].enabled:
-                self.run(wf, async_mode=True)
+    def _tool_worker_pool(self):
+        # Looking the actor up is a round trip to the GCS, so the handle is kept.
+        if self._pool is None:
+            self._pool = get_tool_worker_pool(
+                min_size=self.config.WORKFLOW_TOOL_POOL_MIN_SIZE,
+                max_size=self.config.WORKFLOW_TOOL_POOL_MAX_SIZE,
+                idle_timeout=self.config.WORKFLOW_TOOL_POOL_IDLE_TIMEOUT,
+            )
+        return self._pool
+
+    def prefetch_tools(self, tools: Sequence[ToolModel]) -> None:
+        """Warm pool workers for the tools a plan may use, without waiting for them."""
+        if not self.config.WORKFLOW_TOOL_POOL_ENABLED or not tools:
+            return
+        self._tool_worker_pool().prefetch.remote(list(dict.fromkeys(tool_pool_key(tool) for tool in tools)))
+
+    def checkpoint_policy(self, dag_spec: Workflow) -> CheckpointPolicy:
+        return dag_spec.checkpoint_policy or self.config.WORKFLOW_CHECKPOINT_POLICY
+
+    def should_checkpoint(self, step: WorkflowStep, policy: CheckpointPolicy, sinks: Sequence[str]) -> bool:
+        """Decide whether a step persists its result; an explicit `step.checkpoint` wins over the policy."""
+        if step.checkpoint is not None:
+            return step.checkpoint
+        if policy == CheckpointPolicy.FINAL:
+            return step.name in sinks
+        return policy == CheckpointPolicy.ALL
 
-    async def list_workflows(self, status: str | None = None):
-        wf_dict = {}
-        for wf_id, _ in workflow.list_all(status):
-            wf_dict[wf_id] = workflow.get_metadata(wf_id)
-        return wf_dict
+    def workflow_deadline(self, dag_spec: Workflow) -> float | None:
+        """Return the earlier of the request deadline and the end of the workflow timeout."""
+        timeout = dag_spec.timeout or self.config.WORKFLOW_TIMEOUT
+        return earliest(get_deadline(), time.time() + timeout if timeout else None)
+
+    def step_limits(self, step: WorkflowStep, deadline: float | None) -> dict[str, float | None] | None:
+        timeout = step.timeout or self.config.WORKFLOW_STEP_TIMEOUT
+        if timeout is None and deadline is None:
+            return None
+        return {"timeout": timeout, "deadline": deadline}
+
+    def create_step(self, step: WorkflowStep, checkpoint: bool = True):
+        """Return the remote function for a step and the arguments to bind it with."""
+        key = (
+            step.tool.package_name,
+            step.tool.version,
+            hash_payload(step.env_vars),
+            checkpoint,
+            self.config.WORKFLOW_TOOL_POOL_ENABLED,
+            self.config.WORKFLOW_STEP_MAX_RETRIES,
+        )
+        compiled = self._compiled_steps.get(key)
+        if compiled is None:
+            compiled = self.compile_step(step.tool, step.env_vars, checkpoint)
+            self._compiled_steps.set(key, compiled)
+        return compiled, step.args
 
-    def create_step(self, step: WorkflowStep):
-        """Create a remote function for a step."""
-        runtime_env = RuntimeEnv(pip=[step.tool.render_pip_dependency()], env_vars=step.env_vars)
+    def compile_step(self, tool: ToolModel, env_vars: dict[str, Any], checkpoint: bool = True):
+        """Create a remote function running the tool with the given env vars."""
+        if self.config.WORKFLOW_TOOL_POOL_ENABLED:
+            return self.compile_pooled_step(tool, env_vars, checkpoint)
 
-        @ray.workflow.options(checkpoint=True)
+        package_name, version = tool.package_name, tool.version
+        runtime_env = RuntimeEnv(pip=[tool.render_pip_dependency()], env_vars=env_vars)
+        tool_runtime_env = RuntimeEnv(env_vars=env_vars)
+        cache_settings = get_step_cache_settings(self.config, tool)
+        config = self.config
+        max_retries = self.config.WORKFLOW_STEP_MAX_RETRIES
+
+        @ray.workflow.options(checkpoint=checkpoint)
         @ray.remote(
             runtime_env=runtime_env,
-            max_retries=self.config.WORKFLOW_STEP_MAX_RETRIES,
+            max_retries=max_retries,
             retry_exceptions=True,
         )
-        def get_tool_entrypoint_wrapper(*args, **kwargs):
-            entry_points = get_entry_points(EntrypointGroup.TOOL_ENTRYPOINT)
-            try:
-                tool = entry_points[step.tool.package_name].load()
-            except KeyError as exc:
-                raise ValueError(f"Tool {step.tool.package_name} not found in entry points") from exc
-            return workflow.continuation(
-                tool.options(runtime_env=RuntimeEnv(env_vars=step.env_vars)).bind(*args, **kwargs)
-            )
+        def get_tool_entrypoint_wrapper(step_args: dict[str, Any], limits: dict | None, /, **upstream_results):
+            entrypoint = load_tool_entrypoint(package_name, version)
+            kwargs = resolve_references(step_args, upstream_results)
+            if cache_settings is None and limits is None:
+                return workflow.continuation(entrypoint.options(runtime_env=tool_runtime_env).bind(**kwargs))
+
+            # The tool runs as a child task with its own resource options; this step waits on it, so
+            # it can be cancelled in time and its result can be stored.
+            remote_function = entrypoint.options(runtime_env=tool_runtime_env)
+            if limits is not None:
+                call = lambda: call_with_retries(  # noqa: E731
+                    lambda: call_with_limits(remote_function, kwargs, limits), limits, max_retries
+                )
+            else:
+                call = lambda: ray.get(remote_function.remote(**kwargs))  # noqa: E731
+            if cache_settings is None:
+                return call()
+            return call_memoized(step_result_cache_for(config), cache_settings, tool, env_vars, kwargs, call)
+
+        return get_tool_entrypoint_wrapper
+
+    def compile_pooled_step(self, tool: ToolModel, env_vars: dict[str, Any], checkpoint: bool = True):
+        """Create a lightweight remote function that runs the tool on a warm pool worker.
+
+        The step itself needs no runtime env, so it starts immediately; only the first call of a
+        tool on a cold pool pays for the package install.
+        """
+        pool = self._tool_worker_pool()
+        tool_key = tool_pool_key(tool)
+        cache_settings = get_step_cache_settings(self.config, tool)
+        config = self.config
+        max_retries = self.config.WORKFLOW_STEP_MAX_RETRIES
+
+        @ray.workflow.options(checkpoint=checkpoint)
+        @ray.remote(max_retries=max_retries, retry_exceptions=True)
+        def run_pooled_tool(step_args: dict[str, Any], limits: dict | None, /, **upstream_results):
+            kwargs = resolve_references(step_args, upstream_results)
+            if limits is None:
+                call = lambda: run_on_tool_worker(pool, tool_key, kwargs, env_vars)  # noqa: E731
+            else:
+                worker_env_vars = env_vars
+                if limits["deadline"] is not None:
+                    worker_env_vars = {**env_vars, DEADLINE_ENV_VAR: repr(limits["deadline"])}
+                call = lambda: call_with_retries(  # noqa: E731
+                    lambda: run_on_tool_worker(
+                        pool,
+                        tool_key,
+                        kwargs,
+                        worker_env_vars,
+                        timeout=time_left(limits["deadline"], limits["timeout"]),
+                    ),
+                    limits,
+                    max_retries,
+                )
+            return call_memoized(step_result_cache_for(config), cache_settings, tool, env_vars, kwargs, call)
 
-        return get_tool_entrypoint_wrapper, step.args
+        return run_pooled_tool
 
     async def run(self, dag_spec: Workflow, context: Any = None, async_mode=False) -> Any:
-        """Run the DAG using Ray Workflows."""
-        # Create remote functions for each step
-        steps = {}
+        """Run the workflow and wait for its result without blocking the event loop.
 
-        for step in dag_spec.steps:
-            steps[step.task_id] = self.create_step(step)
-        last_task_id = step.task_id
+        The workflow is cancelled when its deadline passes or when the caller is cancelled (e.g.
+        the client disconnected).
+        """
+        if async_mode:
+            return self.submit(dag_spec, async_mode=True)
 
-        @ray.remote
-        def workflow_executor(request_id: str) -> Any:
-            step_results = {}
+        deadline = self.workflow_deadline(dag_spec)
+        ref = self.submit(dag_spec, async_mode=True, deadline=deadline)
+        if ref is None:
+            return None
+        try:
+            result = await asyncio.wait_for(ref, timeout=time_left(deadline))
+        except asyncio.CancelledError:
+            self.cancel(dag_spec.id)
+            raise
+        except Exception as e:
+            if isinstance(e, asyncio.TimeoutError | TimeoutError) and deadline_passed(deadline):
+                self.cancel(dag_spec.id)
+                raise DeadlineExceededError(f"Workflow {dag_spec.id} did not finish before its deadline") from e
+            self.index.update_status(dag_spec.id, WorkflowStatus.FAILED.value)
+            raise
+        self.index.update_status(dag_spec.id, WorkflowStatus.SUCCESSFUL.value)
+        return result
 
-            # Execute steps in order, handling dependencies
-            for task_id, (task, task_args) in sorted(steps.items()):
-                # Execute step with dependencies
-                result = task.bind(**task_args)
+    def submit(self, dag_spec: Workflow, async_mode=False, deadline: float | None = None) -> Any:
+        """Run the DAG using Ray Workflows.
 
-                # Store result for dependencies
-                step_results[task_id] = result
+        Steps are bound in dependency order and receive the results of the steps they depend on,
+        so Ray executes independent steps concurrently. Which steps are checkpointed follows the
+        workflow's checkpoint policy. Every step is bounded by its timeout and by the workflow
+        deadline (`workflow_deadline` when not given).
+        """
+        deadline = deadline or self.workflow_deadline(dag_spec)
+        time_left(deadline)  # fail fast when the deadline has already passed
+        dag_spec = link_implicit_inputs(dag_spec)
+        graph = build_dependency_graph(dag_spec)
+        order = topological_order(dag_spec)
+        sinks = find_sinks(dag_spec)
+        policy = self.checkpoint_policy(dag_spec)
+
+        if not order:
+            return None
 
-                # If this is the last step, return its result
-                if task_id == last_task_id:
-                    return workflow.continuation(result)
+        # Bind the steps in dependency order; every step receives the results of its dependencies.
+        nodes = {}
+        for step in order:
+            task, task_args = self.create_step(step, checkpoint=self.should_checkpoint(step, policy, sinks))
+            limits = self.step_limits(step, deadline)
+            if limits is not None:
+                # Steps with limits retry their own errors (see `call_with_retries`); Ray only
+                # retries them on system failures.
+                task = task.options(retry_exceptions=False)
+            nodes[step.name] = task.bind(task_args, limits, **{dep: nodes[dep] for dep in graph[step.name]})
 
-            # Return the last result as a fallback
-            last_result = list(step_results.values())[-1] if step_results else None
-            return workflow.continuation(last_result)
+        if len(sinks) == 1:
+            final = nodes[sinks[0]]
+        else:
+            collect = collect_final_result.options(
+                **workflow.options(checkpoint=policy != CheckpointPolicy.NONE),
+            )
+            final = collect.bind(*[nodes[sink] for sink in sinks])
+
+        plan_hash = hash_payload(dag_spec.model_dump(mode="json", exclude={"id"}))
+        agent = current_agent_name()
+        self.index.add(
+            WorkflowIndexEntry(
+                workflow_id=dag_spec.id,
+                status=WorkflowStatus.RUNNING.value,
+                name=dag_spec.name,
+                plan_hash=plan_hash,
+                agent=agent,
+                runner="ray",
+            )
+        )
 
         # Start the workflow with options for durability
         func = workflow.run
         if async_mode:
             func = workflow.run_async
 
-        return func(
-            workflow_executor.bind(generate_request_id.bind()),
-            workflow_id=dag_spec.id,  # Unique ID for each workflow
-            metadata={"dag_spec": dag_spec.model_dump()},  # Store metadata for debugging
-        )
+        try:
+            result = func(
+                final,
+                workflow_id=dag_spec.id,  # Unique ID for each workflow
+                metadata={
+                    "request_id": uuid.uuid4().hex,  # Unique idempotency token
+                    # A compact reference instead of the whole plan keeps metadata writes small
+                    "plan": {"name": dag_spec.name, "steps": len(dag_spec.steps)},
+                    "plan_hash": plan_hash,
+                    "agent": agent,
+                    "checkpoint_policy": policy.value,
+                },
+            )
+        except Exception:
+            self.index.update_status(dag_spec.id, WorkflowStatus.FAILED.value)
+            raise
+
+        if not async_mode:
+            self.index.update_status(dag_spec.id, WorkflowStatus.SUCCESSFUL.value)
+        return result
 
 
 def dag_runner(config: BasicWorkflowConfig) -> DAGRunner:
@@ -0,0 +1,355 @@
+"""Background workflow scheduler.
+
+Every Serve replica runs the daemon, but only the replica holding the scheduler lease starts
+workflows, so background runs are not duplicated per replica. The lease lives in a named Ray
+actor and expires if the leader stops renewing it, letting another replica take over. The lease
+also records which one-shot workflows have run in the current deployment of the agent, so a new
+leader does not start them again until the agent is redeployed.
+"""
+
+import random
+import threading
+import time
+import uuid
+from collections.abc import Callable, Sequence
+from datetime import datetime, timezone
+from typing import Any, Protocol
+
+import ray
+from loguru import logger
+
+from pantheon_sdk.agents.models import Workflow
+from pantheon_sdk.agents.orchestration.cron import CronSchedule
+from pantheon_sdk.agents.orchestration.models import WorkflowSettings
+from pantheon_sdk.agents.utils import hash_payload
+
+SCHEDULER_LEASE_NAME = "pantheon-workflow-scheduler-lease"
+
+
+class Lease(Protocol):
+    def acquire(self) -> bool: ...
+
+    def release(self) -> None: ...
+
+    def is_complete(self, key: str) -> bool: ...
+
+    def complete(self, key: str) -> None: ...
+
+
+class LocalLease:
+    """Lease for a single process; always held."""
+
+    def __init__(self):
+        self.completed: set[str] = set()
+
+    def acquire(self) -> bool:
+        return True
+
+    def release(self) -> None:
+        pass
+
+    def is_complete(self, key: str) -> bool:
+        return key in self.completed
+
+    def complete(self, key: str) -> None:
+        self.completed.add(key)
+
+
+@ray.remote
+class SchedulerLeaseActor:
+    def __init__(self):
+        self.holder: str | None = None
+        self.expires_at = 0.0
+        self.completed: set[str] = set()
+
+    def acquire(self, holder: str, ttl: float) -> bool:
+        now = time.time()
+        if self.holder not in (None, holder) and now < self.expires_at:
+            return False
+        self.holder, self.expires_at = holder, now + ttl
+        return True
+
+    def release(self, holder: str) -> None:
+        if self.holder == holder:
+            self.holder, self.expires_at = None, 0.0
+
+    def is_complete(self, key: str) -> bool:
+        return key in self.completed
+
+    def complete(self, key: str) -> None:
+        self.completed.add(key)
+
+
+class RayLease:
+    """Leader lease shared by all replicas of an agent through a named, detached actor."""
+
+    def __init__(self, name: str, ttl: float):
+        self.name = name
+        self.ttl = ttl
+        self.holder = uuid.uuid4().hex
+        self._actor = None
+
+    @property
+    def actor(self):
+        if self._actor is None:
+            self._actor = SchedulerLeaseActor.options(name=self.name, lifetime="detached", get_if_exists=True).remote()
+        return self._actor
+
+    def acquire(self) -> bool:
+        try:
+            return ray.get(self.actor.acquire.remote(self.holder, self.ttl))
+        except Exception as e:
+            logger.warning(f"Failed to renew scheduler lease {self.name}: {e}")
+            return False
+
+    def release(self) -> None:
+        try:
+            ray.get(self.actor.release.remote(self.holder))
+        except Exception as e:
+            logger.warning(f"Failed to release scheduler lease {self.name}: {e}")
+
+    def is_complete(self, key: str) -> bool:
+        return ray.get(self.actor.is_complete.remote(key))
+
+    def complete(self, key: str) -> None:
+        ray.get(self.actor.complete.remote(key))
+
+
+class ScheduledWorkflow:
+    def __init__(self, workflow: Workflow, settings: WorkflowSettings):
+        self.workflow = workflow
+        self.settings = settings
+        self.cron = CronSchedule(settings.cron) if settings.cron else None
+        self.next_run: float | None = None
+        self.in_flight: list[Any] = []
+
+    @property
+    def recurring(self) -> bool:
+        return self.settings.interval is not None or self.cron is not None
+
+    def completion_key(self, deployment: str) -> str:
+        """Key recording that a one-shot workflow has run in a deployment; a changed workflow runs again."""
+        return f"{deployment}:{self.workflow.id}:{hash_payload(self.workflow.model_dump(mode='json'))}"
+
+    def first_run(self, now: float) -> float:
+        if self.cron is not None:
+            return self._jitter(self._next_cron(now))
+        return self._jitter(now)
+
+    def following_run(self, now: float) -> float | None:
+        """Time of the run after the one due at `now`, or None for one-shot workflows."""
+        if self.settings.interval is not None:
+            return self._jitter(now + self.settings.interval)
+        if self.cron is not None:
+            return self._jitter(self._next_cron(now))
+        return None
+
+    def _next_cron(self, now: float) -> float:
+        return self.cron.next_after(datetime.fromtimestamp(now, tz=timezone.utc)).timestamp()
+
+    def _jitter(self, moment: float) -> float:
+        return moment + random.uniform(0, self.settings.jitter) if self.settings.jitter else moment  # noqa: S311
+
+
+class WorkflowScheduler:
+    """Starts background workflows on their interval or cron schedule.
+
+    - A run is skipped while the previous run of the same workflow is still going, unless the
+      workflow allows overlap.
+    - At most `max_concurrency` runs are in flight; due runs wait for a free slot.
+    - Every run gets its own workflow id, derived from the workflow id.
+    - One-shot workflows run once per deployment: a replica that becomes leader skips the ones
+      another leader has started since the agent was deployed. `deployment_id` returns the id of
+      the current deployment, or None outside one; then they run once per scheduler.
+    - `stop` waits up to `drain_timeout` for running workflows and cancels the rest.
+    """
+
+    def __init__(
+        self,
+        submit: Callable[[Workflow], Any],
+        is_done: Callable[[Any], bool],
+        source: Callable[[], Sequence[tuple[Workflow, WorkflowSettings]]] | None = None,
+        cancel: Callable[[Any], None] | None = None,
+        lease: Lease | None = None,
+        deployment_id: Callable[[], str | None] | None = None,
+        max_concurrency: int = 4,
+        tick: float = 1.0,
+        drain_timeout: float = 30.0,
+    ):
+        self.submit = submit
+        self.is_done = is_done
+        self.source = source
+        self.cancel = cancel
+        self.lease = lease or LocalLease()
+        self.deployment_id = deployment_id
+        self.max_concurrency = max_concurrency
+        self.tick = tick
+        self.drain_timeout = drain_timeout
+
+        self._workflows: dict[str, ScheduledWorkflow] = {}
+        self._source_workflows: list[tuple[Workflow, WorkflowSettings]] | None = None
+        self._lock = threading.RLock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._is_leader = False
+        self._deployment: str | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def schedule(self, workflows: Sequence[tuple[Workflow, WorkflowSettings]], now: float | None = None) -> None:
+        """Replace the set of scheduled workflows.
+
+        Runs already in flight are kept, and so is the next run of a workflow whose definition and
+        settings did not change.
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            previous = self._workflows
+            self._workflows = {}
+            for wf, settings in workflows:
+                if not settings.enabled:
+                    continue
+                scheduled = ScheduledWorkflow(wf, settings)
+                earlier = previous.get(wf.id)
+                if earlier is not None:
+                    scheduled.in_flight = earlier.in_flight
+                if earlier is not None and earlier.workflow == wf and earlier.settings == settings:
+                    scheduled.next_run = earlier.next_run
+                else:
+                    scheduled.next_run = scheduled.first_run(now)
+                self._workflows[wf.id] = scheduled
+
+    def refresh(self, now: float | None = None) -> bool:
+        """Reschedule from `source` if the workflows it returns changed; returns True if they did."""
+        if self.source is None:
+            return False
+        workflows = list(self.source())
+        if workflows == self._source_workflows:
+            return False
+        self._source_workflows = workflows
+        self.schedule(workflows, now=now)
+        return True
+
+    @property
+    def deployment(self) -> str:
+        """Id of the deployment one-shot runs are recorded for, looked up once."""
+        if self._deployment is None:
+            deployment = self.deployment_id() if self.deployment_id is not None else None
+            self._deployment = deployment or f"scheduler-{uuid.uuid4().hex}"
+        return self._deployment
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return sum(len(scheduled.in_flight) for scheduled in self._workflows.values())
+
+    def _reap(self) -> None:
+        for scheduled in self._workflows.values():
+            scheduled.in_flight = [handle for handle in scheduled.in_flight if not self.is_done(handle)]
+
+    def run_pending(self, now: float | None = None) -> list[str]:
+        """Start the runs that are due; returns the ids of the started workflow runs."""
+        now = time.time() if now is None else now
+        started: list[str] = []
+
+        leader = self.lease.acquire()
+        if leader != self._is_leader:
+            logger.info("Acquired the workflow scheduler lease" if leader else "Lost the workflow scheduler lease")
+            self._is_leader = leader
+        if not leader:
+            return started
+
+        with self._lock:
+            self._reap()
+            due = sorted(
+                (s for s in self._workflows.values() if s.next_run is not None and s.next_run <= now),
+                key=lambda s: s.next_run,
+            )
+            for scheduled in due:
+                if not scheduled.recurring:
+                    completed = self._completed(scheduled)
+                    if completed is None:
+                        continue  # stay due and check again on the next tick
+                    if completed:
+                        scheduled.next_run = None
+                        continue
+                if scheduled.in_flight and not scheduled.settings.allow_overlap:
+                    logger.info(f"Skipping run of {scheduled.workflow.id}: the previous run is still in progress")
+                    scheduled.next_run = scheduled.following_run(now)
+                    continue
+                if self.in_flight() >= self.max_concurrency:
+                    # Stay due and retry on the next tick.
+                    continue
+
+                run = scheduled.workflow.model_copy(
+                    update={"id": f"{scheduled.workflow.id}-{uuid.uuid4().hex[:8]}"}, deep=True
+                )
+                try:
+                    handle = self.submit(run)
+                except Exception as e:
+                    logger.error(f"Failed to start background workflow {scheduled.workflow.id}: {e}")
+                else:
+                    # An empty plan finishes on submission and leaves nothing to wait for.
+                    if handle is not None:
+                        scheduled.in_flight.append(handle)
+                    started.append(run.id)
+                    if not scheduled.recurring:
+                        self._complete(scheduled)
+                scheduled.next_run = scheduled.following_run(now)
+        return started
+
+    def _completed(self, scheduled: ScheduledWorkflow) -> bool | None:
+        """Whether the one-shot workflow has already run, or None if the lease could not tell."""
+        try:
+            return self.lease.is_complete(scheduled.completion_key(self.deployment))
+        except Exception as e:
+            logger.warning(f"Failed to check whether {scheduled.workflow.id} has run: {e}")
+            return None
+
+    def _complete(self, scheduled: ScheduledWorkflow) -> None:
+        try:
+            self.lease.complete(scheduled.completion_key(self.deployment))
+        except Exception as e:
+            logger.error(f"Failed to record the run of {scheduled.workflow.id}; another leader may run it again: {e}")
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.tick):
+            try:
+                self.refresh()
+                self.run_pending()
+            except Exception as e:
+                logger.exception(f"Workflow scheduler tick failed: {e}")
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="workflow-scheduler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop scheduling, wait for running workflows to finish and cancel the ones that do not."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+        deadline = time.monotonic() + self.drain_timeout
+        while self.in_flight() and time.monotonic() < deadline:
+            with self._lock:
+                self._reap()
+            time.sleep(min(self.tick, 0.1))
+
+        with self._lock:
+            self._reap()
+            for scheduled in self._workflows.values():
+                for handle in scheduled.in_flight:
+                    logger.warning(f"Cancelling background run of {scheduled.workflow.id} after drain timeout")
+                    if self.cancel is not None:
+                        self.cancel(handle)
+                scheduled.in_flight = []
+
+        if self._is_leader:
+            self.lease.release()
+            self._is_leader = False
@@ -0,0 +1,115 @@
+"""Content-addressed memoization of step results.
+
+A step result is keyed on the tool name and version, the step env vars and the resolved step
+arguments, so identical steps in different workflows share one execution. Results are kept in an
+in-memory tier per worker process and, optionally, in Redis shared by all workers. Caching is
+opt-in per tool (`BasicWorkflowConfig.WORKFLOW_STEP_CACHE_TOOLS`).
+"""
+
+import json
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Any
+
+from loguru import logger
+
+from pantheon_sdk.agents.cache import RedisCache, TTLCache
+from pantheon_sdk.agents.metrics import get_counter
+from pantheon_sdk.agents.models import ToolModel
+from pantheon_sdk.agents.orchestration.config import BasicWorkflowConfig
+from pantheon_sdk.agents.orchestration.models import StepCacheSettings
+from pantheon_sdk.agents.utils import hash_payload
+
+_MISS = object()
+
+_hits = get_counter("pantheon_step_cache_hits", "Step results served from the step cache", ("tool", "tier"))
+_misses = get_counter("pantheon_step_cache_misses", "Step results computed by running the tool", ("tool",))
+
+
+def step_cache_key(tool: ToolModel, env_vars: dict[str, Any], kwargs: dict[str, Any]) -> str:
+    return hash_payload({"tool": tool.name, "version": tool.version, "env_vars": env_vars, "args": kwargs})
+
+
+def get_step_cache_settings(config: BasicWorkflowConfig, tool: ToolModel) -> StepCacheSettings | None:
+    """Return the cache settings of a tool, or None when its results must not be cached."""
+    if not config.WORKFLOW_STEP_CACHE_ENABLED:
+        return None
+    return config.WORKFLOW_STEP_CACHE_TOOLS.get(tool.name)
+
+
+class StepResultCache:
+    def __init__(self, max_size: int = 1024, redis_url: str | None = None, redis_prefix: str = ""):
+        self._local: TTLCache[Any] = TTLCache(maxsize=max_size)
+        self._shared = RedisCache(redis_url, prefix=redis_prefix) if redis_url else None
+
+    def get(self, key: str, tool_name: str) -> Any:
+        """Return the cached result or `_MISS`."""
+        value = self._local.get(key, _MISS)
+        if value is not _MISS:
+            _hits.inc(tags={"tool": tool_name, "tier": "memory"})
+            return value
+
+        raw = self._shared.get(key) if self._shared is not None else None
+        if raw is not None:
+            try:
+                value, ttl = json.loads(raw)
+            except ValueError as e:
+                logger.warning(f"Discarding malformed step cache entry {key}: {e}")
+                return _MISS
+            self._local.set(key, value, ttl=ttl)
+            _hits.inc(tags={"tool": tool_name, "tier": "redis"})
+            return value
+
+        _misses.inc(tags={"tool": tool_name})
+        return _MISS
+
+    def set(self, key: str, value: Any, settings: StepCacheSettings) -> None:
+        ttl = None if settings.deterministic else settings.ttl
+        self._local.set(key, value, ttl=ttl)
+        if self._shared is None:
+            return
+        try:
+            raw = json.dumps([value, ttl])
+        except TypeError:
+            logger.debug(f"Step result for {key} is not JSON serializable, keeping it in memory only")
+            return
+        self._shared.set(key, raw, ttl=ttl)
+
+    def clear(self) -> None:
+        self._local.clear()
+
+
+@lru_cache
+def get_step_result_cache(max_size: int, redis_url: str | None, redis_prefix: str) -> StepResultCache:
+    """Return the step result cache of the current process."""
+    return StepResultCache(max_size=max_size, redis_url=redis_url, redis_prefix=redis_prefix)
+
+
+def step_result_cache_for(config: BasicWorkflowConfig) -> StepResultCache:
+    return get_step_result_cache(
+        config.WORKFLOW_STEP_CACHE_MAX_SIZE,
+        config.WORKFLOW_STEP_CACHE_REDIS_URL,
+        config.WORKFLOW_STEP_CACHE_REDIS_PREFIX,
+    )
+
+
+def call_memoized(
+    cache: StepResultCache,
+    settings: StepCacheSettings | None,
+    tool: ToolModel,
+    env_vars: dict[str, Any],
+    kwargs: dict[str, Any],
+    call: Callable[[], Any],
+) -> Any:
+    """Return the cached result of the step or run `call` and cache its result."""
+    if settings is None:
+        return call()
+
+    key = step_cache_key(tool, env_vars, kwargs)
+    value = cache.get(key, tool.name)
+    if value is not _MISS:
+        return value
+
+    value = call()
+    cache.set(key, value, settings)
+    return value
@@ -1,12 +1,26 @@
+import importlib
 import os
+import sys
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import lru_cache
 from typing import Any
 
 import yaml
 
+from pantheon_sdk.agents.cache import TTLCache
 from pantheon_sdk.agents.const import EntrypointGroup
-from pantheon_sdk.agents.utils import get_entrypoint
+from pantheon_sdk.agents.metrics import get_counter
+from pantheon_sdk.agents.utils import get_entry_points, get_entrypoint, hash_payload
 
+TOOL_CACHE_MAX_SIZE = 256
+# Tools resolved by this worker process, keyed by (package name, version, runtime env fingerprint).
+_tool_cache: TTLCache[Any] = TTLCache(maxsize=TOOL_CACHE_MAX_SIZE)
+_tool_cache_hits = get_counter("pantheon_tool_cache_hits", "Tool entrypoints served from the worker cache", ("tool",))
+_tool_cache_misses = get_counter("pantheon_tool_cache_misses", "Tool entrypoints resolved by scanning", ("tool",))
 
+
+@lru_cache
 def determine_workflow_path(workflows_dir="workflows") -> str:
     # always exists
     candidate = get_entrypoint(EntrypointGroup.AGENT_ENTRYPOINT)
@@ -16,36 +30,112 @@ def determine_workflow_path(workflows_dir="workflows") -> str:
     package_name = pkg_path.split(".")[0]
 
     # Get the package location on filesystem
-    package = __import__(package_name)
+    package = importlib.import_module(package_name)
     package_dir = str(package.__path__[0])
 
     return os.path.join(package_dir, workflows_dir)
 
 
-def get_workflow_files() -> list[str]:
-    workflow_dir = determine_workflow_path()
-    workflow_files = []
+def get_workflows_from_files() -> dict[str, dict[str, Any]]:
+    """Return the parsed workflow files by path, served from the workflow catalog."""
+    from pantheon_sdk.agents.orchestration.catalog import get_workflow_catalog
 
-    # Recursively find all yaml/yml files
-    for root, _, files in os.walk(workflow_dir):
-        for file in files:
-            if file.endswith((".yaml", ".yml")):
-                workflow_files.append(os.path.join(root, file))
+    return get_workflow_catalog().raw_workflows()
 
-    return workflow_files
 
+def parse_workflow_file(wf_file) -> dict[str, Any]:
+    with open(wf_file) as f:
+        return yaml.safe_load(f)
 
-def get_workflows_from_files() -> dict[str, dict[str, Any]]:
-    wf_dict = {}
-    for wf in get_workflow_files():
-        try:
-            wf_dict[wf] = parse_workflow_file(wf)
-        except Exception as e:
-            print("Failed to load workflow file %s: %s", wf, e)
+
+def runtime_env_fingerprint() -> str:
+    """Fingerprint the environment tools are imported from: the Ray runtime env and `sys.path`."""
+    runtime_env = ""
+    try:
+        import ray
+
+        if ray.is_initialized():
+            runtime_env = ray.get_runtime_context().get_runtime_env_string()
+    except Exception:  # noqa: S110
+        pass
+    return hash_payload([runtime_env, sys.path])
+
+
+def current_agent_name() -> str | None:
+    """Name of the Ray Serve deployment this code runs in, if any."""
+    serve = sys.modules.get("ray.serve")
+    if serve is None:
+        # Serve replicas always have it imported; importing it here would only cost time.
+        return None
+    try:
+        return serve.get_replica_context().deployment
+    except Exception:
+        return None
+
+
+def current_deployment_id() -> str | None:
+    """Id shared by the replicas of the current Ray Serve application until it is redeployed, if any.
+
+    Raises if the Serve controller cannot be reached from inside a replica.
+    """
+    serve = sys.modules.get("ray.serve")
+    if serve is None:
+        return None
+    try:
+        app_name = serve.get_replica_context().app_name
+    except Exception:
+        return None
+    return f"{app_name}@{serve.status().applications[app_name].last_deployed_time_s!r}"
+
+
+def load_tool_entrypoint(package_name: str, version: str | None = None) -> Any:
+    """Load the tool registered under `package_name` in the tool entrypoint group.
+
+    With a `version`, only a tool from that version of its distribution is accepted. Scanning entry
+    points walks every installed distribution, so resolved tools are cached per worker process until
+    the runtime env changes.
+    """
+    key = (package_name, version, runtime_env_fingerprint())
+    tool = _tool_cache.get(key)
+    if tool is not None:
+        _tool_cache_hits.inc(tags={"tool": package_name})
+        return tool
+
+    _tool_cache_misses.inc(tags={"tool": package_name})
+    for ep in get_entry_points(EntrypointGroup.TOOL_ENTRYPOINT):
+        if ep.name != package_name:
             continue
-    return wf_dict
+        installed = ep.dist.version if ep.dist is not None else None
+        if version is not None and installed != version:
+            raise ValueError(f"Tool {package_name}=={version} not found, version {installed} is installed")
+        tool = ep.load()
+        _tool_cache.set(key, tool)
+        return tool
+    raise ValueError(f"Tool {package_name} not found in entry points")
 
 
-def parse_workflow_file(wf_file) -> dict[str, Any]:
-    with open(wf_file) as f:
-        return yaml.safe_load(f)
+def clear_tool_cache() -> None:
+    _tool_cache.clear()
+
+
+@contextmanager
+def patched_environ(env_vars: dict[str, Any]) -> Iterator[None]:
+    """Temporarily expose step parameters as environment variables.
+
+    The process environment is global: only use this in processes running one tool call at a time,
+    such as tool worker actors.
+    """
+    if not env_vars:
+        yield
+        return
+
+    previous = {key: os.environ.get(key) for key in env_vars}
+    os.environ.update({key: str(value) for key, value in env_vars.items()})
+    try:
+        yield
+    finally:
+        for key, value in previous.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
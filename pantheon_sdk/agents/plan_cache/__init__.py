@@ -0,0 +1,6 @@
+from pantheon_sdk.agents.plan_cache.cache import PlanCache
+from pantheon_sdk.agents.plan_cache.config import get_plan_cache_config
+
+
+def plan_cache_builder() -> PlanCache:
+    return PlanCache(get_plan_cache_config())
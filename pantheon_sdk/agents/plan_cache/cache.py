@@ -0,0 +1,185 @@
+import asyncio
+import math
+import threading
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from loguru import logger
+
+from pantheon_sdk.agents.cache import RedisCache, TTLCache
+from pantheon_sdk.agents.models import AgentModel, ToolModel, Workflow, generate_workflow_id
+from pantheon_sdk.agents.plan_cache.config import PlanCacheConfig
+from pantheon_sdk.agents.utils import hash_payload
+
+Embedder = Callable[[str], list[float]]
+
+
+def normalize_goal(goal: str) -> str:
+    return " ".join(goal.lower().split())
+
+
+def fingerprint_resources(agents: Sequence[AgentModel], tools: Sequence[ToolModel]) -> str:
+    """Fingerprint the set of agents and tools a plan was generated against (order independent)."""
+    return hash_payload(
+        {
+            "agents": sorted(f"{agent.name}@{agent.version}" for agent in agents),
+            "tools": sorted(hash_payload(tool.model_dump(mode="json")) for tool in tools),
+        }
+    )
+
+
+def plan_cache_key(goal: str, fingerprint: str) -> str:
+    return hash_payload({"goal": normalize_goal(goal), "fingerprint": fingerprint})
+
+
+def cosine_similarity(a: Sequence[float], b: Sequence[float]) -> float:
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return sum(x * y for x, y in zip(a, b, strict=True)) / norm if norm else 0.0
+
+
+class PlanCache:
+    """Cache of generated plans keyed on the normalized goal and the available agents/tools.
+
+    Lookups go local LRU/TTL tier -> optional Redis tier shared by replicas -> optional embedding
+    similarity over the local tier. Every hit is returned with a fresh workflow id, so cached plans
+    never collide in workflow storage.
+    """
+
+    def __init__(self, config: PlanCacheConfig, embedder: Embedder | None = None):
+        self.config = config
+        self._plans: TTLCache[Workflow] = TTLCache(maxsize=config.max_size, ttl=config.ttl)
+        self._embeddings: TTLCache[tuple[str, list[float]]] = TTLCache(maxsize=config.max_size, ttl=config.ttl)
+        self._embedder = embedder
+        self._embedder_lock = threading.Lock()
+        self._shared = (
+            RedisCache(config.redis.url, prefix=config.redis_prefix, ttl=config.ttl) if config.redis_enabled else None
+        )
+
+    def __getstate__(self) -> object:
+        odict = self.__dict__.copy()
+        del odict["_embedder_lock"]
+        return odict
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._embedder_lock = threading.Lock()
+
+    @property
+    def embedder(self) -> Embedder:
+        if self._embedder is None:
+            with self._embedder_lock:
+                if self._embedder is None:
+                    from langchain_openai import OpenAIEmbeddings
+
+                    self._embedder = OpenAIEmbeddings(model=self.config.embedding_model).embed_query
+        return self._embedder
+
+    def get(self, goal: str, agents: Sequence[AgentModel], tools: Sequence[ToolModel]) -> Workflow | None:
+        if not self.config.enabled:
+            return None
+
+        fingerprint = fingerprint_resources(agents, tools)
+        key = plan_cache_key(goal, fingerprint)
+        plan = self._plans.get(key)
+        if plan is None:
+            plan = self._get_remote(goal, fingerprint, key)
+        return self._hit(goal, plan)
+
+    async def aget(self, goal: str, agents: Sequence[AgentModel], tools: Sequence[ToolModel]) -> Workflow | None:
+        """Like `get`, but the Redis and embedding lookups run in a worker thread."""
+        if not self.config.enabled:
+            return None
+
+        fingerprint = fingerprint_resources(agents, tools)
+        key = plan_cache_key(goal, fingerprint)
+        plan = self._plans.get(key)
+        if plan is None and self._has_remote_tiers:
+            plan = await asyncio.to_thread(self._get_remote, goal, fingerprint, key)
+        return self._hit(goal, plan)
+
+    def set(self, goal: str, agents: Sequence[AgentModel], tools: Sequence[ToolModel], plan: Workflow) -> None:
+        if not self.config.enabled:
+            return
+
+        fingerprint = fingerprint_resources(agents, tools)
+        key = plan_cache_key(goal, fingerprint)
+        self._plans.set(key, plan)
+        self._set_remote(goal, fingerprint, key, plan)
+
+    async def aset(self, goal: str, agents: Sequence[AgentModel], tools: Sequence[ToolModel], plan: Workflow) -> None:
+        """Like `set`, but the Redis write and the goal embedding run in a worker thread."""
+        if not self.config.enabled:
+            return
+
+        fingerprint = fingerprint_resources(agents, tools)
+        key = plan_cache_key(goal, fingerprint)
+        self._plans.set(key, plan)
+        if self._has_remote_tiers:
+            await asyncio.to_thread(self._set_remote, goal, fingerprint, key, plan)
+
+    @property
+    def _has_remote_tiers(self) -> bool:
+        return self._shared is not None or self.config.similarity_enabled
+
+    @staticmethod
+    def _hit(goal: str, plan: Workflow | None) -> Workflow | None:
+        if plan is None:
+            return None
+        logger.debug(f"Plan cache hit for goal: {goal}")
+        return plan.model_copy(update={"id": generate_workflow_id()}, deep=True)
+
+    def _get_remote(self, goal: str, fingerprint: str, key: str) -> Workflow | None:
+        """Look the plan up in the Redis tier, then by goal similarity; both may block."""
+        plan = None
+        if self._shared is not None:
+            plan = self._get_shared(key)
+        if plan is None and self.config.similarity_enabled:
+            plan = self._get_similar(goal, fingerprint)
+        return plan
+
+    def _set_remote(self, goal: str, fingerprint: str, key: str, plan: Workflow) -> None:
+        if self._shared is not None:
+            self._shared.set(key, plan.model_dump_json())
+        if self.config.similarity_enabled:
+            try:
+                self._embeddings.set(key, (fingerprint, self.embedder(normalize_goal(goal))))
+            except Exception as e:
+                logger.warning(f"Failed to embed goal for the plan cache: {e}")
+
+    def clear(self) -> None:
+        self._plans.clear()
+        self._embeddings.clear()
+
+    def _get_shared(self, key: str) -> Workflow | None:
+        raw = self._shared.get(key)
+        if raw is None:
+            return None
+        try:
+            plan = Workflow.model_validate_json(raw)
+        except Exception as e:
+            logger.warning(f"Discarding malformed shared plan cache entry {key}: {e}")
+            return None
+        self._plans.set(key, plan)
+        return plan
+
+    def _get_similar(self, goal: str, fingerprint: str) -> Workflow | None:
+        # A snapshot, so scanning the candidates does not reorder the LRU tier.
+        plans = dict(self._plans.items())
+        candidates = [
+            (key, embedding)
+            for key, (entry_fingerprint, embedding) in self._embeddings.items()
+            if entry_fingerprint == fingerprint and key in plans
+        ]
+        if not candidates:
+            return None
+
+        try:
+            query = self.embedder(normalize_goal(goal))
+        except Exception as e:
+            logger.warning(f"Failed to embed goal for the plan cache: {e}")
+            return None
+
+        score, key = max((cosine_similarity(query, embedding), key) for key, embedding in candidates)
+        if score < self.config.similarity_threshold:
+            return None
+        return self._plans.get(key)
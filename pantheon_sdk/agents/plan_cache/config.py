@@ -0,0 +1,34 @@
+from functools import lru_cache
+
+import pydantic
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from pantheon_sdk.agents.memory.config import Redis
+
+
+class PlanCacheConfig(BaseSettings):
+    enabled: bool = True
+    ttl: float = 900.0
+    max_size: int = 1024
+
+    # Embedding-similarity hits (local tier only)
+    similarity_enabled: bool = False
+    similarity_threshold: float = 0.95
+    embedding_model: str = "text-embedding-3-small"
+
+    # Shared tier across replicas
+    redis_enabled: bool = False
+    redis_prefix: str = "plan-cache:"
+    redis: Redis = Redis()
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_prefix="PLAN_CACHE_",
+        env_file_encoding="utf-8",
+        extra=pydantic.Extra.ignore,
+    )
+
+
+@lru_cache
+def get_plan_cache_config() -> PlanCacheConfig:
+    return PlanCacheConfig()
@@ -86,6 +86,7 @@ class AgentOutputPlanParser(AgentOutputParser, extra="allow"):
                             OutputItem(name=output_item.get("name", ""), value=output_item.get("value", None))
                             for output_item in step.get("outputs", [])
                         ],
+                        dependencies=step.get("dependencies") or [],
                     )
                     for i, step in enumerate(workflow_data.get("steps", []))
                 ],
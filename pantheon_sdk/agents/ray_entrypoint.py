@@ -1,32 +1,53 @@
+import asyncio
 import datetime
+import json
+import time
 import uuid
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Callable, Sequence
 from logging import getLogger
 from typing import Any
 from urllib.parse import urljoin
 
 import requests
+from pydantic import BaseModel
 from ray.serve.deployment import Application
 
 from pantheon_sdk.agents import abc, const
 from pantheon_sdk.agents.ai_registry import ai_registry_builder
 from pantheon_sdk.agents.bootstrap import bootstrap_main
-from pantheon_sdk.agents.card.models import AgentCard
+from pantheon_sdk.agents.card.cache import AgentCardCache
+from pantheon_sdk.agents.card.config import get_card_cache_config
 from pantheon_sdk.agents.config import BasicAgentConfig, get_agent_config
+from pantheon_sdk.agents.deadline import (
+    DeadlineExceededError,
+    deadline_headers,
+    deadline_passed,
+    deadline_scope,
+    time_left,
+    without_deadline,
+)
 from pantheon_sdk.agents.domain_knowledge import light_rag_builder
 from pantheon_sdk.agents.langchain import executor, executor_builder
+from pantheon_sdk.agents.log import log_event
 from pantheon_sdk.agents.memory import memory_builder
+from pantheon_sdk.agents.memory.session_cache import ChatSessionCache
 from pantheon_sdk.agents.models import (
     AgentModel,
+    BatchGoalResult,
     ChatMessageModel,
     GoalModel,
     HandoffParamsModel,
     InsightModel,
+    InteractionSummaryModel,
     MemoryModel,
+    PlanningContextModel,
     ToolModel,
     Workflow,
 )
+from pantheon_sdk.agents.plan_cache import plan_cache_builder
 from pantheon_sdk.agents.prompt import prompt_builder
+from pantheon_sdk.agents.singleflight import SingleFlight
+from pantheon_sdk.agents.utils import hash_payload
 
 logger = getLogger(__name__)
 
@@ -52,11 +73,31 @@ class BaseAgent(abc.AbstractAgent):
         # ---------- Redis Memory ----------#
         self.memory_client = memory_builder()
 
+        # ---------- Agent Cards -----------#
+        self.card_cache = AgentCardCache(get_card_cache_config())
+
+        # ---------- Plan Cache ------------#
+        self.plan_cache = plan_cache_builder()
+
+        # ---------- Chat Sessions ---------#
+        self.chat_sessions = ChatSessionCache(
+            maxsize=config.chat_session_cache_size,
+            ttl=config.chat_session_cache_ttl,
+            max_messages=config.chat_history_window,
+        )
+
+        # ---------- Request Coalescing ----#
+        self.in_flight_requests: SingleFlight[abc.BaseAgentOutputModel] = SingleFlight("handle")
+
+        # ---------- Tool Prefetch ---------#
+        self._prefetches: set[asyncio.Task] = set()
+
     async def handle(
         self,
         goal: str,
         plan: dict | None = None,
         context: abc.BaseAgentInputModel | None = None,
+        coalesce: bool = True,
     ) -> abc.BaseAgentOutputModel:
         """Handle the most important endpoint of MAS.
 
@@ -64,56 +105,363 @@ class BaseAgent(abc.AbstractAgent):
 
         If a predefined plan is provided, it skips plan generation and executes the plan directly.
         Otherwise, it follows the standard logic to generate a plan and execute it.
+
+        The request is bounded by the caller's deadline and `request_timeout`, whichever is earlier;
+        the workflow and any handoffs inherit the deadline.
+
+        Identical requests in flight at the same time are computed once and share the result, unless
+        `coalesce` is false or `request_coalescing_enabled` is off. The shared computation runs without
+        a deadline, since its callers may have different ones: each caller stops waiting at its own
+        deadline, and the computation is cancelled once no caller is left.
         """
+        timeout = self.config.request_timeout
+        with deadline_scope(time.time() + timeout if timeout else None) as deadline:
+            # Raises if the deadline has already passed, before any work is created.
+            remaining = time_left()
+            if coalesce and self.config.request_coalescing_enabled:
+                work = self.in_flight_requests.do(
+                    self.request_key(goal, plan, context), lambda: self._handle_shared(goal, plan, context)
+                )
+            else:
+                work = self._handle(goal, plan, context)
+            try:
+                return await asyncio.wait_for(work, timeout=remaining)
+            except asyncio.TimeoutError as e:
+                if isinstance(e, DeadlineExceededError) or not deadline_passed(deadline):
+                    raise
+                raise DeadlineExceededError(f"Request for goal {goal!r} did not finish before its deadline") from e
+
+    async def _handle_shared(
+        self, goal: str, plan: dict | None, context: abc.BaseAgentInputModel | None
+    ) -> abc.BaseAgentOutputModel:
+        with without_deadline():
+            return await self._handle(goal, plan, context)
+
+    def request_key(self, goal: str, plan: dict | None, context: Any) -> str:
+        if isinstance(context, BaseModel):
+            context = context.model_dump(mode="json")
+        return hash_payload({"goal": goal, "plan": plan, "context": context})
+
+    async def _handle(
+        self,
+        goal: str,
+        plan: dict | None = None,
+        context: abc.BaseAgentInputModel | None = None,
+    ) -> abc.BaseAgentOutputModel:
         if plan:
-            result = await self.run_workflow(plan, context)
-            self.store_interaction(goal, plan, result, context)
-            return result
+            return await self._run_and_record(goal, plan, context)
 
-        insights = self.get_relevant_insights(goal)
-        past_interactions = self.get_past_interactions(goal)
-        agents = self.get_most_relevant_agents(goal)
-        tools = self.get_most_relevant_tools(goal, agents)
+        planning_context = await self.gather_context(goal)
+        # Warm the tool workers while the plan is being generated.
+        self.prefetch_tools(planning_context.tools)
 
-        plan = self.generate_plan(
+        plan = await self.generate_plan(
             goal=goal,
-            agents=agents,
-            tools=tools,
-            insights=insights,
-            past_interactions=past_interactions,
+            agents=planning_context.agents,
+            tools=planning_context.tools,
+            insights=planning_context.insights,
+            past_interactions=planning_context.past_interactions,
             plan=None,
         )
-        result = await self.run_workflow(plan, context)
+        return await self._run_and_record(goal, plan, context)
+
+    async def _run_and_record(
+        self, goal: str, plan: Workflow | dict, context: abc.BaseAgentInputModel | None
+    ) -> abc.BaseAgentOutputModel:
+        """Run the workflow and store the interaction, including a failed one."""
+        try:
+            result = await self.run_workflow(plan, context)
+        except Exception as e:
+            self.store_failed_interaction(goal, plan, e)
+            raise
         self.store_interaction(goal, plan, result, context)
         return result
 
-    def get_past_interactions(self, goal: str) -> list[dict]:
-        return self.memory_client.read(key=goal)
+    async def handle_batch(
+        self, goals: Sequence[str], context: abc.BaseAgentInputModel | None = None
+    ) -> AsyncIterator[BatchGoalResult]:
+        """Handle many goals, yielding each goal's result as soon as its workflow finishes.
+
+        Duplicate goals are planned and run once. Goals are processed in chunks of `batch_chunk_size`:
+        the chunk's contexts are gathered concurrently and its plans are generated with one batched
+        executor call, then its workflows start while the next chunk is planned. A failing goal is
+        reported in its result and does not affect the others.
+        """
+        positions: dict[str, list[int]] = {}
+        for i, goal in enumerate(goals):
+            positions.setdefault(goal, []).append(i)
+        unique_goals = list(positions)
+        chunk_size = self.config.batch_chunk_size
+
+        results: asyncio.Queue[BatchGoalResult] = asyncio.Queue()
+        semaphore = asyncio.Semaphore(self.config.batch_max_concurrency)
+        tasks: list[asyncio.Task] = []
+
+        async def run(goal: str, plan: Workflow | Exception) -> None:
+            try:
+                if isinstance(plan, Exception):
+                    raise plan
+                async with semaphore:
+                    result = await self._run_and_record(goal, plan, context)
+                item = BatchGoalResult(goal=goal, positions=positions[goal], result=result)
+            except Exception as e:
+                logger.warning(f"Batch goal {goal!r} failed: {e}")
+                item = BatchGoalResult(goal=goal, positions=positions[goal], error=str(e) or type(e).__name__)
+            await results.put(item)
+
+        async def plan_chunks() -> None:
+            for start in range(0, len(unique_goals), chunk_size):
+                chunk = unique_goals[start : start + chunk_size]
+                try:
+                    plans = await self.generate_plans(chunk)
+                except Exception as e:
+                    plans = [e] * len(chunk)
+                tasks.extend(asyncio.create_task(run(goal, plan)) for goal, plan in zip(chunk, plans, strict=True))
+
+        tasks.append(asyncio.create_task(plan_chunks()))
+        try:
+            for _ in unique_goals:
+                yield await results.get()
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def generate_plans(self, goals: Sequence[str]) -> list[Workflow | Exception]:
+        """Plan several goals at once.
+
+        Contexts are gathered concurrently, cached plans are reused and the rest are generated with a
+        single `abatch_generate_plan` call. A goal whose planning failed gets its exception instead.
+        """
+        contexts = await asyncio.gather(*[self.gather_context(goal) for goal in goals])
+        self.prefetch_tools([tool for planning_context in contexts for tool in planning_context.tools])
+
+        plans: list[Workflow | Exception | None] = list(
+            await asyncio.gather(
+                *[
+                    self.plan_cache.aget(goal, planning_context.agents, planning_context.tools)
+                    for goal, planning_context in zip(goals, contexts, strict=True)
+                ]
+            )
+        )
+        missing = [i for i, plan in enumerate(plans) if plan is None]
+        if not missing:
+            return plans
+
+        generated = await self.agent_executor.abatch_generate_plan(
+            self.prompt_builder.generate_plan_prompt(system_prompt=self.config.system_prompt),
+            [
+                {
+                    "available_functions": contexts[i].tools,
+                    "available_agents": contexts[i].agents,
+                    "goal": goals[i],
+                    "past_interactions": contexts[i].past_interactions,
+                    "insights": contexts[i].insights,
+                    "plan": None,
+                }
+                for i in missing
+            ],
+            max_concurrency=self.config.batch_max_concurrency,
+        )
+        for i, plan in zip(missing, generated, strict=True):
+            if isinstance(plan, Workflow):
+                await self.plan_cache.aset(goals[i], contexts[i].agents, contexts[i].tools, plan)
+            plans[i] = plan
+        return plans
+
+    async def gather_context(self, goal: str) -> PlanningContextModel:
+        """Gather everything the planner needs for the goal concurrently.
+
+        Insights, past interactions and agents are fetched at the same time, tools are fetched as soon as
+        the agents are known. Each source has its own timeout; a source that fails or times out is replaced
+        by its fallback value, so planning always proceeds with whatever context is available.
+        """
+
+        async def agents_and_tools() -> tuple[list[AgentModel], list[ToolModel]]:
+            agents = await self._fetch_context_source(
+                "agents",
+                self.get_most_relevant_agents,
+                goal,
+                timeout=self.config.context_agents_timeout,
+                default=[],
+            )
+            tools = await self._fetch_context_source(
+                "tools",
+                self.get_most_relevant_tools,
+                goal,
+                agents,
+                timeout=self.config.context_tools_timeout,
+                default=self.get_default_tools(),
+            )
+            return agents, tools
+
+        insights, past_interactions, (agents, tools) = await asyncio.gather(
+            self._fetch_context_source(
+                "insights",
+                self.get_relevant_insights,
+                goal,
+                timeout=self.config.context_insights_timeout,
+                default=[],
+            ),
+            self._fetch_context_source(
+                "past_interactions",
+                self.get_past_interactions,
+                goal,
+                timeout=self.config.context_past_interactions_timeout,
+                default=[],
+            ),
+            agents_and_tools(),
+        )
+        return PlanningContextModel(
+            insights=insights,
+            past_interactions=past_interactions,
+            agents=agents,
+            tools=tools,
+        )
+
+    def prefetch_tools(self, tools: Sequence[ToolModel]) -> None:
+        """Ask the workflow runner to warm workers for the tools, in a worker thread and without waiting."""
+        task = asyncio.create_task(asyncio.to_thread(self.workflow_runner.prefetch_tools, tools))
+        self._prefetches.add(task)
+        task.add_done_callback(self._prefetch_done)
+
+    def _prefetch_done(self, task: asyncio.Task) -> None:
+        self._prefetches.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Failed to prefetch tools: {task.exception()}")
+
+    async def _fetch_context_source(
+        self, name: str, func: Callable[..., Any], *args: Any, timeout: float, default: Any
+    ) -> Any:
+        """Run a blocking context lookup off the event loop, falling back to `default` on error or timeout."""
+        try:
+            return await asyncio.wait_for(asyncio.to_thread(func, *args), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Context source '{name}' timed out after {timeout}s, continuing without it")
+        except Exception as e:
+            logger.warning(f"Context source '{name}' failed: {e}, continuing without it")
+        return default
+
+    def get_past_interactions(self, goal: str) -> list[InteractionSummaryModel]:
+        """Return summaries of the stored interactions relevant to the goal.
+
+        In the default "exact" mode these summarize the records stored for the identical goal; in
+        "semantic" mode, the `past_interactions_top_k` interactions of this agent whose goals are
+        closest to `goal`.
+        """
+        if self.config.past_interactions_mode == "exact":
+            records = self.memory_client.read(key=goal)
+            if isinstance(records, dict):
+                records = records.get("results", [])
+            return [self._summarize_record(goal, record) for record in records]
+        summaries = self.memory_client.search_interactions(
+            goal,
+            scope=self.config.agent_name,
+            top_k=self.config.past_interactions_top_k,
+            max_distance=self.config.past_interactions_max_distance,
+            only_successful=self.config.past_interactions_only_successful,
+        )
+        return [InteractionSummaryModel(**summary) for summary in summaries]
+
+    def _summarize_record(self, goal: str, record: dict[str, Any]) -> InteractionSummaryModel:
+        """Summarize a record stored in "exact" mode; records mem0 stored as free text keep only their text."""
+        memory = record.get("memory", "")
+        try:
+            interaction = MemoryModel.model_validate_json(memory)
+        except ValueError:
+            return InteractionSummaryModel(
+                goal=goal, plan_summary="unknown", outcome=memory[: self.config.past_interactions_outcome_chars]
+            )
+        return InteractionSummaryModel(
+            goal=goal,
+            plan_summary=self._plan_summary(interaction.plan),
+            outcome=json.dumps(interaction.result, default=str)[: self.config.past_interactions_outcome_chars],
+        )
 
     def store_interaction(
         self,
         goal: str,
-        plan: dict,
+        plan: Workflow | dict,
         result: abc.BaseAgentOutputModel,
         context: abc.BaseAgentInputModel | None = None,
     ) -> None:
-        interaction = MemoryModel(
-            goal=goal, plan=plan, result=result.model_dump(), context=context.model_dump() if context else None
+        if self.config.past_interactions_mode == "exact":
+            interaction = MemoryModel(
+                goal=goal,
+                plan=plan.model_dump() if isinstance(plan, Workflow) else plan,
+                result=result.model_dump(),
+                context=context.model_dump() if context else None,
+            )
+            self.memory_client.writer.store(goal, interaction.model_dump())
+            return
+        self._store_interaction_summary(goal, plan, result.model_dump_json(), success=True)
+
+    def store_failed_interaction(self, goal: str, plan: Workflow | dict, error: Exception) -> None:
+        """Record a failed workflow, so it can be offered to (or kept from) the planner next time."""
+        if self.config.past_interactions_mode == "exact":
+            return
+        self._store_interaction_summary(goal, plan, str(error) or type(error).__name__, success=False)
+
+    def _store_interaction_summary(self, goal: str, plan: Workflow | dict, outcome: str, success: bool) -> None:
+        summary = InteractionSummaryModel(
+            goal=goal,
+            plan_summary=self._plan_summary(plan),
+            outcome=outcome[: self.config.past_interactions_outcome_chars],
+            success=success,
+        )
+        self.memory_client.writer.store_interaction_summary(
+            goal, summary.model_dump(exclude={"goal", "distance"}), scope=self.config.agent_name
+        )
+
+    @staticmethod
+    def _plan_summary(plan: Workflow | dict) -> str:
+        plan = plan.model_dump() if isinstance(plan, Workflow) else plan
+        steps = " -> ".join(
+            f"{step.get('name')} ({step.get('tool', {}).get('name')})" for step in plan.get("steps", [])
         )
-        self.memory_client.store(key=goal, interaction=interaction.model_dump())
+        return f"{plan.get('name')}: {steps}" if steps else str(plan.get("name"))
 
     def store_chat_context(
         self,
         uuid: str,
-        messages: list[dict],
+        messages: Sequence[dict | ChatMessageModel],
     ) -> None:
-        normalized_messages = [msg if isinstance(msg, dict) else msg.model_dump() for msg in messages]
-        self.memory_client.store(key=f"chat:{uuid}", interaction=normalized_messages)
+        """Queue new messages for the chat session log and add them to the replica's session cache.
+
+        A cached session gets the messages right away, at the indexes the log is expected to assign;
+        if the log assigns others (another replica wrote to the session), the entry is dropped.
+        """
+        normalized_messages = [
+            msg if isinstance(msg, dict) else msg.model_dump(mode="json", exclude={"index"}) for msg in messages
+        ]
+        expected_index = self.chat_sessions.next_index(uuid)
+        if expected_index is not None:
+            self.chat_sessions.append(uuid, normalized_messages, expected_index)
+
+        def on_stored(first_index: int | None) -> None:
+            if expected_index is None:
+                self.chat_sessions.append(uuid, normalized_messages, first_index)
+            elif first_index != expected_index:
+                self.chat_sessions.invalidate(uuid)
+
+        self.memory_client.writer.append_messages(uuid, normalized_messages, on_done=on_stored)
 
-    def get_chat_context(self, uuid: str) -> list[dict]:
-        results = self.memory_client.read(key=f"chat:{uuid}").get("results")
-        print(f"Fetched {len(results)} results")
-        return results
+    def get_chat_context(self, uuid: str, limit: int | None = None) -> list[dict]:
+        """Return the last `limit` messages of the session (`chat_history_window` by default).
+
+        Sessions this replica has served recently are answered from its session cache; others are
+        read from the log once the messages queued for them are written. If that takes longer than
+        the memory `write_wait_timeout`, the messages already in the log are returned and not cached.
+        """
+        limit = limit or self.config.chat_history_window
+        messages = self.chat_sessions.get(uuid, limit)
+        if messages is None:
+            written = self.memory_client.writer.wait(uuid, timeout=time_left(timeout=self.memory_client.wait_timeout))
+            if not written:
+                logger.warning(f"Reading chat session {uuid} before its queued messages were written")
+            messages = self.memory_client.read_tail(uuid, limit)
+            if written:
+                self.chat_sessions.load(uuid, messages, limit)
+        return messages
 
     def get_relevant_insights(self, goal: str) -> list[InsightModel]:
         """Retrieve relevant insights from LightRAG memory for the given goal."""
@@ -162,16 +510,10 @@ class BaseAgent(abc.AbstractAgent):
         )
         tools = [ToolModel(**tool) for tool in response]
 
+        cards = self.card_cache.get_cards([agent.endpoint for agent in agents])
         for agent in agents:
-            card_url = urljoin(agent.endpoint, "/card")
-            try:
-                resp = requests.get(card_url)
-                resp.raise_for_status()
-
-                data = resp.json()
-                card = AgentCard(**data)
-            except Exception as e:
-                logger.warning(f"Failed to fetch card from agent {agent} at {card_url}: {e}")
+            card = cards.get(agent.endpoint)
+            if card is None:
                 continue
             for skill in card.skills:
                 func_name = f"{agent.name}_{skill.id}".replace("-", "_")
@@ -196,7 +538,11 @@ class BaseAgent(abc.AbstractAgent):
                     )
                 )
 
-        return tools + [
+        return tools + self.get_default_tools()
+
+    def get_default_tools(self) -> list[ToolModel]:
+        """Tools that are always available to the planner, regardless of the registry."""
+        return [
             ToolModel(
                 name="return-answer-tool",
                 version="0.1.2",
@@ -230,17 +576,25 @@ class BaseAgent(abc.AbstractAgent):
             ),
         ]
 
-    def generate_plan(
+    async def generate_plan(
         self,
         goal: str,
         agents: Sequence[AgentModel],
         tools: Sequence[ToolModel],
-        past_interactions: Sequence[MemoryModel],
+        past_interactions: Sequence[InteractionSummaryModel],
         insights: Sequence[InsightModel],
         plan: dict | None = None,
     ) -> Workflow:
-        """Generate a plan for the given goal."""
-        return self.agent_executor.generate_plan(
+        """Generate a plan for the given goal.
+
+        Plans for goals already seen with the same agents and tools are served from the plan cache.
+        """
+        if plan is None:
+            cached_plan = await self.plan_cache.aget(goal, agents, tools)
+            if cached_plan is not None:
+                return cached_plan
+
+        new_plan = await self.agent_executor.agenerate_plan(
             self.prompt_builder.generate_plan_prompt(system_prompt=self.config.system_prompt),
             available_functions=tools,
             available_agents=agents,
@@ -249,8 +603,11 @@ class BaseAgent(abc.AbstractAgent):
             insights=insights,
             plan=plan,
         )
+        if plan is None and isinstance(new_plan, Workflow):
+            await self.plan_cache.aset(goal, agents, tools, new_plan)
+        return new_plan
 
-    def chat(
+    async def chat(
         self,
         user_prompt: str,
         action: str | None,
@@ -259,28 +616,25 @@ class BaseAgent(abc.AbstractAgent):
         if not session_uuid:
             session_uuid = str(uuid.uuid4())
 
-        prior_context = self.get_chat_context(session_uuid)
-        chat_history = [
-            ChatMessageModel(role="user", content=m.get("memory", ""), timestamp=m.get("created_at"))
-            for m in prior_context
-        ]
+        prior_context = await asyncio.to_thread(self.get_chat_context, session_uuid)
+        chat_history = [ChatMessageModel(**message) for message in prior_context]
 
-        chat_history.append(
-            ChatMessageModel(
-                role="user",
-                content=user_prompt,
-                timestamp=datetime.datetime.now(datetime.timezone.utc),
-            )
+        user_message = ChatMessageModel(
+            role="user",
+            content=user_prompt,
+            timestamp=datetime.datetime.now(datetime.timezone.utc),
         )
+        chat_history.append(user_message)
 
-        self.store_chat_context(session_uuid, chat_history)
+        # Only the new message is stored; the session log already holds the earlier ones.
+        await asyncio.to_thread(self.store_chat_context, session_uuid, [user_message])
 
         # ------ Reconfigure Agent ----- #
         if action == const.Intents.CHANGE_SETTINGS:
             existing_config = str(self.config)
-            print(f"Current config: {existing_config}")
+            log_event("chat.reconfigure", "Current config", config=existing_config)
 
-            updated_config = self.agent_executor.reconfigure(
+            updated_config = await self.agent_executor.areconfigure(
                 prompt=self.prompt_builder.generate_reconfigure_prompt(
                     system_prompt=self.config.system_prompt,
                     user_prompt=user_prompt,
@@ -292,7 +646,7 @@ class BaseAgent(abc.AbstractAgent):
             )
 
             if updated_config:
-                print(f"Updated config: {updated_config}")
+                log_event("chat.reconfigure", "Updated config", config=updated_config)
                 self.reconfigure(updated_config)
                 response = executor.ChatResponse(
                     response_text="Settings updated successfully.",
@@ -305,20 +659,12 @@ class BaseAgent(abc.AbstractAgent):
                     action=const.Intents.CHANGE_SETTINGS,
                     session_uuid=session_uuid,
                 )
-            chat_history.append(
-                ChatMessageModel(
-                    role="assistant",
-                    content=response.response_text,
-                    timestamp=datetime.datetime.now(datetime.timezone.utc),
-                )
-            )
-            self.store_chat_context(session_uuid, chat_history)
-            return response
+            return await self._record_reply(session_uuid, response)
 
         # ------ Add Knowledge to Knowledge Base ----- #
         if action == const.Intents.ADD_KNOWLEDGE:
-            print(f"Trying to add to knowledge base: {user_prompt}")
-            result: dict = self.store_knowledge(filename=None, content=user_prompt)
+            log_event("chat.add_knowledge", "Adding to the knowledge base", content=user_prompt)
+            result: dict = await asyncio.to_thread(self.store_knowledge, filename=None, content=user_prompt)
 
             # Default message
             response_text = "I failed to add information to the knowledge base."
@@ -330,19 +676,11 @@ class BaseAgent(abc.AbstractAgent):
                 action=None,
                 session_uuid=session_uuid,
             )
-            chat_history.append(
-                ChatMessageModel(
-                    role="assistant",
-                    content=response.response_text,
-                    timestamp=datetime.datetime.now(datetime.timezone.utc),
-                )
-            )
-            self.store_chat_context(session_uuid, chat_history)
-            return response
+            return await self._record_reply(session_uuid, response)
 
         # ------ Classify Intent ----- #
         if action is None:
-            intent = self.agent_executor.classify_intent(
+            intent = await self.agent_executor.aclassify_intent(
                 prompt=self.prompt_builder.generate_intent_classifier_prompt(
                     system_prompt=self.config.system_prompt,
                     user_prompt=user_prompt,
@@ -351,43 +689,27 @@ class BaseAgent(abc.AbstractAgent):
                 context=[m.content for m in chat_history],
             )
             if intent == const.Intents.CHANGE_SETTINGS:
-                print(f"Intent: {intent}")
+                log_event("chat.intent", "Classified intent", intent=intent)
                 response = executor.ChatResponse(
                     response_text=const.ExtraQuestions.WHICH_SETTINGS,
                     action=const.Intents.CHANGE_SETTINGS,
                     session_uuid=session_uuid,
                 )
-                chat_history.append(
-                    ChatMessageModel(
-                        role="assistant",
-                        content=response.response_text,
-                        timestamp=datetime.datetime.now(datetime.timezone.utc),
-                    )
-                )
-                self.store_chat_context(session_uuid, chat_history)
-                return response
+                return await self._record_reply(session_uuid, response)
 
             if intent == const.Intents.ADD_KNOWLEDGE:
-                print(f"Intent: {intent}")
+                log_event("chat.intent", "Classified intent", intent=intent)
                 response = executor.ChatResponse(
                     response_text=const.ExtraQuestions.WHAT_INFO,
                     action=const.Intents.ADD_KNOWLEDGE,
                     session_uuid=session_uuid,
                 )
-                chat_history.append(
-                    ChatMessageModel(
-                        role="assistant",
-                        content=response.response_text,
-                        timestamp=datetime.datetime.now(datetime.timezone.utc),
-                    )
-                )
-                self.store_chat_context(session_uuid, chat_history)
-                return response
+                return await self._record_reply(session_uuid, response)
 
         # ------ Chit Chat ----- #
-        print(f"Intent: {const.Intents.CHIT_CHAT}")
+        log_event("chat.intent", "Classified intent", intent=const.Intents.CHIT_CHAT)
         chat_context_str = "\n".join([m.content for m in chat_history[-10:]]) if chat_history else ""
-        assistant_reply = self.agent_executor.chat(
+        assistant_reply = await self.agent_executor.achat(
             prompt=self.prompt_builder.generate_chat_prompt(
                 system_prompt=self.config.system_prompt,
                 user_prompt=user_prompt,
@@ -401,14 +723,16 @@ class BaseAgent(abc.AbstractAgent):
             action=const.Intents.CHIT_CHAT,
             session_uuid=session_uuid,
         )
-        chat_history.append(
-            ChatMessageModel(
-                role="assistant",
-                content=response.response_text,
-                timestamp=datetime.datetime.now(datetime.timezone.utc),
-            )
+        return await self._record_reply(session_uuid, response)
+
+    async def _record_reply(self, session_uuid: str, response: executor.ChatResponse) -> executor.ChatResponse:
+        """Append the assistant's reply to the session log and return the response."""
+        message = ChatMessageModel(
+            role="assistant",
+            content=response.response_text,
+            timestamp=datetime.datetime.now(datetime.timezone.utc),
         )
-        self.store_chat_context(session_uuid, chat_history)
+        await asyncio.to_thread(self.store_chat_context, session_uuid, [message])
         return response
 
     async def run_workflow(
@@ -421,12 +745,23 @@ class BaseAgent(abc.AbstractAgent):
     def reconfigure(self, config: dict[str, Any]):
         pass
 
+    async def aclose(self) -> None:
+        """Release the connection pools held by the service clients and flush the queued memory writes."""
+        for client in (self.ai_registry_client, self.lightrag_client, self.card_cache):
+            if hasattr(client, "close"):
+                client.close()
+        if hasattr(self.memory_client, "close"):
+            await asyncio.to_thread(self.memory_client.close)
+
     async def handoff(self, endpoint: str, goal: str, plan: dict):
         """Handle case when agent can't find a solution (wrong route/wrong plan/etc).
 
         Agent decides to handoff the task to another agent.
         """
-        return requests.post(urljoin(endpoint, goal), json=plan).json()
+        response = await asyncio.to_thread(
+            requests.post, urljoin(endpoint, goal), json=plan, headers=deadline_headers(), timeout=time_left()
+        )
+        return response.json()
 
 
 def agent_builder(args: dict) -> Application:
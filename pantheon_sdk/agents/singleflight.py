@@ -0,0 +1,73 @@
+"""Coalescing of identical in-flight requests.
+
+Concurrent calls with the same key share one computation: the first caller starts it and the
+others await the same result (or exception). The computation is cancelled only when every caller
+waiting for it has gone away, so one client disconnecting does not fail the others.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Generic, TypeVar
+
+from pantheon_sdk.agents.metrics import get_counter, get_gauge
+
+T = TypeVar("T")
+
+_calls_counter = get_counter(
+    "pantheon_singleflight_calls", "Computations started by a single-flight group", tag_keys=("group",)
+)
+_coalesced_counter = get_counter(
+    "pantheon_singleflight_coalesced", "Requests served by a computation already in flight", tag_keys=("group",)
+)
+_in_flight_gauge = get_gauge(
+    "pantheon_singleflight_in_flight", "Computations in flight per single-flight group", tag_keys=("group",)
+)
+
+
+class _Call:
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight(Generic[T]):
+    """Runs at most one computation per key at a time.
+
+    The shared computation runs in a copy of the context of the caller that started it, so context
+    variables such as the request deadline should be reset by `fn` if they must not apply to the
+    other callers.
+    """
+
+    def __init__(self, group: str):
+        self.group = group
+        self._calls: dict[str, _Call] = {}
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def _forget(self, key: str, call: _Call) -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
+        _in_flight_gauge.set(len(self._calls), tags={"group": self.group})
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        call = self._calls.get(key)
+        if call is None:
+            call = self._calls[key] = _Call(asyncio.ensure_future(fn()))
+            call.task.add_done_callback(lambda _: self._forget(key, call))
+            _calls_counter.inc(tags={"group": self.group})
+            _in_flight_gauge.set(len(self._calls), tags={"group": self.group})
+        else:
+            _coalesced_counter.inc(tags={"group": self.group})
+
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        except asyncio.CancelledError:
+            if call.waiters == 1 and not call.task.done():
+                # Later callers start afresh instead of joining a computation being cancelled.
+                self._forget(key, call)
+                call.task.cancel()
+            raise
+        finally:
+            call.waiters -= 1
@@ -1,8 +1,11 @@
+import hashlib
+import json
 from importlib.metadata import EntryPoint, entry_points
 from typing import Any
 
 from pydantic import BaseModel, Field, create_model
 
+from pantheon_sdk.agents.cache import TTLCache
 from pantheon_sdk.agents.const import EntrypointGroup
 
 TYPE_MAPPING: dict[str, type] = {
@@ -15,6 +18,10 @@ TYPE_MAPPING: dict[str, type] = {
     "null": type(None),
 }
 
+# Dynamic models keyed by (class name, schema hash, base class); bounded so remote schemas cannot leak classes.
+MODEL_REGISTRY_MAX_SIZE = 512
+_model_registry: TTLCache[type[BaseModel]] = TTLCache(maxsize=MODEL_REGISTRY_MAX_SIZE)
+
 
 def get_entry_points(group: str) -> list[EntryPoint]:
     entrypoints = entry_points(group=group)
@@ -36,10 +43,29 @@ def get_entrypoint(
     return None
 
 
+def hash_payload(payload: Any) -> str:
+    """Return a stable sha256 hex digest of a JSON-serializable payload."""
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+
+
 def create_pydantic_model_from_json_schema(
     klass: str, schema: dict[str, Any], base_klass: type[BaseModel] | None = None
 ) -> type[BaseModel]:
-    """Create a Pydantic model from a JSON schema."""
+    """Create a Pydantic model from a JSON schema.
+
+    Models are memoized by content, so an identical schema returns the class that was already built.
+    """
+    key = (klass, hash_payload(schema), base_klass)
+    model = _model_registry.get(key)
+    if model is None:
+        model = _build_pydantic_model_from_json_schema(klass, schema, base_klass)
+        _model_registry.set(key, model)
+    return model
+
+
+def _build_pydantic_model_from_json_schema(
+    klass: str, schema: dict[str, Any], base_klass: type[BaseModel] | None = None
+) -> type[BaseModel]:
     fields = {}
     for prop_name, prop_info in schema["properties"].items():
         field_type = prop_info.get("type", "default")  # if no type, then it's the default?
@@ -0,0 +1,62 @@
+import time
+
+import httpx
+import pytest
+
+from pantheon_sdk.agents.card.builder import get_agent_card
+from pantheon_sdk.agents.card.cache import AgentCardCache
+from pantheon_sdk.agents.card.config import CardCacheConfig
+
+ENDPOINT = "http://agent1-serve-svc.pantheon:8000"
+UNREACHABLE = "http://agent2-serve-svc.pantheon:8000"
+ETAG = '"v1"'
+
+
+class CardServer:
+    def __init__(self):
+        self.requests: list[httpx.Request] = []
+        self.body = get_agent_card().model_dump_json(by_alias=True)
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.url.host.startswith("agent2"):
+            raise httpx.ConnectError("connection refused", request=request)
+        if request.headers.get("if-none-match") == ETAG:
+            return httpx.Response(304, headers={"ETag": ETAG})
+        return httpx.Response(200, content=self.body, headers={"ETag": ETAG, "Content-Type": "application/json"})
+
+
+@pytest.fixture
+def server():
+    return CardServer()
+
+
+@pytest.fixture
+def card_cache(server):
+    cache = AgentCardCache(CardCacheConfig(ttl=0.05, negative_ttl=60))
+    cache._client = httpx.Client(transport=httpx.MockTransport(server))
+    return cache
+
+
+def test_fresh_cards_are_served_from_cache(card_cache, server):
+    first = card_cache.get_cards([ENDPOINT])
+    second = card_cache.get_cards([ENDPOINT])
+
+    assert first[ENDPOINT].name == "base-agent"
+    assert second[ENDPOINT] is first[ENDPOINT]
+    assert len(server.requests) == 1
+
+
+def test_expired_cards_are_revalidated(card_cache, server):
+    card = card_cache.get_cards([ENDPOINT])[ENDPOINT]
+    time.sleep(0.06)
+
+    assert card_cache.get_cards([ENDPOINT])[ENDPOINT] is card
+    assert len(server.requests) == 2
+    assert server.requests[-1].headers["if-none-match"] == ETAG
+
+
+def test_unreachable_agents_are_negatively_cached(card_cache, server):
+    assert card_cache.get_cards([UNREACHABLE, ENDPOINT])[UNREACHABLE] is None
+    assert card_cache.get_cards([UNREACHABLE])[UNREACHABLE] is None
+    assert [r.url.host for r in server.requests].count("agent2-serve-svc.pantheon") == 1
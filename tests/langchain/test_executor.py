@@ -0,0 +1,142 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langchain_core.prompts import PromptTemplate
+
+from pantheon_sdk.agents.langchain import executor
+from pantheon_sdk.agents.langchain.config import BasicLangChainConfig
+from pantheon_sdk.agents.models import InteractionSummaryModel, ToolModel
+
+
+@pytest.fixture
+def chat_openai():
+    with patch.object(executor, "ChatOpenAI") as mock_chat_openai:
+        mock_chat_openai.side_effect = lambda **kwargs: FakeListChatModel(responses=["hello", '{"foo": "bar"}'])
+        yield mock_chat_openai
+
+
+@pytest.fixture
+def langchain_executor(chat_openai):
+    return executor.LangChainExecutor(BasicLangChainConfig(openai_api_key="sk-test"))
+
+
+def test_llm_client_is_shared_between_calls(langchain_executor, chat_openai):
+    prompt = PromptTemplate.from_template("{user_message}")
+
+    assert langchain_executor.chat(prompt, user_message="hi") == "hello"
+    assert langchain_executor.reconfigure(prompt, user_message="hi") == {"foo": "bar"}
+    chat_openai.assert_called_once()
+
+
+def test_configure_rebuilds_llm_client(langchain_executor, chat_openai):
+    prompt = PromptTemplate.from_template("{user_message}")
+    langchain_executor.chat(prompt, user_message="hi")
+
+    langchain_executor.configure(BasicLangChainConfig(openai_api_key="sk-test", openai_api_model="gpt-4o-mini"))
+    langchain_executor.chat(prompt, user_message="hi")
+
+    assert chat_openai.call_count == 2
+    assert chat_openai.call_args.kwargs["model"] == "gpt-4o-mini"
+
+
+@pytest.mark.asyncio
+async def test_async_api(langchain_executor, chat_openai):
+    prompt = PromptTemplate.from_template("{user_message}")
+
+    assert await langchain_executor.achat(prompt, user_message="hi") == "hello"
+    assert await langchain_executor.areconfigure(prompt, user_message="hi") == {"foo": "bar"}
+    chat_openai.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_batch_generate_plan_returns_failures_in_place(chat_openai):
+    plan = "```yaml\nname: plan\ndescription: test\nsteps: []\n```"
+    chat_openai.side_effect = lambda **kwargs: FakeListChatModel(responses=[plan, "no plan here", plan])
+    langchain_executor = executor.LangChainExecutor(BasicLangChainConfig(openai_api_key="sk-test"))
+    prompt = PromptTemplate.from_template("{goal}\n{available_functions}")
+
+    with patch.object(FakeListChatModel, "bind_tools", create=True):
+        plans = await langchain_executor.abatch_generate_plan(
+            prompt,
+            [{"goal": goal, "available_functions": []} for goal in ("a", "b", "c")],
+            max_concurrency=1,
+        )
+
+    assert [type(plan).__name__ for plan in plans] == ["Workflow", "OutputParserException", "Workflow"]
+    chat_openai.assert_called_once()
+
+
+def test_render_past_interactions():
+    summary = InteractionSummaryModel(goal="g", plan_summary="plan: fetch (fetch-tool)", outcome="boom", success=False)
+
+    assert executor.render_past_interactions([]) == "None"
+    assert executor.render_past_interactions([summary]) == (
+        "- goal: g\n    - plan: plan: fetch (fetch-tool)\n    - failed with: boom\n"
+    )
+    assert executor.render_past_interactions([{"goal": "g"}]) == "None"
+    assert executor.render_past_interactions({"results": []}) == "None"
+
+
+def handoff_tool(agent):
+    return ToolModel(
+        name="handoff-tool",
+        version="0.1.0",
+        default_parameters={"endpoint": f"http://{agent}"},
+        openai_function_spec={
+            "type": "function",
+            "function": {"name": f"{agent}_handle", "description": agent, "parameters": {}},
+        },
+    )
+
+
+@pytest.mark.asyncio
+async def test_batch_generate_plan_keeps_each_goal_handoff_targets(chat_openai):
+    plan = "```yaml\nname: plan\ndescription: test\nsteps:\n  - name: delegate\n    tool: handoff-tool\n```"
+    chat_openai.side_effect = lambda **kwargs: FakeListChatModel(responses=[plan])
+    langchain_executor = executor.LangChainExecutor(BasicLangChainConfig(openai_api_key="sk-test"))
+    prompt = PromptTemplate.from_template("{goal}\n{available_functions}")
+
+    with patch.object(FakeListChatModel, "bind_tools", create=True):
+        plans = await langchain_executor.abatch_generate_plan(
+            prompt,
+            [
+                {"goal": "a", "available_functions": [handoff_tool("agent_a")]},
+                {"goal": "b", "available_functions": [handoff_tool("agent_b")]},
+            ],
+        )
+
+    assert [plan.steps[0].tool.default_parameters["endpoint"] for plan in plans] == ["http://agent_a", "http://agent_b"]
+
+
+class TrackingChain:
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+
+    async def ainvoke(self, kwargs):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return kwargs["goal"]
+
+
+@pytest.mark.asyncio
+async def test_batch_generate_plan_limits_concurrency_across_tool_sets(langchain_executor):
+    chain = TrackingChain()
+
+    def plan_chain(prompt, kwargs):
+        kwargs["available_functions"] = ""
+        return chain
+
+    with patch.object(langchain_executor, "_plan_chain", plan_chain):
+        plans = await langchain_executor.abatch_generate_plan(
+            PromptTemplate.from_template("{goal}"),
+            [{"goal": goal, "available_functions": [handoff_tool(goal)]} for goal in ("a", "b", "c", "d")],
+            max_concurrency=2,
+        )
+
+    assert plans == ["a", "b", "c", "d"]
+    assert chain.peak == 2
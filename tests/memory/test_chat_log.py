@@ -0,0 +1,68 @@
+import pytest
+
+from pantheon_sdk.agents.memory.chat_log import ChatLog
+
+fakeredis = pytest.importorskip("fakeredis", reason="fakeredis[lua] is needed to run the append script")
+
+
+def make_log(max_messages=3, ttl=None):
+    chat_log = ChatLog("redis://localhost", max_messages=max_messages, ttl=ttl)
+    chat_log._client = fakeredis.FakeRedis(decode_responses=True)
+    return chat_log
+
+
+def messages(*contents):
+    return [{"role": "user", "content": content} for content in contents]
+
+
+def contents(tail):
+    return [message["content"] for message in tail]
+
+
+def test_appends_return_the_index_of_their_first_message():
+    chat_log = make_log(max_messages=0)
+
+    assert chat_log.append("s1", messages("a", "b")) == 0
+    assert chat_log.append("s1", messages("c")) == 2
+    assert chat_log.append("s1", []) == 3
+    assert chat_log.append("s2", messages("x")) == 0
+    assert [(m["index"], m["content"]) for m in chat_log.tail("s1", 10)] == [(0, "a"), (1, "b"), (2, "c")]
+
+
+def test_appends_past_max_messages_trim_the_head():
+    chat_log = make_log(max_messages=3)
+    for content in "abcde":
+        chat_log.append("s1", messages(content))
+
+    tail = chat_log.tail("s1", 10)
+    assert contents(tail) == ["c", "d", "e"]
+    assert [m["index"] for m in tail] == [2, 3, 4]
+    assert chat_log.length("s1") == 5
+
+
+def test_batch_larger_than_max_messages_keeps_its_last_messages():
+    chat_log = make_log(max_messages=3)
+    chat_log.append("s1", messages("a"))
+
+    assert chat_log.append("s1", messages("b", "c", "d", "e", "f")) == 1
+    assert [(m["index"], m["content"]) for m in chat_log.tail("s1", 10)] == [(3, "d"), (4, "e"), (5, "f")]
+    assert chat_log.append("s1", messages("g")) == 6
+
+
+def test_tail_limits():
+    chat_log = make_log(max_messages=0)
+    chat_log.append("s1", messages("a", "b", "c"))
+
+    assert contents(chat_log.tail("s1", 2)) == ["b", "c"]
+    assert contents(chat_log.tail("s1", 50)) == ["a", "b", "c"]
+    assert chat_log.tail("s1", 0) == []
+    assert chat_log.tail("unknown", 5) == []
+
+
+def test_sessions_expire_after_their_ttl():
+    chat_log = make_log(ttl=60)
+    chat_log.append("s1", messages("a", "b", "c", "d"))
+
+    log_key, offset_key = chat_log._keys("s1")
+    assert 0 < chat_log.client.ttl(log_key) <= 60
+    assert 0 < chat_log.client.ttl(offset_key) <= 60
@@ -0,0 +1,55 @@
+from unittest.mock import patch
+
+import pytest
+
+from pantheon_sdk.agents.memory.client import MemoryClient
+from pantheon_sdk.agents.memory.config import MemoryConfig
+
+
+@pytest.fixture
+def client():
+    with patch("pantheon_sdk.agents.memory.client.Memory") as memory_class:
+        client = MemoryClient(MemoryConfig())
+    assert client.memory is memory_class.from_config.return_value
+    return client
+
+
+def hit(goal, score, plan="plan", success=True):
+    return {"memory": goal, "score": score, "metadata": {"plan_summary": plan, "outcome": "{}", "success": success}}
+
+
+def search_results(client, *hits):
+    client.memory.search.return_value = {"results": list(hits)}
+
+
+def test_interactions_are_sorted_and_cut_at_max_distance(client):
+    search_results(client, hit("far", 0.5), hit("closest", 0.1), hit("close", 0.2))
+
+    summaries = client.search_interactions("goal", scope="agent", top_k=5, max_distance=0.3)
+
+    assert [(s["goal"], s["distance"]) for s in summaries] == [("closest", 0.1), ("close", 0.2)]
+    assert summaries[0]["plan_summary"] == "plan"
+    client.memory.search.assert_called_once_with("goal", agent_id="agent", limit=5)
+
+
+def test_only_successful_interactions_fetch_more_candidates(client):
+    search_results(client, hit("a", 0.1, success=False), hit("b", 0.2), hit("c", 0.3, success=False), hit("d", 0.4))
+
+    summaries = client.search_interactions("goal", scope="agent", top_k=2, only_successful=True)
+
+    assert [s["goal"] for s in summaries] == ["b", "d"]
+    client.memory.search.assert_called_once_with("goal", agent_id="agent", limit=6)
+
+
+def test_repeated_interactions_are_returned_once(client):
+    search_results(client, hit("a", 0.1), hit("a", 0.15), hit("a", 0.2, plan="other plan"), hit("b", 0.3))
+
+    summaries = client.search_interactions("goal", scope="agent", top_k=3)
+
+    assert [(s["goal"], s["plan_summary"]) for s in summaries] == [("a", "plan"), ("a", "other plan"), ("b", "plan")]
+
+
+def test_search_errors_return_no_interactions(client):
+    client.memory.search.side_effect = ConnectionError("down")
+
+    assert client.search_interactions("goal", scope="agent") == []
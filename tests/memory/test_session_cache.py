@@ -0,0 +1,49 @@
+from pantheon_sdk.agents.memory.session_cache import ChatSessionCache
+
+
+def message(content, index=None):
+    msg = {"role": "user", "content": content}
+    return msg if index is None else {**msg, "index": index}
+
+
+def test_short_sessions_are_served_from_the_cache():
+    cache = ChatSessionCache(max_messages=10)
+    assert cache.get("s1", 10) is None
+
+    cache.load("s1", [message("a", 0), message("b", 1)], limit=10)
+
+    assert cache.get("s1", 10) == [message("a", 0), message("b", 1)]
+    assert cache.get("s1", 1) == [message("b", 1)]
+
+
+def test_truncated_sessions_only_answer_smaller_windows():
+    cache = ChatSessionCache(max_messages=10)
+    cache.load("s1", [message(str(i), i) for i in range(5, 10)], limit=5)
+
+    assert cache.get("s1", 5) == [message(str(i), i) for i in range(5, 10)]
+    assert cache.get("s1", 6) is None
+
+
+def test_write_through_keeps_the_window():
+    cache = ChatSessionCache(max_messages=3)
+    cache.append("new", [message("a"), message("b")], first_index=0)
+    cache.append("new", [message("c"), message("d")], first_index=2)
+
+    assert cache.get("new", 3) == [message("b", 1), message("c", 2), message("d", 3)]
+    assert cache.get("new", 4) is None
+
+
+def test_writes_from_other_replicas_invalidate_the_session():
+    cache = ChatSessionCache()
+    cache.load("s1", [message("a", 0)], limit=10)
+
+    cache.append("s1", [message("c")], first_index=2)  # index 1 was appended elsewhere
+    assert "s1" not in cache
+
+    cache.load("s1", [message("a", 0)], limit=10)
+    cache.append("s1", [message("b")], first_index=None)  # the backend write failed
+    assert "s1" not in cache
+
+    # Sessions started elsewhere are not cached from a partial write.
+    cache.append("s2", [message("x")], first_index=7)
+    assert "s2" not in cache
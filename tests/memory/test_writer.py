@@ -0,0 +1,121 @@
+import threading
+from unittest.mock import MagicMock
+
+from pantheon_sdk.agents.memory.writer import MemoryWriter
+
+
+def make_client():
+    client = MagicMock()
+    client.chat_log.append.side_effect = lambda session_id, messages: 10
+    return client
+
+
+def test_writes_are_applied_in_the_background():
+    client = make_client()
+    release = threading.Event()
+    client.write_interaction.side_effect = lambda *args: release.wait(5)
+    writer = MemoryWriter(client, batch_interval=0)
+
+    assert writer.store("goal", {"plan": 1})
+    assert len(writer) == 1  # the caller did not wait for the write
+
+    release.set()
+    assert writer.flush(timeout=5)
+    client.write_interaction.assert_called_once_with("goal", {"plan": 1})
+    assert len(writer) == 0
+
+
+def test_messages_of_a_session_are_appended_together():
+    client = make_client()
+    writer = MemoryWriter(client, batch_interval=0.2)
+    first_indexes = []
+
+    writer.append_messages("s1", [{"content": "a"}, {"content": "b"}], on_done=first_indexes.append)
+    writer.append_messages("s1", [{"content": "c"}], on_done=first_indexes.append)
+    writer.store_interaction_summary("g1", {"outcome": "1"}, scope="agent")
+    writer.store_interaction_summary("g2", {"outcome": "2"}, scope="agent")
+    assert writer.wait("s1", timeout=5)
+
+    client.chat_log.append.assert_called_once_with("s1", [{"content": "a"}, {"content": "b"}, {"content": "c"}])
+    assert first_indexes == [10, 12]
+    assert writer.flush(timeout=5)
+    client.write_interaction_summaries.assert_called_once_with(
+        [("g1", {"outcome": "1"}, "agent"), ("g2", {"outcome": "2"}, "agent")]
+    )
+
+
+def test_failed_writes_are_retried_then_dropped():
+    client = make_client()
+    client.write_interaction.side_effect = [ConnectionError("down"), None]
+    client.chat_log.append.side_effect = ConnectionError("down")
+    writer = MemoryWriter(client, batch_interval=0, max_retries=2, retry_backoff=0)
+    first_indexes = []
+
+    writer.store("goal", {"plan": 1})
+    writer.append_messages("s1", [{"content": "a"}], on_done=first_indexes.append)
+    assert writer.flush(timeout=5)
+
+    assert client.write_interaction.call_count == 2
+    assert client.chat_log.append.call_count == 3
+    assert first_indexes == [None]
+
+
+def test_retries_do_not_hold_up_other_keys():
+    client = make_client()
+    appended = []
+
+    def append(session_id, messages):
+        if session_id == "s1" and not appended:
+            appended.append(None)
+            raise ConnectionError("down")
+        appended.append((session_id, [message["content"] for message in messages]))
+        return 0
+
+    client.chat_log.append.side_effect = append
+    writer = MemoryWriter(client, batch_interval=0, retry_backoff=0.5)
+
+    writer.append_messages("s1", [{"content": "a"}])
+    assert writer.wait("s1", timeout=0.2) is False  # waiting for its retry
+    writer.append_messages("s2", [{"content": "x"}])
+    writer.append_messages("s1", [{"content": "b"}])
+    assert writer.wait("s2", timeout=0.2)
+
+    assert writer.flush(timeout=5)
+    assert appended == [None, ("s2", ["x"]), ("s1", ["a", "b"])]
+
+
+def test_writes_are_dropped_when_the_queue_is_full():
+    client = make_client()
+    release = threading.Event()
+    client.write_interaction.side_effect = lambda *args: release.wait(5)
+    writer = MemoryWriter(client, max_queue_size=1, batch_interval=0)
+    first_indexes = []
+
+    assert writer.store("goal", {"plan": 1})
+    assert not writer.append_messages("s1", [{"content": "a"}], on_done=first_indexes.append)
+    assert first_indexes == [None]
+
+    release.set()
+    assert writer.close(timeout=5)
+    client.chat_log.append.assert_not_called()
+
+
+def test_close_applies_queued_writes():
+    client = make_client()
+    writer = MemoryWriter(client, batch_interval=1)
+
+    writer.store("goal", {"plan": 1})
+    assert writer.close(timeout=5)
+
+    client.write_interaction.assert_called_once()
+    assert not writer.store("goal", {"plan": 2})
+
+
+def test_disabled_writer_writes_before_returning():
+    client = make_client()
+    writer = MemoryWriter(client, enabled=False)
+    first_indexes = []
+
+    writer.append_messages("s1", [{"content": "a"}], on_done=first_indexes.append)
+
+    assert first_indexes == [10]
@@ -0,0 +1,107 @@
+import os
+
+import pytest
+
+from pantheon_sdk.agents.orchestration import catalog as catalog_module
+from pantheon_sdk.agents.orchestration.catalog import WorkflowCatalog, get_workflow_catalog
+
+WORKFLOW = """
+id: {id}
+name: {name}
+description: test
+steps:
+  - name: answer
+    tool: return-answer-tool
+"""
+
+
+def write(path, **fields):
+    path.write_text(WORKFLOW.format(**fields))
+    # make sure the change is visible even on filesystems with coarse mtimes
+    stat = path.stat()
+    os.utime(path, (stat.st_atime, stat.st_mtime + 1))
+
+
+@pytest.fixture
+def parses(monkeypatch):
+    calls = []
+    parse = catalog_module.parse_workflow_file
+
+    def counting_parse(path):
+        calls.append(os.path.basename(path))
+        return parse(path)
+
+    monkeypatch.setattr(catalog_module, "parse_workflow_file", counting_parse)
+    return calls
+
+
+def test_workflows_are_indexed_by_id_and_parsed_once(tmp_path, parses):
+    write(tmp_path / "a.yaml", id="wf-a", name="a")
+    (tmp_path / "nested").mkdir()
+    write(tmp_path / "nested" / "b.yml", id="wf-b", name="b")
+    catalog = WorkflowCatalog(str(tmp_path), refresh_interval=0)
+
+    assert catalog.workflows().keys() == {"wf-a", "wf-b"}
+    assert catalog.get("wf-b").steps[0].tool.name == "return-answer-tool"
+    catalog.workflows()
+    assert sorted(parses) == ["a.yaml", "b.yml"]
+
+
+def test_only_changed_files_are_reloaded(tmp_path, parses):
+    write(tmp_path / "a.yaml", id="wf-a", name="a")
+    write(tmp_path / "b.yaml", id="wf-b", name="b")
+    catalog = WorkflowCatalog(str(tmp_path), refresh_interval=0)
+    catalog.workflows()
+    parses.clear()
+
+    write(tmp_path / "a.yaml", id="wf-a", name="renamed")
+    (tmp_path / "b.yaml").unlink()
+
+    workflows = catalog.workflows()
+    assert parses == ["a.yaml"]
+    assert workflows.keys() == {"wf-a"}
+    assert workflows["wf-a"].name == "renamed"
+
+
+def test_invalid_files_are_skipped_until_they_change(tmp_path, parses):
+    (tmp_path / "broken.yaml").write_text("id: wf-broken\nname: broken\n")
+    catalog = WorkflowCatalog(str(tmp_path), refresh_interval=0)
+
+    assert catalog.workflows() == {}
+    assert catalog.workflows() == {}
+    assert parses == ["broken.yaml"]
+
+
+def test_refreshes_are_throttled(tmp_path, parses):
+    catalog = WorkflowCatalog(str(tmp_path), refresh_interval=60)
+    catalog.workflows()
+    write(tmp_path / "a.yaml", id="wf-a", name="a")
+
+    assert catalog.workflows() == {}
+    catalog.refresh(force=True)
+    assert catalog.workflows().keys() == {"wf-a"}
+
+
+def test_one_catalog_per_process(monkeypatch):
+    monkeypatch.setattr(get_workflow_catalog(), "refresh_interval", get_workflow_catalog().refresh_interval)
+    catalog = get_workflow_catalog(30.0)
+
+    assert get_workflow_catalog() is catalog
+    assert catalog.refresh_interval == 30.0
+
+
+def test_reads_copy_the_entries_under_the_refresh_lock(tmp_path):
+    write(tmp_path / "a.yaml", id="wf-a", name="a")
+    catalog = WorkflowCatalog(str(tmp_path), refresh_interval=60)
+    catalog.refresh()
+
+    class LockCheckingEntries(dict):
+        # The scheduler thread refreshes the catalog while requests read it.
+        def items(self):
+            assert catalog._lock.locked(), "entries read without the lock"
+            return super().items()
+
+    catalog._entries = LockCheckingEntries(catalog._entries)
+
+    assert catalog.workflows().keys() == {"wf-a"}
+    assert list(catalog.raw_workflows()) == [str(tmp_path / "a.yaml")]
@@ -0,0 +1,95 @@
+import pytest
+
+from pantheon_sdk.agents.models import InputItem, OutputItem, ToolModel, Workflow, WorkflowStep
+from pantheon_sdk.agents.orchestration.dag import (
+    build_dependency_graph,
+    find_sinks,
+    link_implicit_inputs,
+    resolve_references,
+    topological_order,
+)
+
+TOOL = ToolModel(name="some-tool", version="1.0.0", openai_function_spec={})
+
+
+def make_step(name, inputs=None, outputs=(), dependencies=()):
+    return WorkflowStep(
+        name=name,
+        tool=TOOL,
+        inputs=[InputItem(name=k, value=v) for k, v in (inputs or {}).items()],
+        outputs=[OutputItem(name=o) for o in outputs],
+        dependencies=list(dependencies),
+    )
+
+
+@pytest.fixture
+def workflow():
+    # fetch-eth and fetch-btc are independent, compare needs both, report needs compare
+    return Workflow(
+        name="prices",
+        description="",
+        steps=[
+            make_step("report", {"text": "Result: {{steps.compare.outputs.winner}}"}),
+            make_step("fetch-eth", {"symbol": "ETH"}, outputs=["price"]),
+            make_step("fetch-btc", {"symbol": "BTC"}, outputs=["price"]),
+            make_step(
+                "compare",
+                {"a": "{{ steps.fetch-eth.outputs.price }}", "b": "{{steps.fetch-btc.outputs.price}}"},
+                outputs=["winner"],
+            ),
+        ],
+    )
+
+
+def test_dependency_graph(workflow):
+    assert build_dependency_graph(workflow) == {
+        "report": ["compare"],
+        "fetch-eth": [],
+        "fetch-btc": [],
+        "compare": ["fetch-eth", "fetch-btc"],
+    }
+
+
+def test_topological_order_keeps_plan_order_for_independent_steps(workflow):
+    assert [step.name for step in topological_order(workflow)] == ["fetch-eth", "fetch-btc", "compare", "report"]
+
+
+def test_sinks():
+    workflow = Workflow(
+        name="wf", description="", steps=[make_step("a"), make_step("b"), make_step("c", dependencies=["a"])]
+    )
+    assert find_sinks(workflow) == ["b", "c"]
+
+
+def test_implicit_inputs_are_linked_to_earlier_outputs():
+    workflow = Workflow(
+        name="wf",
+        description="",
+        steps=[make_step("fetch", outputs=["price"]), make_step("notify", {"price": None})],
+    )
+
+    linked = link_implicit_inputs(workflow)
+
+    assert linked.steps[1].inputs[0].value == "{{steps.fetch.outputs.price}}"
+    assert workflow.steps[1].inputs[0].value is None
+    assert build_dependency_graph(workflow)["notify"] == ["fetch"]
+
+
+def test_invalid_graphs_are_rejected():
+    unknown = Workflow(name="wf", description="", steps=[make_step("a", dependencies=["missing"])])
+    cyclic = Workflow(
+        name="wf", description="", steps=[make_step("a", dependencies=["b"]), make_step("b", dependencies=["a"])]
+    )
+
+    with pytest.raises(ValueError, match="unknown steps"):
+        build_dependency_graph(unknown)
+    with pytest.raises(ValueError, match="cyclic"):
+        topological_order(cyclic)
+
+
+def test_resolve_references():
+    results = {"fetch-eth": {"price": 3000}, "summary": "all good"}
+
+    assert resolve_references("{{steps.fetch-eth.outputs.price}}", results) == 3000
+    assert resolve_references("ETH is {{steps.fetch-eth.outputs.price}}", results) == "ETH is 3000"
+    assert resolve_references({"x": ["{{steps.summary.outputs.text}}"]}, results) == {"x": ["all good"]}
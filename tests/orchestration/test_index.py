@@ -0,0 +1,62 @@
+import pytest
+
+from pantheon_sdk.agents.orchestration.index import WorkflowIndex, WorkflowIndexEntry
+
+
+@pytest.fixture
+def index():
+    index = WorkflowIndex()
+    for i in range(5):
+        index.add(
+            WorkflowIndexEntry(
+                workflow_id=f"dag-{i}",
+                status="SUCCESSFUL" if i % 2 == 0 else "FAILED",
+                created_at=float(i),
+                agent="agent-a" if i < 3 else "agent-b",
+            )
+        )
+    return index
+
+
+def ids(page):
+    return [item.workflow_id for item in page.items]
+
+
+def test_pages_are_newest_first_and_cursor_continues(index):
+    first = index.list(limit=2)
+    second = index.list(limit=2, cursor=first.next_cursor)
+    last = index.list(limit=2, cursor=second.next_cursor)
+
+    assert ids(first) == ["dag-4", "dag-3"]
+    assert ids(second) == ["dag-2", "dag-1"]
+    assert ids(last) == ["dag-0"]
+    assert last.next_cursor is None
+
+
+def test_filters(index):
+    assert ids(index.list(status="FAILED")) == ["dag-3", "dag-1"]
+    assert ids(index.list(status="SUCCESSFUL", agent="agent-a")) == ["dag-2", "dag-0"]
+
+
+def test_status_updates_and_size_bound():
+    index = WorkflowIndex(max_size=2)
+    for i in range(3):
+        index.add(WorkflowIndexEntry(workflow_id=f"dag-{i}", status="RUNNING", created_at=float(i)))
+
+    index.update_status("dag-2", "SUCCESSFUL")
+
+    assert "dag-0" not in index
+    assert index.find("RUNNING") == ["dag-1"]
+    assert ids(index.list(status="SUCCESSFUL")) == ["dag-2"]
+
+    index.add(WorkflowIndexEntry(workflow_id="older", status="SUCCESSFUL", created_at=0.5))
+    assert ids(index.list()) == ["dag-2", "dag-1"]
+
+
+def test_invalid_cursor(index):
+    with pytest.raises(ValueError, match="Invalid workflow cursor"):
+        index.list(cursor="not-a-cursor")
+
+
+def test_statuses_only_cover_indexed_workflows(index):
+    assert index.statuses(["dag-0", "dag-1", "unknown"]) == {"dag-0": "SUCCESSFUL", "dag-1": "FAILED"}
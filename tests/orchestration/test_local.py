@@ -0,0 +1,160 @@
+import os
+import time
+
+import pytest
+
+from pantheon_sdk.agents.deadline import DeadlineExceededError, deadline_scope
+from pantheon_sdk.agents.models import InputItem, OutputItem, ParameterItem, ToolModel, Workflow, WorkflowStep
+from pantheon_sdk.agents.orchestration import local
+from pantheon_sdk.agents.orchestration.config import BasicWorkflowConfig
+from pantheon_sdk.agents.orchestration.local import HybridWorkflowRunner, LocalWorkflowRunner
+
+
+def fetch_price(symbol):
+    time.sleep(0.2)
+    return {"price": {"ETH": 3000, "BTC": 60000}[symbol]}
+
+
+async def compare(a, b):
+    return {"winner": "BTC" if b > a else "ETH"}
+
+
+class RemoteFunction:
+    # Mimics a Ray remote function wrapping the tool.
+    def __init__(self, function):
+        self._function = function
+
+
+TOOLS = {"fetch-price": RemoteFunction(fetch_price), "compare": compare}
+
+
+def fake_load_tool_entrypoint(package_name, version=None):
+    if package_name not in TOOLS:
+        raise ValueError(f"Tool {package_name} not found in entry points")
+    return TOOLS[package_name]
+
+
+@pytest.fixture(autouse=True)
+def tools(monkeypatch):
+    monkeypatch.setattr(local, "load_tool_entrypoint", fake_load_tool_entrypoint)
+
+
+def make_tool(name):
+    return ToolModel(name=name, version="1.0.0", openai_function_spec={}, default_parameters={"params": {}})
+
+
+def make_plan():
+    return Workflow(
+        name="prices",
+        description="",
+        steps=[
+            WorkflowStep(
+                name="eth", tool=make_tool("fetch-price"), inputs=[InputItem(name="symbol", value="ETH")], outputs=[]
+            ),
+            WorkflowStep(
+                name="btc", tool=make_tool("fetch-price"), inputs=[InputItem(name="symbol", value="BTC")], outputs=[]
+            ),
+            WorkflowStep(
+                name="compare",
+                tool=make_tool("compare"),
+                inputs=[
+                    InputItem(name="a", value="{{steps.eth.outputs.price}}"),
+                    InputItem(name="b", value="{{steps.btc.outputs.price}}"),
+                ],
+                outputs=[OutputItem(name="winner")],
+            ),
+        ],
+    )
+
+
+@pytest.mark.asyncio
+async def test_local_runner_runs_independent_steps_concurrently():
+    runner = LocalWorkflowRunner(BasicWorkflowConfig())
+    plan = make_plan()
+
+    started = time.monotonic()
+    result = await runner.run(plan)
+
+    assert result == {"winner": "BTC"}
+    assert time.monotonic() - started < 0.35
+    assert [item.workflow_id for item in (await runner.list_workflows("SUCCESSFUL")).items] == [plan.id]
+
+
+@pytest.mark.asyncio
+async def test_local_runner_records_failures():
+    runner = LocalWorkflowRunner(BasicWorkflowConfig())
+    plan = make_plan()
+    plan.steps[0].inputs[0].value = "DOGE"
+
+    with pytest.raises(KeyError):
+        await runner.run(plan)
+
+    assert [item.workflow_id for item in (await runner.list_workflows("FAILED")).items] == [plan.id]
+
+
+def test_hybrid_runner_routes_by_size_and_tool_availability():
+    runner = HybridWorkflowRunner(BasicWorkflowConfig(WORKFLOW_LOCAL_MAX_STEPS=3))
+    plan = make_plan()
+    unknown_tool = make_plan()
+    unknown_tool.steps[0].tool = make_tool("not-installed")
+
+    assert runner.select_runner(plan) is runner.local_runner
+    assert runner.select_runner(unknown_tool) is runner.ray_runner
+
+    runner.reconfigure({"WORKFLOW_LOCAL_MAX_STEPS": 2})
+    assert runner.select_runner(plan) is runner.ray_runner
+
+
+@pytest.mark.asyncio
+async def test_steps_with_environment_variables_are_not_run_in_process():
+    runner = HybridWorkflowRunner(BasicWorkflowConfig(WORKFLOW_LOCAL_MAX_STEPS=3))
+    plan = make_plan()
+    plan.steps[2].parameters = [ParameterItem(name="currency", value="USD")]
+
+    assert runner.select_runner(plan) is runner.ray_runner
+    with pytest.raises(ValueError, match="environment variables"):
+        await runner.local_runner.run(plan)
+    assert "params__currency" not in os.environ
+
+
+def test_other_tool_versions_are_not_run_in_process(monkeypatch):
+    runner = LocalWorkflowRunner(BasicWorkflowConfig())
+    loaded = []
+
+    def load_version(package_name, version=None):
+        loaded.append(version)
+        if version != "1.0.0":
+            raise ValueError(f"Tool {package_name}=={version} not found")
+        return TOOLS[package_name]
+
+    monkeypatch.setattr(local, "load_tool_entrypoint", load_version)
+    other_version = make_tool("compare").model_copy(update={"version": "2.0.0"})
+
+    assert runner.has_tool(make_tool("compare"))
+    assert not runner.has_tool(other_version)
+    assert runner.has_tool(make_tool("compare"))
+    assert loaded == ["1.0.0", "2.0.0", "1.0.0"]
+
+
+@pytest.mark.asyncio
+async def test_local_runner_step_timeout():
+    runner = LocalWorkflowRunner(BasicWorkflowConfig(WORKFLOW_STEP_TIMEOUT=0.05))
+    plan = make_plan()
+
+    with pytest.raises(TimeoutError, match="timed out"):
+        await runner.run(plan)
+
+    assert [item.workflow_id for item in (await runner.list_workflows("FAILED")).items] == [plan.id]
+
+
+@pytest.mark.asyncio
+async def test_local_runner_cancels_workflow_after_deadline():
+    runner = LocalWorkflowRunner(BasicWorkflowConfig())
+    plan = make_plan()
+
+    started = time.monotonic()
+    with deadline_scope(time.time() + 0.05), pytest.raises(DeadlineExceededError):
+        await runner.run(plan)
+
+    assert time.monotonic() - started < 0.15
+    assert [item.workflow_id for item in (await runner.list_workflows("CANCELED")).items] == [plan.id]
@@ -0,0 +1,97 @@
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from pantheon_sdk.agents.orchestration import pool as pool_module
+from pantheon_sdk.agents.orchestration.utils import patched_environ
+
+REQUIREMENT = ("price-tool==1.0.0", "price-tool")
+
+
+class FakeWorkerHandle:
+    def __init__(self, package_name):
+        self.package_name = package_name
+        self.killed = False
+        self.warmed_up = False
+        self.warm_up = SimpleNamespace(remote=lambda: setattr(self, "warmed_up", True))
+
+
+class FakeToolWorker:
+    @staticmethod
+    def options(**kwargs):
+        return FakeToolWorker
+
+    @staticmethod
+    def remote(package_name):
+        return FakeWorkerHandle(package_name)
+
+
+@pytest.fixture
+def make_pool(monkeypatch):
+    monkeypatch.setattr(pool_module, "ToolWorker", FakeToolWorker)
+    monkeypatch.setattr(pool_module.ray, "kill", lambda handle: setattr(handle, "killed", True))
+    pool_class = pool_module.ToolWorkerPool.__ray_metadata__.modified_class
+
+    def make(min_size=1, max_size=2, idle_timeout=60.0):
+        return pool_class(min_size, max_size, idle_timeout)
+
+    return make
+
+
+def test_idle_workers_are_reused(make_pool):
+    pool = make_pool()
+
+    worker_id, handle = pool.acquire(*REQUIREMENT)
+    pool.release(REQUIREMENT[0], worker_id)
+
+    assert pool.acquire(*REQUIREMENT) == (worker_id, handle)
+    assert pool.stats() == {"price-tool==1.0.0": {"workers": 1, "busy": 1}}
+
+
+def test_pool_grows_up_to_max_size(make_pool):
+    pool = make_pool(max_size=2)
+
+    ids = {pool.acquire(*REQUIREMENT)[0] for _ in range(3)}
+
+    assert len(ids) == 2
+    assert pool.stats()["price-tool==1.0.0"]["workers"] == 2
+
+
+def test_idle_workers_are_evicted(make_pool):
+    pool = make_pool(min_size=1, max_size=3, idle_timeout=0)
+    acquired = [pool.acquire(*REQUIREMENT) for _ in range(2)]
+    busy_id, _ = pool.acquire(*REQUIREMENT)
+    for worker_id, _ in acquired:
+        pool.release(REQUIREMENT[0], worker_id)
+
+    pool._evict_idle()
+    assert pool.stats()["price-tool==1.0.0"]["workers"] == 1
+    assert all(handle.killed for _, handle in acquired)
+
+    pool.release(REQUIREMENT[0], busy_id)
+    pool._evict_idle()
+    assert pool.stats() == {}
+
+
+def test_prefetch_starts_min_size_workers(make_pool):
+    pool = make_pool(min_size=2)
+
+    pool.prefetch([REQUIREMENT])
+    pool.prefetch([REQUIREMENT])
+
+    slots = pool._workers["price-tool==1.0.0"]
+    assert len(slots) == 2
+    assert all(slot.handle.warmed_up for slot in slots)
+
+
+def test_patched_environ_restores_previous_values(monkeypatch):
+    monkeypatch.setenv("POOL_TEST_EXISTING", "old")
+    monkeypatch.delenv("POOL_TEST_NEW", raising=False)
+
+    with patched_environ({"POOL_TEST_EXISTING": "new", "POOL_TEST_NEW": 1}):
+        assert os.environ["POOL_TEST_EXISTING"] == "new"
+        assert os.environ["POOL_TEST_NEW"] == "1"
+
+    assert os.environ["POOL_TEST_EXISTING"] == "old"
+    assert "POOL_TEST_NEW" not in os.environ
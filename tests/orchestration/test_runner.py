@@ -0,0 +1,274 @@
+import time
+
+import pytest
+from ray.workflow.common import WorkflowStatus
+
+from pantheon_sdk.agents.deadline import deadline_scope
+from pantheon_sdk.agents.models import InputItem, ParameterItem, ToolModel, Workflow, WorkflowStep
+from pantheon_sdk.agents.orchestration import runner as runner_module
+from pantheon_sdk.agents.orchestration.config import BasicWorkflowConfig
+from pantheon_sdk.agents.orchestration.index import WorkflowIndexEntry, WorkflowPage
+from pantheon_sdk.agents.orchestration.models import CheckpointPolicy, StepCacheSettings
+from pantheon_sdk.agents.orchestration.runner import DAGRunner
+
+TOOL = ToolModel(name="price-tool", version="1.0.0", openai_function_spec={})
+
+
+def make_step(name, symbol, parameters=None):
+    return WorkflowStep(
+        name=name,
+        tool=TOOL,
+        inputs=[InputItem(name="symbol", value=symbol)],
+        parameters=[ParameterItem(name=k, value=v) for k, v in (parameters or {}).items()],
+    )
+
+
+def test_compiled_steps_are_reused():
+    runner = DAGRunner(BasicWorkflowConfig())
+
+    eth_task, eth_args = runner.create_step(make_step("eth", "ETH"))
+    btc_task, btc_args = runner.create_step(make_step("btc", "BTC"))
+    other_env_task, _ = runner.create_step(make_step("eth", "ETH", parameters={"currency": "EUR"}))
+
+    assert eth_task is btc_task
+    assert (eth_args, btc_args) == ({"symbol": "ETH"}, {"symbol": "BTC"})
+    assert other_env_task is not eth_task
+
+
+def test_reconfigure_drops_compiled_steps():
+    runner = DAGRunner(BasicWorkflowConfig())
+    task, _ = runner.create_step(make_step("eth", "ETH"))
+
+    runner.reconfigure({"WORKFLOW_STEP_MAX_RETRIES": 1})
+
+    assert runner.create_step(make_step("eth", "ETH"))[0] is not task
+
+
+def test_checkpoint_flag_is_part_of_the_compiled_step():
+    runner = DAGRunner(BasicWorkflowConfig())
+
+    checkpointed, _ = runner.create_step(make_step("eth", "ETH"), checkpoint=True)
+    ephemeral, _ = runner.create_step(make_step("eth", "ETH"), checkpoint=False)
+
+    assert checkpointed is not ephemeral
+
+
+@pytest.mark.parametrize(
+    ("policy", "expected"),
+    [
+        (CheckpointPolicy.ALL, {"fetch": True, "notify": True}),
+        (CheckpointPolicy.FINAL, {"fetch": False, "notify": True}),
+        (CheckpointPolicy.NONE, {"fetch": False, "notify": False}),
+    ],
+)
+def test_checkpoint_policy(policy, expected):
+    runner = DAGRunner(BasicWorkflowConfig(WORKFLOW_CHECKPOINT_POLICY=policy))
+    plan = Workflow(name="wf", description="", steps=[make_step("fetch", "ETH"), make_step("notify", "ETH")])
+    plan.steps[1].dependencies = ["fetch"]
+
+    resolved = runner.checkpoint_policy(plan)
+
+    assert {step.name: runner.should_checkpoint(step, resolved, ["notify"]) for step in plan.steps} == expected
+
+
+def test_plan_and_step_override_the_configured_policy():
+    runner = DAGRunner(BasicWorkflowConfig(WORKFLOW_CHECKPOINT_POLICY=CheckpointPolicy.ALL))
+    step = make_step("fetch", "ETH")
+    plan = Workflow(name="wf", description="", steps=[step], checkpoint_policy=CheckpointPolicy.NONE)
+
+    assert runner.checkpoint_policy(plan) == CheckpointPolicy.NONE
+    step.checkpoint = True
+    assert runner.should_checkpoint(step, CheckpointPolicy.NONE, []) is True
+
+
+def test_step_limits_follow_config_and_overrides():
+    runner = DAGRunner(BasicWorkflowConfig(WORKFLOW_STEP_TIMEOUT=30, WORKFLOW_TIMEOUT=60))
+    step = make_step("eth", "ETH")
+    plan = Workflow(name="prices", description="", steps=[step], timeout=10)
+
+    with deadline_scope(time.time() + 5) as request_deadline:
+        assert runner.workflow_deadline(plan) == request_deadline
+    deadline = runner.workflow_deadline(plan)
+    assert 9 < deadline - time.time() <= 10
+
+    assert runner.step_limits(step, deadline) == {"timeout": 30, "deadline": deadline}
+    step.timeout = 1
+    assert runner.step_limits(step, None) == {"timeout": 1, "deadline": None}
+    assert DAGRunner(BasicWorkflowConfig()).step_limits(make_step("eth", "ETH"), None) is None
+
+
+def test_step_calls_are_not_retried_on_timeouts():
+    calls = []
+
+    def timing_out():
+        calls.append(1)
+        raise TimeoutError("Step timed out after 1.0s")
+
+    with pytest.raises(TimeoutError):
+        runner_module.call_with_retries(timing_out, {"timeout": 1, "deadline": None}, max_retries=5)
+    assert len(calls) == 1
+
+
+def test_step_calls_are_retried_until_the_deadline():
+    calls = []
+
+    def failing():
+        calls.append(1)
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        runner_module.call_with_retries(failing, {"timeout": None, "deadline": None}, max_retries=2)
+    assert len(calls) == 3
+
+    calls.clear()
+    with pytest.raises(ValueError, match="boom"):
+        runner_module.call_with_retries(failing, {"timeout": None, "deadline": time.time() - 1}, max_retries=2)
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize(("step_timeout", "retry_exceptions"), [(None, True), (5, False)])
+def test_steps_with_limits_leave_exception_retries_to_the_step(monkeypatch, step_timeout, retry_exceptions):
+    runner = DAGRunner(BasicWorkflowConfig(WORKFLOW_INDEX_SHARED=False, WORKFLOW_STEP_TIMEOUT=step_timeout))
+    submitted = []
+    monkeypatch.setattr(runner_module.workflow, "run_async", lambda dag, **kwargs: submitted.append(dag))
+
+    runner.submit(Workflow(name="prices", description="", steps=[make_step("eth", "ETH")]), async_mode=True)
+
+    assert submitted[0].get_options()["retry_exceptions"] is retry_exceptions
+
+
+def test_tool_worker_pool_handle_is_kept(monkeypatch):
+    lookups = []
+    monkeypatch.setattr(runner_module, "get_tool_worker_pool", lambda **kwargs: lookups.append(kwargs) or object())
+    runner = DAGRunner(BasicWorkflowConfig(WORKFLOW_INDEX_SHARED=False))
+
+    assert runner._tool_worker_pool() is runner._tool_worker_pool()
+    assert len(lookups) == 1
+
+
+class FakeRemoteTool:
+    """Stands in for a tool's `@ray.remote` entrypoint, recording how it is called."""
+
+    def __init__(self):
+        self.options_used = []
+        self.calls = []
+
+    def options(self, **options):
+        self.options_used.append(options)
+        return self
+
+    def remote(self, **kwargs):
+        self.calls.append(kwargs)
+        return {"price": 3000}
+
+
+def test_cached_tools_run_as_child_tasks(monkeypatch):
+    tool = FakeRemoteTool()
+    monkeypatch.setattr(runner_module, "load_tool_entrypoint", lambda package_name, version: tool)
+    monkeypatch.setattr(runner_module.ray, "get", lambda ref, timeout=None: ref)
+    runner = DAGRunner(
+        BasicWorkflowConfig(
+            WORKFLOW_INDEX_SHARED=False,
+            WORKFLOW_STEP_CACHE_ENABLED=True,
+            WORKFLOW_STEP_CACHE_TOOLS={TOOL.name: StepCacheSettings(ttl=60)},
+        )
+    )
+    task, args = runner.create_step(make_step("eth", "ETH"))
+
+    for _ in range(2):
+        assert task._function(args, None) == {"price": 3000}
+
+    # The tool's own resource options are kept: only the runtime env is set, and the result is stored.
+    assert tool.calls == [{"symbol": "ETH"}]
+    assert all(options.keys() == {"runtime_env"} for options in tool.options_used)
+
+
+class FakeWorkflowStorage:
+    def __init__(self):
+        self.statuses = {}
+        self.metadata_reads = []
+
+    def list_all(self):
+        return [(wf_id, WorkflowStatus(status)) for wf_id, status in self.statuses.items()]
+
+    def get_metadata(self, workflow_id):
+        self.metadata_reads.append(workflow_id)
+        return {
+            "status": self.statuses[workflow_id],
+            "user_metadata": {"plan": {"name": "prices"}, "plan_hash": "abc", "agent": "agent-a"},
+            "stats": {"start_time": 100.0, "end_time": 110.0},
+        }
+
+    def get_status(self, workflow_id):
+        return WorkflowStatus(self.statuses[workflow_id])
+
+
+@pytest.fixture
+def storage(monkeypatch):
+    storage = FakeWorkflowStorage()
+    for name in ("list_all", "get_metadata", "get_status"):
+        monkeypatch.setattr(runner_module.workflow, name, getattr(storage, name))
+    return storage
+
+
+async def list_reconciled(runner: DAGRunner, **filters) -> WorkflowPage:
+    if runner._index_reconciliation is not None:
+        await runner._index_reconciliation  # started by an earlier listing, before storage changed
+    await runner.list_workflows(**filters)
+    await runner._index_reconciliation
+    return await runner.list_workflows(**filters)
+
+
+@pytest.mark.asyncio
+async def test_index_is_reconciled_with_ray_storage(storage):
+    runner = DAGRunner(BasicWorkflowConfig(WORKFLOW_INDEX_SHARED=False, WORKFLOW_INDEX_RECONCILE_INTERVAL=0))
+    runner.index.add(WorkflowIndexEntry(workflow_id="known", status="RESUMABLE", runner="ray"))
+    storage.statuses = {"known": "SUCCESSFUL", "other-replica": "RUNNING"}
+
+    page = await list_reconciled(runner)
+
+    entries = {item.workflow_id: item for item in page.items}
+    assert entries["known"].status == "SUCCESSFUL"
+    assert entries["other-replica"].model_dump(include={"created_at", "name", "plan_hash", "agent"}) == {
+        "created_at": 100.0,
+        "name": "prices",
+        "plan_hash": "abc",
+        "agent": "agent-a",
+    }
+    assert storage.metadata_reads == ["other-replica"]
+
+    storage.statuses["late"] = "FAILED"
+    assert [item.workflow_id for item in (await list_reconciled(runner, status="FAILED")).items] == ["late"]
+    assert storage.metadata_reads == ["other-replica", "late"]
+
+
+@pytest.mark.asyncio
+async def test_index_reconciliation_reads_each_workflow_once(storage):
+    runner = DAGRunner(
+        BasicWorkflowConfig(WORKFLOW_INDEX_SHARED=False, WORKFLOW_INDEX_RECONCILE_INTERVAL=0, WORKFLOW_INDEX_MAX_SIZE=1)
+    )
+    runner.index.add(WorkflowIndexEntry(workflow_id="recent", status="SUCCESSFUL", runner="ray"))
+    storage.statuses = {"recent": "SUCCESSFUL", "old-1": "SUCCESSFUL", "old-2": "FAILED"}
+
+    await list_reconciled(runner)
+    await list_reconciled(runner)
+
+    assert sorted(storage.metadata_reads) == ["old-1", "old-2"]
+    assert [item.workflow_id for item in (await runner.list_workflows()).items] == ["recent"]
+
+
+@pytest.mark.asyncio
+async def test_index_reconciliation_is_periodic(storage):
+    runner = DAGRunner(BasicWorkflowConfig(WORKFLOW_INDEX_SHARED=False, WORKFLOW_INDEX_RECONCILE_INTERVAL=60))
+    await list_reconciled(runner)
+    storage.statuses = {"late": "SUCCESSFUL"}
+
+    assert (await list_reconciled(runner)).items == []
+
+
+def test_empty_background_runs_leave_no_handle():
+    runner = DAGRunner(BasicWorkflowConfig(WORKFLOW_INDEX_SHARED=False))
+    empty = Workflow(name="empty", description="", steps=[])
+
+    assert runner._submit_background(empty) is None
+    assert runner.scheduler.is_done((empty.id, None))
@@ -0,0 +1,228 @@
+from datetime import datetime, timezone
+
+import pytest
+from pydantic import ValidationError
+
+from pantheon_sdk.agents.models import ToolModel, Workflow, WorkflowStep
+from pantheon_sdk.agents.orchestration.cron import CronSchedule
+from pantheon_sdk.agents.orchestration.models import WorkflowSettings
+from pantheon_sdk.agents.orchestration.scheduler import WorkflowScheduler
+
+TOOL = ToolModel(name="some-tool", version="1.0.0", openai_function_spec={})
+
+
+def utc(*args):
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize(
+    ("expression", "after", "expected"),
+    [
+        ("*/15 * * * *", utc(2026, 1, 1, 10, 7), utc(2026, 1, 1, 10, 15)),
+        ("0 9 * * 1-5", utc(2026, 1, 2, 9, 0), utc(2026, 1, 5, 9, 0)),  # Friday 9:00 -> Monday
+        ("30 2 1 * *", utc(2026, 1, 15), utc(2026, 2, 1, 2, 30)),
+        ("0 0 13 * 5", utc(2026, 2, 1), utc(2026, 2, 6)),  # day of month OR Friday
+    ],
+)
+def test_cron_next_after(expression, after, expected):
+    assert CronSchedule(expression).next_after(after) == expected
+
+
+def test_invalid_schedules_are_rejected():
+    with pytest.raises(ValidationError):
+        WorkflowSettings(cron="61 * * * *")
+    with pytest.raises(ValidationError):
+        WorkflowSettings(cron="* * *")
+    with pytest.raises(ValidationError):
+        WorkflowSettings(interval=60, cron="* * * * *")
+
+
+class FakeLease:
+    def __init__(self, leader=True, completed=None):
+        self.leader = leader
+        self.released = False
+        self.completed = set() if completed is None else completed
+
+    def acquire(self):
+        return self.leader
+
+    def release(self):
+        self.released = True
+
+    def is_complete(self, key):
+        return key in self.completed
+
+    def complete(self, key):
+        self.completed.add(key)
+
+
+class FakeRuns:
+    def __init__(self):
+        self.started = []
+        self.done = set()
+        self.cancelled = []
+
+    def submit(self, wf):
+        self.started.append(wf.id)
+        return wf.id
+
+    def is_done(self, handle):
+        return handle in self.done
+
+    def cancel(self, handle):
+        self.cancelled.append(handle)
+
+
+def make_workflow(wf_id):
+    return Workflow(id=wf_id, name=wf_id, description="", steps=[WorkflowStep(name="step", tool=TOOL)])
+
+
+def make_scheduler(runs, lease=None, max_concurrency=4, deployment="app@1.0"):
+    return WorkflowScheduler(
+        submit=runs.submit,
+        is_done=runs.is_done,
+        cancel=runs.cancel,
+        lease=lease or FakeLease(),
+        deployment_id=lambda: deployment,
+        max_concurrency=max_concurrency,
+        drain_timeout=0,
+    )
+
+
+def test_interval_runs_get_unique_ids_and_do_not_overlap():
+    runs = FakeRuns()
+    scheduler = make_scheduler(runs)
+    scheduler.schedule([(make_workflow("report"), WorkflowSettings(interval=60))], now=0)
+
+    first = scheduler.run_pending(now=0)
+    skipped = scheduler.run_pending(now=60)  # the first run is still in progress
+    runs.done.update(first)
+    second = scheduler.run_pending(now=120)
+
+    assert len(first) == len(second) == 1
+    assert skipped == []
+    assert first[0].startswith("report-")
+    assert first != second
+
+
+def test_one_shot_workflows_run_once():
+    runs = FakeRuns()
+    scheduler = make_scheduler(runs)
+    scheduler.schedule([(make_workflow("bootstrap"), WorkflowSettings())], now=0)
+
+    assert len(scheduler.run_pending(now=0)) == 1
+    runs.done.update(runs.started)
+    assert scheduler.run_pending(now=1000) == []
+
+
+def test_one_shot_workflows_do_not_run_again_on_a_new_leader():
+    completed = set()
+    old_leader, new_leader = FakeLease(completed=completed), FakeLease(leader=False, completed=completed)
+    schedulers = [make_scheduler(FakeRuns(), lease=lease) for lease in (old_leader, new_leader)]
+    for scheduler in schedulers:
+        scheduler.schedule([(make_workflow("bootstrap"), WorkflowSettings())], now=0)
+
+    assert len(schedulers[0].run_pending(now=0)) == 1
+    assert schedulers[1].run_pending(now=0) == []
+
+    old_leader.leader, new_leader.leader = False, True
+    assert schedulers[1].run_pending(now=100) == []
+    schedulers[1].schedule([(make_workflow("bootstrap"), WorkflowSettings())], now=200)  # e.g. a restart
+    assert schedulers[1].run_pending(now=200) == []
+
+
+def test_one_shot_workflows_run_again_after_a_redeploy():
+    lease = FakeLease()
+    before = make_scheduler(FakeRuns(), lease=lease, deployment="app@1.0")
+    after = make_scheduler(FakeRuns(), lease=lease, deployment="app@2.0")
+    for scheduler in (before, after):
+        scheduler.schedule([(make_workflow("bootstrap"), WorkflowSettings())], now=0)
+
+    assert len(before.run_pending(now=0)) == 1
+    assert len(after.run_pending(now=0)) == 1
+
+
+def test_one_shot_workflows_wait_for_the_deployment_id():
+    runs = FakeRuns()
+    deployments = iter([RuntimeError("controller unavailable"), "app@1.0"])
+
+    def deployment_id():
+        deployment = next(deployments)
+        if isinstance(deployment, Exception):
+            raise deployment
+        return deployment
+
+    scheduler = WorkflowScheduler(
+        submit=runs.submit, is_done=runs.is_done, lease=FakeLease(), deployment_id=deployment_id
+    )
+    scheduler.schedule([(make_workflow("bootstrap"), WorkflowSettings())], now=0)
+
+    assert scheduler.run_pending(now=0) == []
+    assert len(scheduler.run_pending(now=1)) == 1
+
+
+def test_runs_without_a_handle_are_not_tracked():
+    runs = FakeRuns()
+    runs.submit = lambda wf: None  # an empty plan
+    scheduler = make_scheduler(runs)
+    scheduler.schedule([(make_workflow("report"), WorkflowSettings(interval=60))], now=0)
+
+    assert len(scheduler.run_pending(now=0)) == 1
+    assert scheduler.in_flight() == 0
+    assert len(scheduler.run_pending(now=60)) == 1
+
+
+def test_refresh_picks_up_changed_workflows():
+    runs = FakeRuns()
+    workflows = [(make_workflow("report"), WorkflowSettings(interval=60))]
+    scheduler = WorkflowScheduler(
+        submit=runs.submit, is_done=runs.is_done, source=lambda: list(workflows), lease=FakeLease()
+    )
+
+    assert scheduler.refresh(now=0)
+    assert len(scheduler.run_pending(now=0)) == 1
+    assert not scheduler.refresh(now=30)
+
+    workflows.append((make_workflow("cleanup"), WorkflowSettings()))
+    assert scheduler.refresh(now=30)
+    # The unchanged workflow keeps its next run; the new one is due right away.
+    assert [wf_id.split("-")[0] for wf_id in scheduler.run_pending(now=30)] == ["cleanup"]
+
+    workflows[0] = (make_workflow("report"), WorkflowSettings(interval=10))
+    assert scheduler.refresh(now=40)
+    runs.done.update(runs.started)
+    assert [wf_id.split("-")[0] for wf_id in scheduler.run_pending(now=40)] == ["report"]
+
+
+def test_concurrency_cap_defers_due_runs():
+    runs = FakeRuns()
+    scheduler = make_scheduler(runs, max_concurrency=1)
+    scheduler.schedule(
+        [(make_workflow("a"), WorkflowSettings(interval=60)), (make_workflow("b"), WorkflowSettings(interval=60))],
+        now=0,
+    )
+
+    assert len(scheduler.run_pending(now=0)) == 1
+    runs.done.update(runs.started)
+    assert [wf_id.split("-")[0] for wf_id in scheduler.run_pending(now=1)] == ["b"]
+
+
+def test_only_the_leader_starts_runs():
+    runs = FakeRuns()
+    scheduler = make_scheduler(runs, lease=FakeLease(leader=False))
+    scheduler.schedule([(make_workflow("report"), WorkflowSettings(interval=60))], now=0)
+
+    assert scheduler.run_pending(now=0) == []
+
+
+def test_stop_cancels_runs_left_after_draining():
+    runs = FakeRuns()
+    lease = FakeLease()
+    scheduler = make_scheduler(runs, lease=lease)
+    scheduler.schedule([(make_workflow("report"), WorkflowSettings(interval=60))], now=0)
+    started = scheduler.run_pending(now=0)
+
+    scheduler.stop()
+
+    assert runs.cancelled == started
+    assert lease.released
@@ -0,0 +1,89 @@
+import time
+
+from pantheon_sdk.agents.models import ToolModel
+from pantheon_sdk.agents.orchestration.config import BasicWorkflowConfig
+from pantheon_sdk.agents.orchestration.models import StepCacheSettings
+from pantheon_sdk.agents.orchestration.step_cache import (
+    StepResultCache,
+    _hits,
+    call_memoized,
+    get_step_cache_settings,
+)
+
+TOOL = ToolModel(name="price-tool", version="1.0.0", openai_function_spec={})
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None):
+        self.data[key] = value
+
+
+class Counter:
+    def __init__(self, result):
+        self.result = result
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.result
+
+
+def test_identical_steps_run_once():
+    cache = StepResultCache()
+    settings = StepCacheSettings(ttl=60)
+    call = Counter({"price": 3000})
+    hits = _hits.value({"tool": "price-tool", "tier": "memory"})
+
+    first = call_memoized(cache, settings, TOOL, {}, {"symbol": "ETH"}, call)
+    second = call_memoized(cache, settings, TOOL, {}, {"symbol": "ETH"}, call)
+    call_memoized(cache, settings, TOOL, {}, {"symbol": "BTC"}, call)
+    call_memoized(cache, settings, TOOL, {"params__currency": "EUR"}, {"symbol": "ETH"}, call)
+
+    assert first == second == {"price": 3000}
+    assert call.calls == 3
+    assert _hits.value({"tool": "price-tool", "tier": "memory"}) == hits + 1
+
+
+def test_results_expire_unless_deterministic():
+    cache = StepResultCache()
+    call = Counter(1)
+
+    call_memoized(cache, StepCacheSettings(ttl=0.01), TOOL, {}, {"x": 1}, call)
+    call_memoized(cache, StepCacheSettings(deterministic=True, ttl=0.01), TOOL, {}, {"x": 2}, call)
+    time.sleep(0.02)
+    call_memoized(cache, StepCacheSettings(ttl=0.01), TOOL, {}, {"x": 1}, call)
+    call_memoized(cache, StepCacheSettings(deterministic=True, ttl=0.01), TOOL, {}, {"x": 2}, call)
+
+    assert call.calls == 3
+
+
+def test_shared_tier_is_used_across_workers():
+    redis = FakeRedis()
+    worker_a = StepResultCache(redis_url="redis://localhost")
+    worker_b = StepResultCache(redis_url="redis://localhost")
+    worker_a._shared._client = redis
+    worker_b._shared._client = redis
+    call = Counter({"price": 3000})
+
+    call_memoized(worker_a, StepCacheSettings(), TOOL, {}, {"symbol": "ETH"}, call)
+    result = call_memoized(worker_b, StepCacheSettings(), TOOL, {}, {"symbol": "ETH"}, call)
+
+    assert result == {"price": 3000}
+    assert call.calls == 1
+
+
+def test_caching_is_opt_in_per_tool():
+    settings = StepCacheSettings(ttl=30)
+
+    assert (
+        get_step_cache_settings(BasicWorkflowConfig(WORKFLOW_STEP_CACHE_TOOLS={"price-tool": settings}), TOOL) is None
+    )
+    enabled = BasicWorkflowConfig(WORKFLOW_STEP_CACHE_ENABLED=True, WORKFLOW_STEP_CACHE_TOOLS={"price-tool": settings})
+    assert get_step_cache_settings(enabled, TOOL) == settings
+    assert get_step_cache_settings(enabled, TOOL.model_copy(update={"name": "other-tool"})) is None
@@ -0,0 +1,71 @@
+import sys
+
+import pytest
+
+from pantheon_sdk.agents.orchestration import utils
+
+
+class FakeDistribution:
+    version = "1.0.0"
+
+
+class FakeEntryPoint:
+    def __init__(self, name, value):
+        self.name = name
+        self.value = value
+        self.dist = FakeDistribution()
+        self.loads = 0
+
+    def load(self):
+        self.loads += 1
+        return self.value
+
+
+@pytest.fixture
+def entry_points(monkeypatch):
+    eps = [FakeEntryPoint("other-tool", object()), FakeEntryPoint("price-tool", object())]
+    scans = []
+
+    def fake_get_entry_points(group):
+        scans.append(group)
+        return eps
+
+    monkeypatch.setattr(utils, "get_entry_points", fake_get_entry_points)
+    utils.clear_tool_cache()
+    yield eps, scans
+    utils.clear_tool_cache()
+
+
+def test_tools_are_resolved_once_per_worker(entry_points):
+    eps, scans = entry_points
+    hits = utils._tool_cache_hits.value({"tool": "price-tool"})
+
+    first = utils.load_tool_entrypoint("price-tool", "1.0.0")
+    second = utils.load_tool_entrypoint("price-tool", "1.0.0")
+
+    assert first is second is eps[1].value
+    assert len(scans) == 1
+    assert eps[1].loads == 1
+    assert utils._tool_cache_hits.value({"tool": "price-tool"}) == hits + 1
+
+
+def test_runtime_env_change_invalidates_cache(entry_points, monkeypatch):
+    _, scans = entry_points
+    utils.load_tool_entrypoint("price-tool")
+
+    monkeypatch.setattr(sys, "path", [*sys.path, "/opt/runtime-env/site-packages"])
+    utils.load_tool_entrypoint("price-tool")
+
+    assert len(scans) == 2
+
+
+def test_unknown_tool(entry_points):
+    with pytest.raises(ValueError, match="not found"):
+        utils.load_tool_entrypoint("missing-tool")
+
+
+def test_other_installed_version_is_not_loaded(entry_points):
+    eps, _ = entry_points
+    with pytest.raises(ValueError, match="version 1.0.0 is installed"):
+        utils.load_tool_entrypoint("price-tool", "2.0.0")
+    assert eps[1].loads == 0
@@ -0,0 +1,120 @@
+import threading
+import time
+
+import pytest
+
+from pantheon_sdk.agents.models import AgentModel, ToolModel, Workflow, WorkflowStep
+from pantheon_sdk.agents.plan_cache.cache import PlanCache
+from pantheon_sdk.agents.plan_cache.config import PlanCacheConfig
+
+AGENTS = [AgentModel(name="agent1", description="desc", version="1.0.0")]
+TOOL = ToolModel(
+    name="return-answer-tool",
+    version="0.1.2",
+    openai_function_spec={"type": "function", "function": {"name": "return_answer_tool", "description": "d"}},
+)
+OTHER_TOOL = ToolModel(name="price-tool", version="1.0.0", openai_function_spec={})
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None):
+        self.data[key] = value
+
+
+def fake_embedder(text: str) -> list[float]:
+    return [1.0, 0.0] if "price" in text else [0.0, 1.0]
+
+
+@pytest.fixture
+def plan():
+    return Workflow(name="answer", description="", steps=[WorkflowStep(name="answer", tool=TOOL)])
+
+
+def test_exact_hit_on_normalized_goal(plan):
+    cache = PlanCache(PlanCacheConfig())
+    cache.set("What is  the answer?", AGENTS, [TOOL], plan)
+
+    hit = cache.get("what is the ANSWER?", AGENTS, [TOOL])
+    assert hit.steps == plan.steps
+    assert hit.id != plan.id
+
+
+def test_miss_when_resources_change(plan):
+    cache = PlanCache(PlanCacheConfig())
+    cache.set("goal", AGENTS, [TOOL], plan)
+
+    assert cache.get("goal", AGENTS, [TOOL, OTHER_TOOL]) is None
+    assert cache.get("goal", [], [TOOL]) is None
+    assert cache.get("goal", AGENTS, [TOOL]) is not None
+
+
+def test_entries_expire(plan):
+    cache = PlanCache(PlanCacheConfig(ttl=0.01))
+    cache.set("goal", AGENTS, [TOOL], plan)
+    time.sleep(0.02)
+
+    assert cache.get("goal", AGENTS, [TOOL]) is None
+
+
+def test_disabled_cache_never_hits(plan):
+    cache = PlanCache(PlanCacheConfig(enabled=False))
+    cache.set("goal", AGENTS, [TOOL], plan)
+
+    assert cache.get("goal", AGENTS, [TOOL]) is None
+
+
+def test_similarity_hit(plan):
+    cache = PlanCache(PlanCacheConfig(similarity_enabled=True, similarity_threshold=0.9), embedder=fake_embedder)
+    cache.set("get the eth price", AGENTS, [TOOL], plan)
+
+    assert cache.get("fetch current price of eth", AGENTS, [TOOL]).steps == plan.steps
+    assert cache.get("tell me a joke", AGENTS, [TOOL]) is None
+
+
+def test_shared_tier_is_used_across_replicas(plan):
+    redis = FakeRedis()
+    replica_a = PlanCache(PlanCacheConfig(redis_enabled=True))
+    replica_b = PlanCache(PlanCacheConfig(redis_enabled=True))
+    replica_a._shared._client = redis
+    replica_b._shared._client = redis
+
+    replica_a.set("goal", AGENTS, [TOOL], plan)
+
+    assert replica_b.get("goal", AGENTS, [TOOL]).steps == plan.steps
+
+
+@pytest.mark.asyncio
+async def test_async_lookups_embed_off_the_event_loop(plan):
+    embedding_threads = []
+
+    def embedder(text):
+        embedding_threads.append(threading.current_thread())
+        return fake_embedder(text)
+
+    cache = PlanCache(PlanCacheConfig(similarity_enabled=True, similarity_threshold=0.9), embedder=embedder)
+    await cache.aset("get the eth price", AGENTS, [TOOL], plan)
+
+    assert (await cache.aget("fetch current price of eth", AGENTS, [TOOL])).steps == plan.steps
+    assert len(embedding_threads) == 2
+    assert threading.main_thread() not in embedding_threads
+
+
+def test_similarity_scan_keeps_lru_order(plan):
+    cache = PlanCache(
+        PlanCacheConfig(max_size=2, similarity_enabled=True, similarity_threshold=1.1), embedder=fake_embedder
+    )
+    cache.set("get the eth price", AGENTS, [TOOL], plan)
+    cache.set("tell me a joke", AGENTS, [TOOL], plan)
+    assert cache.get("get the eth price", AGENTS, [TOOL]) is not None  # the joke is now the oldest
+
+    assert cache.get("unrelated goal", AGENTS, [TOOL]) is None
+    cache.set("third goal", AGENTS, [TOOL], plan)
+
+    assert cache.get("tell me a joke", AGENTS, [TOOL]) is None
+    assert cache.get("get the eth price", AGENTS, [TOOL]) is not None
@@ -0,0 +1,43 @@
+import time
+
+import pytest
+
+from pantheon_sdk.agents.deadline import (
+    DEADLINE_HEADER,
+    DeadlineExceededError,
+    deadline_headers,
+    deadline_scope,
+    get_deadline,
+    parse_deadline,
+    time_left,
+)
+
+
+def test_scope_keeps_the_earlier_deadline():
+    now = time.time()
+    with deadline_scope(now + 10):
+        with deadline_scope(now + 20) as inner:
+            assert inner == now + 10
+        with deadline_scope(now + 5):
+            assert get_deadline() == now + 5
+        assert get_deadline() == now + 10
+    assert get_deadline() is None
+
+
+def test_time_left():
+    assert time_left() is None
+    assert time_left(timeout=3) == 3
+    with deadline_scope(time.time() + 10):
+        assert 9 < time_left() <= 10
+        assert time_left(timeout=1) == 1
+    with pytest.raises(DeadlineExceededError):
+        time_left(time.time() - 1)
+
+
+def test_headers_round_trip():
+    deadline = time.time() + 10
+    assert parse_deadline(deadline_headers(deadline)[DEADLINE_HEADER]) == deadline
+    assert deadline_headers() == {}
+    assert parse_deadline(None) is None
+    with pytest.raises(ValueError, match="Invalid"):
+        parse_deadline("tomorrow")
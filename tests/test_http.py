@@ -0,0 +1,44 @@
+import pickle
+
+import httpx
+import pytest
+
+from pantheon_sdk.agents.ai_registry.client import AiRegistryClient
+from pantheon_sdk.agents.ai_registry.config import AiRegistryConfig
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={"path": request.url.path})
+
+
+@pytest.fixture
+def registry_client():
+    client = AiRegistryClient(AiRegistryConfig(url="http://registry"))
+    client._client = httpx.Client(transport=httpx.MockTransport(_handler))
+    return client
+
+
+def test_pool_is_reused(registry_client):
+    pool = registry_client.client
+    assert registry_client.post("/agents/find", json={}) == {"path": "/agents/find"}
+    assert registry_client.post("/tools/find", json={}) == {"path": "/tools/find"}
+    assert registry_client.client is pool
+
+
+def test_close_releases_the_pool(registry_client):
+    assert registry_client.post("/agents/find", json={}) == {"path": "/agents/find"}
+    registry_client.close()
+    assert registry_client._client is None
+
+
+def test_http2_requires_h2(monkeypatch):
+    monkeypatch.setattr("importlib.util.find_spec", lambda name: None)
+    with pytest.raises(ValueError, match="h2"):
+        AiRegistryClient(AiRegistryConfig(url="http://registry", http2=True))
+
+
+def test_pools_are_not_pickled(registry_client):
+    restored = pickle.loads(pickle.dumps(registry_client))
+    assert restored._client is None
+    assert restored.url == "http://registry"
+    assert restored.limits == registry_client.limits
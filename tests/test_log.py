@@ -0,0 +1,97 @@
+import sys
+from unittest.mock import patch
+
+import pytest
+from loguru import logger
+from pydantic import BaseModel
+
+from pantheon_sdk.agents import log
+from pantheon_sdk.agents.log import get_log_config, log_event, truncate
+
+
+def capture(level):
+    records = []
+    logger.remove()
+    logger.add(records.append, level=level, format="{message}")
+    return records
+
+
+@pytest.fixture(autouse=True)
+def restore_logger():
+    yield
+    logger.remove()
+    logger.add(sys.stderr)
+
+
+@pytest.fixture
+def records():
+    return capture("INFO")
+
+
+@pytest.fixture
+def log_config():
+    config = get_log_config()
+    saved = config.model_dump()
+    yield config
+    for key, value in saved.items():
+        setattr(config, key, value)
+
+
+def test_truncate_bounds_large_payloads():
+    assert truncate("short", max_chars=10) == "short"
+    assert truncate("x" * 30, max_chars=10) == "xxxxxxxxxx... (20 more chars)"
+    assert truncate(list(range(100)), max_items=3) == "[0, 1, 2, ...]"
+
+
+def test_models_are_truncated_without_rendering_them_in_full():
+    class Step(BaseModel):
+        name: str
+        args: list[int]
+
+    class Plan(BaseModel):
+        name: str
+        steps: list[Step]
+
+    plan = Plan(name="p", steps=[Step(name=f"s{i}", args=list(range(1000))) for i in range(100)])
+
+    with patch.object(Step, "__repr__", side_effect=AssertionError("rendered in full")):
+        text = truncate(plan, max_chars=1000, max_items=2)
+
+    assert text == "Plan(name='p', steps=[Step(name='s0', args=[0, 1, ...]), Step(name='s1', args=[0, 1, ...]), ...])"
+
+
+def test_payloads_are_not_formatted_below_the_sink_level(records):
+    with patch.object(log, "_format") as format_event:
+        log_event("test.debug", "hidden", level="DEBUG", payload=object())
+
+    format_event.assert_not_called()
+    assert records == []
+
+
+def test_events_are_logged_with_truncated_payloads(records, log_config):
+    log_config.payload_max_chars = 5
+    log_event("test.event", "Stored", key="k", result="abcdefgh")
+
+    [record] = records
+    assert record.record["message"] == "[test.event] Stored key=k result=abcde... (3 more chars)"
+    assert record.record["extra"]["event"] == "test.event"
+
+
+def test_events_are_sampled(records, log_config):
+    log_config.sample_rates = {"test.sampled": 0.0}
+    log_event("test.sampled", "dropped")
+    log_event("test.event", "kept")
+
+    assert [record.record["message"] for record in records] == ["[test.event] kept"]
+
+
+def test_full_payloads_are_logged_at_debug(log_config):
+    log_config.payload_max_chars = 5
+    log_config.full_payloads = True
+    records = capture("DEBUG")
+    log_event("test.event", "Stored", result="abcdefgh")
+
+    assert [record.record["message"] for record in records] == [
+        "[test.event] Stored result=abcde... (3 more chars)",
+        "[test.event] full payloads result='abcdefgh'",
+    ]
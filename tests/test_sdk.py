@@ -1,12 +1,30 @@
-import datetime
-from unittest.mock import MagicMock, patch
+import asyncio
+import gc
+import threading
+import time
+import warnings
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 import pantheon_sdk.agents.ray_entrypoint as ray_entrypoint
+from pantheon_sdk.agents.card.builder import get_agent_card
 from pantheon_sdk.agents.config import BasicAgentConfig
 from pantheon_sdk.agents.const import ExtraQuestions, Intents
-from pantheon_sdk.agents.models import AgentModel, InsightModel
+from pantheon_sdk.agents.deadline import DEADLINE_HEADER, DeadlineExceededError, deadline_scope, get_deadline
+from pantheon_sdk.agents.models import (
+    AgentModel,
+    ChatMessageModel,
+    InsightModel,
+    InteractionSummaryModel,
+    MemoryModel,
+    PlanningContextModel,
+    Workflow,
+)
+
+
+def _slow_read(*args, **kwargs):
+    time.sleep(0.5)
 
 
 class TestBaseAgent:
@@ -20,11 +38,12 @@ class TestBaseAgent:
             patch.object(ray_entrypoint, "light_rag_builder") as mock_lightrag_builder,
             patch.object(ray_entrypoint, "memory_builder") as mock_memory_builder,
         ):
-            self.mock_executor = MagicMock()
+            self.mock_executor = AsyncMock()
             self.mock_prompt = MagicMock()
             self.mock_ai_registry = MagicMock()
             self.mock_lightrag = MagicMock()
             self.mock_memory = MagicMock()
+            self.mock_memory.wait_timeout = 2.0
 
             mock_executor_builder.return_value = self.mock_executor
             mock_prompt_builder.return_value = self.mock_prompt
@@ -36,12 +55,75 @@ class TestBaseAgent:
             self.agent = ray_entrypoint.BaseAgent(config)
             yield
 
+    def test_get_past_interactions_semantic(self):
+        self.agent.config.past_interactions_mode = "semantic"
+        self.mock_memory.search_interactions.return_value = [
+            {"goal": "similar goal", "plan_summary": "plan: fetch (fetch-tool)", "outcome": "{}", "distance": 0.1}
+        ]
+        result = self.agent.get_past_interactions("some_goal")
+        assert result == [
+            InteractionSummaryModel(
+                goal="similar goal", plan_summary="plan: fetch (fetch-tool)", outcome="{}", distance=0.1
+            )
+        ]
+        self.mock_memory.search_interactions.assert_called_with(
+            "some_goal", scope="base-agent", top_k=5, max_distance=0.3, only_successful=True
+        )
+
     def test_get_past_interactions(self):
-        self.mock_memory.read.return_value = [{"foo": "bar"}]
+        self.agent.config.past_interactions_outcome_chars = 12
+        stored = MemoryModel(
+            goal="some_goal",
+            plan={"name": "plan", "steps": [{"name": "fetch", "tool": {"name": "fetch-tool"}}]},
+            result={"answer": "a long answer"},
+            context={"large": "x" * 1000},
+        )
+        # The shape mem0's `get_all` returns.
+        self.mock_memory.read.return_value = {
+            "results": [
+                {"id": "1", "memory": stored.model_dump_json(), "hash": "h", "run_id": "some_goal"},
+                {"id": "2", "memory": "User asked for the weather", "hash": "h", "run_id": "some_goal"},
+            ]
+        }
         result = self.agent.get_past_interactions("some_goal")
-        assert result == [{"foo": "bar"}]
+        assert result == [
+            InteractionSummaryModel(goal="some_goal", plan_summary="plan: fetch (fetch-tool)", outcome='{"answer": "'),
+            InteractionSummaryModel(goal="some_goal", plan_summary="unknown", outcome="User asked f"),
+        ]
         self.mock_memory.read.assert_called_with(key="some_goal")
 
+    def test_store_interaction_semantic(self):
+        self.agent.config.past_interactions_mode = "semantic"
+        self.agent.config.past_interactions_outcome_chars = 10
+        plan = {"name": "plan", "steps": [{"name": "fetch", "tool": {"name": "fetch-tool"}}]}
+        result = MagicMock()
+        result.model_dump_json.return_value = '{"answer": "a long answer"}'
+
+        self.agent.store_interaction("my_goal", plan, result)
+        self.mock_memory.writer.store_interaction_summary.assert_called_once_with(
+            "my_goal",
+            {"plan_summary": "plan: fetch (fetch-tool)", "outcome": '{"answer":', "success": True},
+            scope="base-agent",
+        )
+        self.mock_memory.writer.store.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_failed_interaction_is_stored(self):
+        self.agent.config.past_interactions_mode = "semantic"
+        self.agent.workflow_runner = MagicMock()
+        self.mock_executor.agenerate_plan.return_value = Workflow(name="plan", description="", steps=[])
+
+        with (
+            patch.object(self.agent, "gather_context", AsyncMock(return_value=PlanningContextModel())),
+            patch.object(self.agent, "run_workflow", AsyncMock(side_effect=RuntimeError("tool crashed"))),
+            pytest.raises(RuntimeError),
+        ):
+            await self.agent.handle("goal")
+
+        self.mock_memory.writer.store_interaction_summary.assert_called_once_with(
+            "goal", {"plan_summary": "plan", "outcome": "tool crashed", "success": False}, scope="base-agent"
+        )
+
     def test_store_interaction(self):
         goal = "my_goal"
         plan = {"step": 1}
@@ -51,8 +133,8 @@ class TestBaseAgent:
         context.model_dump.return_value = {"foo": "bar"}
 
         self.agent.store_interaction(goal, plan, result, context)
-        args, kwargs = self.mock_memory.store.call_args
-        stored = kwargs["interaction"] if "interaction" in kwargs else args[1]
+        (key, stored), _ = self.mock_memory.writer.store.call_args
+        assert key == goal
         assert stored["goal"] == goal
         assert stored["plan"] == plan
         assert stored["result"] == {"result": 123}
@@ -76,8 +158,7 @@ class TestBaseAgent:
         assert isinstance(agents[0], AgentModel)
         assert agents[0].name == "agent1"
 
-    @patch("pantheon_sdk.agents.ray_entrypoint.requests.get")
-    def test_get_most_relevant_tools(self, mock_requests_get):
+    def test_get_most_relevant_tools(self):
         agent_data = AgentModel(name="agent1", description="desc", version="1.0.0")
         self.mock_ai_registry.post.return_value = [
             {
@@ -87,22 +168,131 @@ class TestBaseAgent:
                 },
             }
         ]
-        mock_requests_get.return_value.json.return_value = {"skills": []}
-        mock_requests_get.return_value.raise_for_status = MagicMock()
+        card = get_agent_card()
+
+        with patch.object(self.agent.card_cache, "get_cards", return_value={agent_data.endpoint: card}) as get_cards:
+            tools = self.agent.get_most_relevant_tools("goal", [agent_data])
 
-        tools = self.agent.get_most_relevant_tools("goal", [agent_data])
+        get_cards.assert_called_once_with([agent_data.endpoint])
         assert isinstance(tools, list)
         assert any(t.name == "return-answer-tool" for t in tools)
+        handoff_tools = [t for t in tools if t.name == "handoff-tool"]
+        assert handoff_tools[0].function_name == "agent1_handle_goal"
 
-    def test_generate_plan(self):
-        self.mock_executor.generate_plan.return_value = "workflow"
-        plan = self.agent.generate_plan("goal", [], [], [], [])
-        self.mock_executor.generate_plan.assert_called_once()
+    def test_get_most_relevant_tools_unreachable_agent(self):
+        agent_data = AgentModel(name="agent1", description="desc", version="1.0.0")
+        self.mock_ai_registry.post.return_value = []
+
+        with patch.object(self.agent.card_cache, "get_cards", return_value={agent_data.endpoint: None}):
+            tools = self.agent.get_most_relevant_tools("goal", [agent_data])
+
+        assert [t.name for t in tools] == ["return-answer-tool"]
+
+    @pytest.mark.asyncio
+    async def test_gather_context(self):
+        self.agent.config.past_interactions_mode = "semantic"
+        self.mock_lightrag.post.return_value = {"texts": [{"text": "insight1"}]}
+        self.mock_memory.search_interactions.return_value = [{"goal": "goal", "plan_summary": "plan", "outcome": "{}"}]
+        self.mock_ai_registry.post.return_value = []
+
+        context = await self.agent.gather_context("goal")
+        assert context.insights[0].domain_knowledge == "insight1"
+        assert context.past_interactions == [InteractionSummaryModel(goal="goal", plan_summary="plan", outcome="{}")]
+        assert context.agents == []
+        assert any(t.name == "return-answer-tool" for t in context.tools)
+
+    @pytest.mark.asyncio
+    async def test_gather_context_partial_results(self):
+        self.agent.config.past_interactions_mode = "semantic"
+        self.agent.config.context_past_interactions_timeout = 0.05
+        self.mock_lightrag.post.side_effect = Exception("LightRAG is down")
+        self.mock_memory.search_interactions.side_effect = _slow_read
+        self.mock_ai_registry.post.return_value = [{"name": "agent1", "description": "desc", "version": "1.0.0"}]
+
+        with patch.object(self.agent, "get_most_relevant_tools", side_effect=Exception("boom")):
+            context = await self.agent.gather_context("goal")
+
+        assert context.insights == []
+        assert context.past_interactions == []
+        assert context.agents[0].name == "agent1"
+        assert [t.name for t in context.tools] == ["return-answer-tool"]
+
+    @pytest.mark.asyncio
+    async def test_generate_plan(self):
+        self.mock_executor.agenerate_plan.return_value = "workflow"
+        plan = await self.agent.generate_plan("goal", [], [], [], [])
+        self.mock_executor.agenerate_plan.assert_awaited_once()
         assert plan == "workflow"
 
-    def test_chat_chitchat(self):
-        self.mock_executor.classify_intent.return_value = Intents.CHIT_CHAT
-        self.mock_executor.chat.return_value = "Hello!"
+    @pytest.mark.asyncio
+    async def test_generate_plan_uses_plan_cache(self):
+        workflow = Workflow(name="answer", description="", steps=[])
+        self.mock_executor.agenerate_plan.return_value = workflow
+
+        first = await self.agent.generate_plan("goal", [], [], [], [])
+        second = await self.agent.generate_plan("goal", [], [], [], [])
+
+        self.mock_executor.agenerate_plan.assert_awaited_once()
+        assert first is workflow
+        assert second.name == workflow.name
+        assert second.id != workflow.id
+
+    @pytest.mark.asyncio
+    async def test_handle_coalesces_identical_requests(self):
+        calls = []
+
+        async def run_workflow(plan, context):
+            calls.append(plan)
+            await asyncio.sleep(0.05)
+            return {"done": len(calls)}
+
+        self.agent.run_workflow = run_workflow
+        self.agent.store_interaction = MagicMock()
+
+        shared = await asyncio.gather(self.agent.handle("goal", {"plan": 1}), self.agent.handle("goal", {"plan": 1}))
+        assert shared == [{"done": 1}, {"done": 1}]
+
+        separate = await asyncio.gather(
+            self.agent.handle("goal", {"plan": 1}), self.agent.handle("goal", {"plan": 1}, coalesce=False)
+        )
+        assert separate == [{"done": 3}, {"done": 3}]
+        assert len(calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_handle_batch(self):
+        async def abatch_generate_plan(prompt, inputs, max_concurrency):
+            return [
+                ValueError("no plan")
+                if kwargs["goal"] == "bad"
+                else Workflow(name=kwargs["goal"], description="", steps=[])
+                for kwargs in inputs
+            ]
+
+        self.agent.workflow_runner = MagicMock()
+        self.agent.gather_context = AsyncMock(return_value=PlanningContextModel())
+        self.agent.run_workflow = AsyncMock(side_effect=lambda plan, context: {"done": plan.name})
+        self.agent.store_interaction = MagicMock()
+        self.mock_executor.abatch_generate_plan = AsyncMock(side_effect=abatch_generate_plan)
+
+        results = {item.goal: item async for item in self.agent.handle_batch(["a", "b", "a", "bad"])}
+
+        assert results["a"].positions == [0, 2]
+        assert results["a"].result == {"done": "a"}
+        assert results["b"].result == {"done": "b"}
+        assert results["bad"].error == "no plan"
+        assert self.agent.gather_context.await_count == 3
+        self.mock_executor.abatch_generate_plan.assert_awaited_once()
+        assert self.agent.run_workflow.await_count == 2
+
+        # Plans are cached like single-goal plans.
+        [item] = [item async for item in self.agent.handle_batch(["a"])]
+        assert item.result == {"done": "a"}
+        self.mock_executor.abatch_generate_plan.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_chat_chitchat(self):
+        self.mock_executor.aclassify_intent.return_value = Intents.CHIT_CHAT
+        self.mock_executor.achat.return_value = "Hello!"
         self.mock_prompt.generate_intent_classifier_prompt.return_value = "intent_prompt"
         self.mock_prompt.generate_chat_prompt.return_value = "chat_prompt"
 
@@ -110,83 +300,232 @@ class TestBaseAgent:
         self.mock_memory.read.return_value = {"results": []}
         self.mock_memory.store = MagicMock()
 
-        resp = self.agent.chat("Hi!", None)
+        resp = await self.agent.chat("Hi!", None)
         assert resp.response_text == "Hello!"
         assert resp.action == Intents.CHIT_CHAT
 
-    def test_chat_change_settings(self):
-        self.mock_executor.classify_intent.return_value = Intents.CHANGE_SETTINGS
+    @pytest.mark.asyncio
+    async def test_chat_change_settings(self):
+        self.mock_executor.aclassify_intent.return_value = Intents.CHANGE_SETTINGS
         self.mock_prompt.generate_intent_classifier_prompt.return_value = "intent_prompt"
         self.mock_memory.read.return_value = {"results": []}
         self.mock_memory.store = MagicMock()
 
-        resp = self.agent.chat("Change settings", None)
+        resp = await self.agent.chat("Change settings", None)
         assert resp.response_text == ExtraQuestions.WHICH_SETTINGS
         assert resp.action == Intents.CHANGE_SETTINGS
 
-    def test_chat_add_knowledge(self):
-        self.mock_executor.classify_intent.return_value = Intents.ADD_KNOWLEDGE
+    @pytest.mark.asyncio
+    async def test_chat_add_knowledge(self):
+        self.mock_executor.aclassify_intent.return_value = Intents.ADD_KNOWLEDGE
         self.mock_prompt.generate_intent_classifier_prompt.return_value = "intent_prompt"
         self.mock_memory.read.return_value = {"results": []}
         self.mock_memory.store = MagicMock()
 
-        resp = self.agent.chat("Add this info", None)
+        resp = await self.agent.chat("Add this info", None)
         assert resp.response_text == ExtraQuestions.WHAT_INFO
         assert resp.action == Intents.ADD_KNOWLEDGE
 
-    def test_chat_action_add_knowledge_success(self):
+    @pytest.mark.asyncio
+    async def test_chat_action_add_knowledge_success(self):
         self.mock_memory.read.return_value = {"results": []}
         self.mock_memory.store = MagicMock()
         self.mock_lightrag.post.return_value = {"status": "success"}
 
-        resp = self.agent.chat("Some info", Intents.ADD_KNOWLEDGE)
+        resp = await self.agent.chat("Some info", Intents.ADD_KNOWLEDGE)
         assert resp.response_text == "Information added to the knowledge base."
         assert resp.action is None
 
-    def test_chat_action_add_knowledge_fail(self):
+    @pytest.mark.asyncio
+    async def test_chat_action_add_knowledge_fail(self):
         self.mock_memory.read.return_value = {"results": []}
         self.mock_memory.store = MagicMock()
         self.mock_lightrag.post.return_value = {"status": "error"}
 
-        resp = self.agent.chat("Some info", Intents.ADD_KNOWLEDGE)
+        resp = await self.agent.chat("Some info", Intents.ADD_KNOWLEDGE)
         assert "failed" in resp.response_text.lower()
 
-    def test_chat_action_change_settings(self):
+    @pytest.mark.asyncio
+    async def test_chat_action_change_settings(self):
         self.mock_memory.read.return_value = {"results": []}
         self.mock_memory.store = MagicMock()
-        self.mock_executor.reconfigure.return_value = {"foo": "bar"}
+        self.mock_executor.areconfigure.return_value = {"foo": "bar"}
         self.mock_prompt.generate_reconfigure_prompt.return_value = "prompt"
         self.mock_prompt.generate_plan_prompt.return_value = "prompt"
         self.mock_prompt.generate_chat_prompt.return_value = "prompt"
         self.mock_prompt.generate_intent_classifier_prompt.return_value = "prompt"
 
-        resp = self.agent.chat("Update config", Intents.CHANGE_SETTINGS)
+        resp = await self.agent.chat("Update config", Intents.CHANGE_SETTINGS)
         assert "updated" in resp.response_text.lower() or "sorry" in resp.response_text.lower()
 
     def test_get_chat_context(self):
-        self.mock_memory.read.return_value = {"results": []}
+        self.mock_memory.read_tail.return_value = []
         res = self.agent.get_chat_context("uuid1")
         assert isinstance(res, list)
+        self.mock_memory.read_tail.assert_called_once_with("uuid1", self.agent.config.chat_history_window)
 
     def test_store_chat_context(self):
         uuid_ = "uuid1"
-        messages = [{"memory": "foo", "created_at": datetime.datetime.now()}]
-        self.mock_memory.store = MagicMock()
+        messages = [ChatMessageModel(role="user", content="foo", index=3)]
         self.agent.store_chat_context(uuid_, messages)
-        self.mock_memory.store.assert_called_once()
+        [(session_id, stored)] = [call.args for call in self.mock_memory.writer.append_messages.call_args_list]
+        assert session_id == uuid_
+        assert [(m["role"], m["content"]) for m in stored] == [("user", "foo")]
+        assert "index" not in stored[0]
+
+    def test_store_chat_context_updates_cached_session(self):
+        self.agent.chat_sessions.load("s1", [{"role": "user", "content": "hi", "index": 0}], limit=50)
+
+        self.agent.store_chat_context("s1", [{"role": "assistant", "content": "hello"}])
+        # Cached sessions are served before the write is applied.
+        assert [m["index"] for m in self.agent.get_chat_context("s1")] == [0, 1]
+
+        on_stored = self.mock_memory.writer.append_messages.call_args.kwargs["on_done"]
+        on_stored(1)
+        assert "s1" in self.agent.chat_sessions
+        # Another replica appended to the session in between.
+        on_stored(5)
+        assert "s1" not in self.agent.chat_sessions
+
+    def test_get_chat_context_waits_for_queued_messages(self):
+        self.mock_memory.read_tail.return_value = []
+        self.agent.get_chat_context("s1")
+        self.mock_memory.writer.wait.assert_called_once_with("s1", timeout=2.0)
+        assert "s1" in self.agent.chat_sessions
+
+    def test_get_chat_context_reads_the_log_when_queued_messages_are_late(self):
+        self.mock_memory.writer.wait.return_value = False
+        self.mock_memory.read_tail.return_value = [{"role": "user", "content": "hi", "index": 0}]
+
+        assert self.agent.get_chat_context("s1") == [{"role": "user", "content": "hi", "index": 0}]
+        assert "s1" not in self.agent.chat_sessions
 
-    def test_run_workflow(self):
-        self.agent.workflow_runner = MagicMock()
+    @pytest.mark.asyncio
+    async def test_chat_appends_only_new_messages(self):
+        self.mock_executor.achat.return_value = "Hello again!"
+        self.mock_memory.read_tail.return_value = [
+            {"role": "user", "content": "Hi!", "timestamp": None, "index": 0},
+            {"role": "assistant", "content": "Hello!", "timestamp": None, "index": 1},
+        ]
+
+        await self.agent.chat("How are you?", Intents.CHIT_CHAT, session_uuid="s1")
+
+        appended = [call.args[1] for call in self.mock_memory.writer.append_messages.call_args_list]
+        assert [[(m["role"], m["content"]) for m in batch] for batch in appended] == [
+            [("user", "How are you?")],
+            [("assistant", "Hello again!")],
+        ]
+        _, kwargs = self.mock_executor.achat.call_args
+        assert kwargs["context"] == "Hi!\nHello!\nHow are you?"
+
+    @pytest.mark.asyncio
+    async def test_run_workflow(self):
+        self.agent.workflow_runner = AsyncMock()
         wf = MagicMock()
         ctx = MagicMock()
-        self.agent.run_workflow(wf, ctx)
-        self.agent.workflow_runner.run.assert_called_once_with(wf, ctx)
+        await self.agent.run_workflow(wf, ctx)
+        self.agent.workflow_runner.run.assert_awaited_once_with(wf, ctx)
+
+    @pytest.mark.asyncio
+    async def test_handle_stops_at_request_timeout(self):
+        async def slow_workflow(plan, context):
+            await asyncio.sleep(1)
+
+        self.agent.config.request_timeout = 0.05
+        self.agent.run_workflow = slow_workflow
+        with pytest.raises(DeadlineExceededError):
+            await self.agent.handle("goal", {"plan": 1})
+
+    @pytest.mark.asyncio
+    async def test_handle_fails_fast_after_the_deadline(self):
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            with deadline_scope(time.time() - 1), pytest.raises(DeadlineExceededError):
+                await self.agent.handle("goal", {"plan": 1})
+            gc.collect()
+
+        # No request coroutine was created and left unawaited.
+        assert [w for w in caught if issubclass(w.category, RuntimeWarning)] == []
+
+    @pytest.mark.asyncio
+    async def test_handle_propagates_deadline(self):
+        seen = []
+
+        async def run_workflow(plan, context):
+            seen.append(get_deadline())
+
+        self.agent.config.request_timeout = 60
+        self.agent.run_workflow = run_workflow
+        self.agent.store_interaction = MagicMock()
+        deadline = time.time() + 5
+        with deadline_scope(deadline):
+            await self.agent.handle("goal", {"plan": 1}, coalesce=False)
+        assert seen == [deadline]
+
+    @pytest.mark.asyncio
+    async def test_coalesced_requests_keep_their_own_deadlines(self):
+        seen = []
+
+        async def run_workflow(plan, context):
+            seen.append(get_deadline())
+            await asyncio.sleep(0.1)
+            return {"done": True}
+
+        self.agent.run_workflow = run_workflow
+        self.agent.store_interaction = MagicMock()
+
+        async def impatient():
+            with deadline_scope(time.time() + 0.02):
+                return await self.agent.handle("goal", {"plan": 1})
+
+        # The request with the short deadline starts the shared computation.
+        impatient_request = asyncio.create_task(impatient())
+        await asyncio.sleep(0.01)
+        assert await self.agent.handle("goal", {"plan": 1}) == {"done": True}
+        with pytest.raises(DeadlineExceededError):
+            await impatient_request
+        assert seen == [None]
+
+    @pytest.mark.asyncio
+    async def test_prefetch_tools_runs_in_a_worker_thread(self):
+        threads = []
+
+        def prefetch(tools):
+            threads.append(threading.current_thread())
+
+        self.agent.workflow_runner = MagicMock()
+        self.agent.workflow_runner.prefetch_tools.side_effect = prefetch
+
+        self.agent.prefetch_tools(["tool"])
+        await asyncio.gather(*self.agent._prefetches)
+
+        assert threads != [threading.main_thread()]
+        self.agent.workflow_runner.prefetch_tools.assert_called_once_with(["tool"])
+        assert not self.agent._prefetches
 
     @pytest.mark.asyncio
     async def test_handoff(self):
         # Patch requests.post in handoff
-        with patch("pantheon_sdk.agents.ray_entrypoint.requests.post") as mock_post:
+        threads = []
+
+        def post(*args, **kwargs):
+            threads.append(threading.current_thread())
+            return mock_post.return_value
+
+        with patch("pantheon_sdk.agents.ray_entrypoint.requests.post", side_effect=post) as mock_post:
             mock_post.return_value.json.return_value = {"result": "ok"}
             resp = await self.agent.handoff("http://some-endpoint", "goal", {"plan": 1})
             assert resp == {"result": "ok"}
             mock_post.assert_called_once()
+        # The blocking request ran in a worker thread, not on the event loop.
+        assert threads != [threading.main_thread()]
+
+    @pytest.mark.asyncio
+    async def test_handoff_forwards_deadline(self):
+        with patch("pantheon_sdk.agents.ray_entrypoint.requests.post") as mock_post:
+            deadline = time.time() + 5
+            with deadline_scope(deadline):
+                await self.agent.handoff("http://some-endpoint", "goal", {"plan": 1})
+            _, kwargs = mock_post.call_args
+            assert kwargs["headers"] == {DEADLINE_HEADER: repr(deadline)}
+            assert 0 < kwargs["timeout"] <= 5
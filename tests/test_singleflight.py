@@ -0,0 +1,69 @@
+import asyncio
+
+import pytest
+
+from pantheon_sdk.agents.metrics import get_counter
+from pantheon_sdk.agents.singleflight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_computation():
+    group = SingleFlight("test-share")
+    calls = 0
+
+    async def compute():
+        nonlocal calls
+        calls += 1
+        call = calls
+        await asyncio.sleep(0.05)
+        return call
+
+    results = await asyncio.gather(*[group.do("key", compute) for _ in range(5)], group.do("other", compute))
+
+    assert results == [1, 1, 1, 1, 1, 2]
+    assert len(group) == 0
+    assert get_counter("pantheon_singleflight_coalesced").value({"group": "test-share"}) == 4
+    assert get_counter("pantheon_singleflight_calls").value({"group": "test-share"}) == 2
+
+    # Finished computations are not reused.
+    assert await group.do("key", compute) == 3
+
+
+@pytest.mark.asyncio
+async def test_errors_are_shared():
+    group = SingleFlight("test-errors")
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(group.do("key", fail), group.do("key", fail), return_exceptions=True)
+
+    assert [str(result) for result in results] == ["boom", "boom"]
+
+
+@pytest.mark.asyncio
+async def test_computation_is_cancelled_with_its_last_waiter():
+    group = SingleFlight("test-cancel")
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def compute():
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    first = asyncio.create_task(group.do("key", compute))
+    second = asyncio.create_task(group.do("key", compute))
+    await started.wait()
+
+    first.cancel()
+    await asyncio.sleep(0.01)
+    assert not cancelled.is_set()
+
+    second.cancel()
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
+    assert len(group) == 0
@@ -0,0 +1,45 @@
+from unittest.mock import patch
+
+from pantheon_sdk.agents import utils
+from pantheon_sdk.agents.abc import AbstractAgentParamsModel
+from pantheon_sdk.agents.cache import TTLCache
+from pantheon_sdk.agents.utils import create_pydantic_model_from_json_schema, hash_payload
+
+SCHEMA = {
+    "properties": {
+        "goal": {"type": "string", "description": "The goal to handle"},
+        "tags": {"type": "array", "items": {"type": "string"}},
+    },
+    "required": ["goal"],
+}
+
+
+def test_hash_payload_is_order_independent():
+    assert hash_payload({"a": 1, "b": [1, 2]}) == hash_payload({"b": [1, 2], "a": 1})
+    assert hash_payload({"a": 1}) != hash_payload({"a": 2})
+
+
+def test_identical_schemas_reuse_model():
+    first = create_pydantic_model_from_json_schema("DynamicParamsModel", SCHEMA, AbstractAgentParamsModel)
+    second = create_pydantic_model_from_json_schema("DynamicParamsModel", dict(SCHEMA), AbstractAgentParamsModel)
+
+    assert first is second
+    assert issubclass(first, AbstractAgentParamsModel)
+    assert first(goal="g", tags=["a"]).goal == "g"
+
+
+def test_different_schemas_build_different_models():
+    other = {"properties": {"goal": {"type": "integer"}}, "required": ["goal"]}
+
+    first = create_pydantic_model_from_json_schema("DynamicParamsModel", SCHEMA)
+    second = create_pydantic_model_from_json_schema("DynamicParamsModel", other)
+
+    assert first is not second
+
+
+def test_model_registry_is_bounded():
+    with patch.object(utils, "_model_registry", TTLCache(maxsize=2)) as registry:
+        for i in range(5):
+            create_pydantic_model_from_json_schema(f"Model{i}", SCHEMA)
+
+        assert len(registry) == 2